@@ -8,10 +8,17 @@ from pathlib import Path
 project_root = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(project_root))
 
-from src.dashboard.app import MentalHealthDashboard
+# The Dash app (pandas, plotly, BigQuery SDK, ...) is built on the first
+# request rather than at import time to keep cold starts short
+_server = None
 
-# Build Dash app but DO NOT run the server here
-_dash = MentalHealthDashboard().app
 
 # Vercel expects a WSGI app named `app`
-app = _dash.server
+def app(environ, start_response):
+    global _server
+    if _server is None:
+        from src.dashboard.app import MentalHealthDashboard
+        
+        # Build Dash app but DO NOT run the server here
+        _server = MentalHealthDashboard().app.server
+    return _server(environ, start_response)
@@ -1,5 +1,6 @@
 """Run the complete data pipeline."""
 
+import os
 import sys
 from pathlib import Path
 
@@ -43,8 +44,12 @@ def main():
     
     # Step 2: Process Sentiment
     log.info("\n[2/5] Processing Sentiment Analysis...")
+    import torch
+    
+    # On CPU, shard batches across processes; a single GPU is already saturated
+    sentiment_workers = 1 if torch.cuda.is_available() else (os.cpu_count() or 1)
     sentiment_processor = SentimentProcessor()
-    sentiment_count = sentiment_processor.process_all(max_batches=5)
+    sentiment_count = sentiment_processor.process_all(max_batches=5, workers=sentiment_workers)
     log.info(f"Processed {sentiment_count} sentiment records")
     
     # Step 3: Compute Features
@@ -68,7 +73,7 @@ def main():
     
     # Step 5: Check and Send Alerts
     log.info("\n[5/5] Checking Alert Conditions...")
-    alert_manager = AlertManager()
+    alert_manager = AlertManager(loader=loader)
     alert_count = alert_manager.check_and_send_alerts()
     log.info(f"Sent {alert_count} alerts")
     
@@ -1,28 +1,123 @@
 """Alert management system for burnout risks."""
 
+import operator
+import re
+import secrets
 import smtplib
+import string
+import time
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import List, Dict, Any
+from typing import TYPE_CHECKING, List, Dict, Any, Callable, Optional, Tuple
 from datetime import datetime, timedelta
-import pandas as pd
 from src.etl.loaders.database_loader import get_loader
 from src.utils.config_loader import get_config
 from src.utils.logger import log
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Rule condition grammar: "<field> <op> <threshold>", e.g. "burnout_risk >= 0.9"
+_CONDITION_PATTERN = re.compile(r'^\s*(\w+)\s*(>=|<=|==|>|<)\s*(-?[\d.]+)\s*$')
+
+_RULE_OPERATORS: Dict[str, Callable] = {
+    '>': operator.gt,
+    '>=': operator.ge,
+    '<': operator.lt,
+    '<=': operator.le,
+    '==': operator.eq,
+}
+
+# Rule fields that can be evaluated directly against prediction columns;
+# avg_sentiment / sentiment_change would need sentiment data
+_RULE_FIELDS = {
+    'burnout_risk': 'burnout_risk_score',
+}
+
+# Concurrent email/Slack sends per batch of fired alerts
+_NOTIFY_WORKERS = 8
+
+# Email body is the same for every alert; only the placeholders change
+_EMAIL_BODY = string.Template("""
+        Mental Health Alert
+        
+        Alert Type: $rule_name
+        Severity: $severity
+        
+        User ID: $user_id_hash
+        Burnout Risk Score: $risk_score
+        Risk Level: $risk_level
+        
+        This alert was triggered based on the following condition:
+        $condition
+        
+        Please review the dashboard for more details and consider reaching out to provide support.
+        
+        ---
+        Mental Health Dashboard
+        Generated: $generated
+        """)
+
 
 class AlertManager:
     """Manage alerts for burnout risks."""
     
-    def __init__(self):
-        """Initialize alert manager."""
+    def __init__(self, loader=None):
+        """Initialize alert manager.
+        
+        Args:
+            loader: Database loader to use (defaults to the shared loader)
+        """
         self.config = get_config()
-        self.loader = get_loader()
+        self.loader = loader or get_loader()
         
         self.alert_config = self.config.get_alert_config()
         self.enabled = self.alert_config.get('enabled', True)
         self.channels = self.alert_config.get('channels', {})
         self.rules = self.alert_config.get('rules', [])
+        self._rules_by_name = {r['name']: r for r in self.rules}
+        self._cooldown_hours = {r['name']: r.get('cooldown_hours', 24) for r in self.rules}
+        self._compiled_rules = self._compile_rules(self.rules)
+        self._cooldown_cache: Dict[str, Dict[str, Any]] = {}
+        
+        # Short-lived cache of the latest predictions for frequent cron runs
+        self._pred_cache_ttl = self.alert_config.get('predictions_cache_ttl', 300)
+        self._pred_cache: Optional[Tuple[float, 'pd.DataFrame']] = None
+        
+        self._email_template = _EMAIL_BODY
+        self._http = None
+        if self.channels.get('slack', {}).get('enabled', False):
+            import requests
+            self._http = requests.Session()
+    
+    def _compile_rules(
+        self,
+        rules: List[Dict[str, Any]]
+    ) -> Dict[str, Tuple[str, Callable, float]]:
+        """Parse rule conditions once into (column, operator, threshold).
+        
+        Args:
+            rules: Alert rules from config
+            
+        Returns:
+            Mapping of rule name to compiled condition; rules whose condition
+            cannot be evaluated against predictions are left out
+        """
+        compiled = {}
+        for rule in rules:
+            match = _CONDITION_PATTERN.match(rule.get('condition', ''))
+            if not match:
+                log.warning(f"Unsupported alert condition for rule {rule['name']}")
+                continue
+            
+            field, op, threshold = match.groups()
+            if field not in _RULE_FIELDS:
+                continue
+            
+            compiled[rule['name']] = (_RULE_FIELDS[field], _RULE_OPERATORS[op], float(threshold))
+        return compiled
     
     def check_and_send_alerts(self) -> int:
         """Check for alert conditions and send alerts.
@@ -43,62 +138,115 @@ class AlertManager:
             log.info("No predictions available for alerting")
             return 0
         
-        alerts_sent = 0
+        alerts_to_log = []
+        pending = []
+        self._cooldown_cache = {}
+        
+        for rule in self.rules:
+            compiled = self._compiled_rules.get(rule['name'])
+            if compiled is None:
+                continue
+            
+            column, op, threshold = compiled
+            try:
+                mask = op(predictions[column].to_numpy(dtype=float), threshold)
+            except Exception as e:
+                log.error(f"Error evaluating rule condition: {str(e)}")
+                continue
+            
+            if not mask.any():
+                continue
+            
+            # One lookup per rule for every user still in cooldown
+            cooldowns = self._load_cooldowns(rule['name'])
+            if cooldowns is None:
+                continue
+            self._cooldown_cache[rule['name']] = cooldowns
+            
+            fired = predictions.loc[mask, ['user_id_hash', 'burnout_risk_score', 'risk_level']]
+            for user_id_hash, score, risk_level in zip(
+                fired['user_id_hash'].to_numpy(),
+                fired['burnout_risk_score'].to_numpy(),
+                fired['risk_level'].to_numpy()
+            ):
+                # Check cooldown
+                if not self._check_cooldown(user_id_hash, rule['name']):
+                    continue
+                
+                prediction = {
+                    'user_id_hash': user_id_hash,
+                    'burnout_risk_score': score,
+                    'risk_level': risk_level
+                }
+                alert_data = self._send_alert(prediction, rule)
+                self._cooldown_cache[rule['name']][user_id_hash] = alert_data['alert_timestamp']
+                alerts_to_log.append(alert_data)
+                pending.append((prediction, rule, alert_data))
+        
+        self._dispatch_notifications(pending)
         
-        for _, prediction in predictions.iterrows():
-            # Check each rule
-            for rule in self.rules:
-                if self._check_rule(prediction, rule):
-                    # Check cooldown
-                    if self._check_cooldown(prediction['user_id_hash'], rule['name']):
-                        self._send_alert(prediction, rule)
-                        alerts_sent += 1
+        # Log all alerts in a single write
+        if alerts_to_log:
+            self.loader.load_alert_history(alerts_to_log)
         
+        alerts_sent = len(alerts_to_log)
         log.info(f"Sent {alerts_sent} alerts")
         return alerts_sent
     
-    def _get_latest_predictions(self) -> pd.DataFrame:
+    def _get_latest_predictions(self) -> 'pd.DataFrame':
         """Get latest predictions from BigQuery.
         
         Returns:
             DataFrame of predictions
         """
+        if self._pred_cache is not None:
+            cached_at, cached = self._pred_cache
+            if time.monotonic() - cached_at < self._pred_cache_ttl:
+                return cached
+        
         predictions_table = 'burnout_predictions'
         # Portable approach: get the most recent prediction_date and return those rows
         sql = (
-            f"SELECT * FROM {predictions_table} "
-            "WHERE prediction_date = (SELECT MAX(prediction_date) FROM burnout_predictions)"
+            "SELECT user_id_hash, burnout_risk_score, risk_level, prediction_date "
+            f"FROM {predictions_table} "
+            f"WHERE prediction_date = (SELECT MAX(prediction_date) FROM {predictions_table})"
         )
-        return self.loader.query(sql)
+        # Bulk fetch: BigQuery streams this through the Storage Read API
+        query = getattr(self.loader, 'query_arrow', self.loader.query)
+        predictions = query(sql)
+        self._pred_cache = (time.monotonic(), predictions)
+        return predictions
     
-    def _check_rule(self, prediction: pd.Series, rule: Dict[str, Any]) -> bool:
-        """Check if prediction meets alert rule condition.
+    def _load_cooldowns(self, rule_name: str) -> Optional[Dict[str, Any]]:
+        """Fetch the last alert time of every user still in cooldown for a rule.
         
         Args:
-            prediction: Prediction record
-            rule: Alert rule
+            rule_name: Name of alert rule
             
         Returns:
-            True if condition is met
+            Mapping of user ID to last alert timestamp, or None if the alert
+            history could not be read and the rule should be skipped this run
         """
-        condition = rule.get('condition', '')
+        alerts_table = 'alert_history'
+        if rule_name not in self._rules_by_name:
+            return {}
+        
+        cooldown_hours = self._cooldown_hours[rule_name]
+        # Alert timestamps are stored as UTC ISO8601 strings
+        cutoff = (datetime.utcnow() - timedelta(hours=cooldown_hours)).isoformat()
+        sql = (
+            f"SELECT user_id_hash, MAX(alert_timestamp) as last_alert FROM {alerts_table} "
+            "WHERE alert_type = ? AND alert_timestamp > ? "
+            "GROUP BY user_id_hash"
+        )
         
         try:
-            # Simple condition evaluation
-            if 'burnout_risk' in condition:
-                burnout_risk = prediction.get('burnout_risk_score', 0)
-                return eval(condition.replace('burnout_risk', str(burnout_risk)))
-            elif 'avg_sentiment' in condition:
-                # Would need to fetch sentiment data
-                return False
-            elif 'sentiment_change' in condition:
-                # Would need to calculate change
-                return False
+            result = self.loader.query(sql, params=(rule_name, cutoff))
+            return dict(zip(result['user_id_hash'], result['last_alert']))
         except Exception as e:
-            log.error(f"Error evaluating rule condition: {str(e)}")
-            return False
-        
-        return False
+            # Without the history every user would look out of cooldown
+            log.error(f"Error loading cooldowns for rule {rule_name}, skipping it: {str(e)}")
+            return None
     
     def _check_cooldown(self, user_id_hash: str, rule_name: str) -> bool:
         """Check if alert is in cooldown period.
@@ -110,33 +258,19 @@ class AlertManager:
         Returns:
             True if not in cooldown
         """
-        alerts_table = 'alert_history'
-        # Get rule cooldown
-        rule = next((r for r in self.rules if r['name'] == rule_name), None)
-        if not rule:
-            return True
-        
-        cooldown_hours = rule.get('cooldown_hours', 24)
-        # SQLite-compatible time window using ISO8601 timestamps
-        sql = (
-            f"SELECT MAX(alert_timestamp) as last_alert FROM {alerts_table} "
-            f"WHERE user_id_hash = '{user_id_hash}' "
-            f"AND alert_type = '{rule_name}' "
-            f"AND alert_timestamp > datetime('now', '-{cooldown_hours} hours')"
-        )
-
-        try:
-            result = self.loader.query(sql)
-            return result.empty or pd.isna(result.iloc[0]['last_alert'])
-        except:
-            return True
+        return user_id_hash not in self._cooldown_cache.get(rule_name, {})
     
-    def _send_alert(self, prediction: pd.Series, rule: Dict[str, Any]):
-        """Send alert through configured channels.
+    def _send_alert(self, prediction: Dict[str, Any], rule: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the alert record and emit the console alert.
+        
+        Email/Slack delivery happens in ``_dispatch_notifications``.
         
         Args:
             prediction: Prediction record
             rule: Alert rule that triggered
+            
+        Returns:
+            Alert history record, to be logged by the caller
         """
         alert_data = {
             'alert_id': self._generate_alert_id(),
@@ -161,34 +295,61 @@ class AlertManager:
             )
             alert_data['channels_sent'].append('console')
 
-        # Send through email (optional)
-        if self.channels.get('email', {}).get('enabled', False):
-            try:
-                self._send_email_alert(prediction, rule)
-                alert_data['channels_sent'].append('email')
-            except Exception as e:
-                log.error(f"Error sending email alert: {str(e)}")
-                alert_data['status'] = 'failed'
+        log.info(f"Alert sent for user {prediction.get('user_id_hash')}: {rule['name']}")
+        return alert_data
+    
+    def _dispatch_notifications(
+        self,
+        pending: List[Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]]
+    ):
+        """Send email/Slack notifications for fired alerts concurrently.
         
-        # Send through Slack
-        if self.channels.get('slack', {}).get('enabled', False):
-            try:
-                self._send_slack_alert(prediction, rule)
-                alert_data['channels_sent'].append('slack')
-            except Exception as e:
-                log.error(f"Error sending Slack alert: {str(e)}")
+        Updates each alert record's ``channels_sent`` and ``status`` in place.
         
-        # Log alert to BigQuery
-        self.loader.load_alert_history([alert_data])
+        Args:
+            pending: (prediction, rule, alert record) for every fired alert
+        """
+        email_enabled = self.channels.get('email', {}).get('enabled', False)
+        slack_enabled = self.channels.get('slack', {}).get('enabled', False)
         
-        log.info(f"Alert sent for user {prediction.get('user_id_hash')}: {rule['name']}")
+        if not (email_enabled or slack_enabled) or not pending:
+            return
+        
+        # Email/Slack calls are network-bound; the pool lives only as long
+        # as this batch, so no worker threads outlast the run
+        with ThreadPoolExecutor(max_workers=_NOTIFY_WORKERS) as pool:
+            futures = {}
+            if email_enabled:
+                # One task sends every email over a single SMTP session
+                futures[pool.submit(self._send_email_batch, pending)] = ('email', None)
+            if slack_enabled:
+                for prediction, rule, alert_data in pending:
+                    futures[pool.submit(self._send_slack_alert, prediction, rule)] = ('slack', alert_data)
+        
+        # Leaving the pool waited for every task, so each result is ready
+        for future in futures:
+            channel, alert_data = futures[future]
+            if channel == 'email':
+                for email_alert, error in future.result():
+                    if error is None:
+                        email_alert['channels_sent'].append('email')
+                    else:
+                        log.error(f"Error sending email alert: {str(error)}")
+                        email_alert['status'] = 'failed'
+                continue
+            
+            try:
+                future.result()
+                alert_data['channels_sent'].append(channel)
+            except Exception as e:
+                log.error(f"Error sending {channel} alert: {str(e)}")
     
-    def _send_email_alert(self, prediction: pd.Series, rule: Dict[str, Any]):
-        """Send email alert.
+    @contextmanager
+    def _smtp_session(self):
+        """Open one authenticated SMTP connection for a batch of emails.
         
-        Args:
-            prediction: Prediction record
-            rule: Alert rule
+        Yields:
+            Logged-in SMTP connection, or None if credentials are missing
         """
         email_config = self.channels.get('email', {})
         
@@ -199,51 +360,89 @@ class AlertManager:
         
         if not sender_email or not sender_password:
             log.warning("Email credentials not configured")
+            yield None
             return
         
+        with smtplib.SMTP(smtp_server, smtp_port) as server:
+            server.starttls()
+            server.login(sender_email, sender_password)
+            yield server
+    
+    def _send_email_batch(
+        self,
+        pending: List[Tuple[Dict[str, Any], Dict[str, Any], Dict[str, Any]]]
+    ) -> List[Tuple[Dict[str, Any], Optional[Exception]]]:
+        """Send email alerts for all fired alerts over one SMTP session.
+        
+        Args:
+            pending: (prediction, rule, alert record) for every fired alert
+            
+        Returns:
+            (alert record, error or None) for every alert
+        """
+        results = []
+        try:
+            with self._smtp_session() as server:
+                for prediction, rule, alert_data in pending:
+                    try:
+                        self._send_email_alert(server, prediction, rule)
+                        results.append((alert_data, None))
+                    except Exception as e:
+                        results.append((alert_data, e))
+        except Exception as e:
+            # Connection or login failed; nothing after it was sent
+            sent = {id(alert_data) for alert_data, _ in results}
+            results.extend(
+                (alert_data, e) for _, _, alert_data in pending
+                if id(alert_data) not in sent
+            )
+        return results
+    
+    def _send_email_alert(
+        self,
+        server: Optional[smtplib.SMTP],
+        prediction: Dict[str, Any],
+        rule: Dict[str, Any]
+    ):
+        """Send email alert.
+        
+        Args:
+            server: Open SMTP session from ``_smtp_session``
+            prediction: Prediction record
+            rule: Alert rule
+        """
+        if server is None:
+            return
+        
+        sender_email = self.channels.get('email', {}).get('sender_email')
+        
         # Create message
         msg = MIMEMultipart()
         msg['From'] = sender_email
         msg['To'] = sender_email  # In production, send to appropriate recipient
         msg['Subject'] = f"Mental Health Alert: {rule['name']}"
         
-        body = f"""
-        Mental Health Alert
-        
-        Alert Type: {rule['name']}
-        Severity: {rule.get('severity', 'medium').upper()}
-        
-        User ID: {prediction.get('user_id_hash')}
-        Burnout Risk Score: {prediction.get('burnout_risk_score', 0):.2f}
-        Risk Level: {prediction.get('risk_level', 'unknown').upper()}
-        
-        This alert was triggered based on the following condition:
-        {rule.get('condition')}
-        
-        Please review the dashboard for more details and consider reaching out to provide support.
-        
-        ---
-        Mental Health Dashboard
-        Generated: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}
-        """
+        body = self._email_template.substitute(
+            rule_name=rule['name'],
+            severity=rule.get('severity', 'medium').upper(),
+            user_id_hash=prediction.get('user_id_hash'),
+            risk_score=f"{prediction.get('burnout_risk_score', 0):.2f}",
+            risk_level=prediction.get('risk_level', 'unknown').upper(),
+            condition=rule.get('condition'),
+            generated=datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')
+        )
         
         msg.attach(MIMEText(body, 'plain'))
         
-        # Send email
-        with smtplib.SMTP(smtp_server, smtp_port) as server:
-            server.starttls()
-            server.login(sender_email, sender_password)
-            server.send_message(msg)
+        server.send_message(msg)
     
-    def _send_slack_alert(self, prediction: pd.Series, rule: Dict[str, Any]):
+    def _send_slack_alert(self, prediction: Dict[str, Any], rule: Dict[str, Any]):
         """Send Slack alert.
         
         Args:
             prediction: Prediction record
             rule: Alert rule
         """
-        import requests
-        
         slack_config = self.channels.get('slack', {})
         webhook_url = slack_config.get('webhook_url')
         
@@ -285,7 +484,7 @@ class AlertManager:
             ]
         }
         
-        response = requests.post(webhook_url, json=message)
+        response = self._http.post(webhook_url, json=message)
         response.raise_for_status()
     
     def _generate_alert_id(self) -> str:
@@ -294,9 +493,7 @@ class AlertManager:
         Returns:
             Alert ID
         """
-        import hashlib
-        timestamp = datetime.utcnow().isoformat()
-        return hashlib.sha256(timestamp.encode()).hexdigest()[:16]
+        return secrets.token_hex(8)
 
 
 def main():
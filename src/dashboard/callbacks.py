@@ -1,20 +1,56 @@
 """Dashboard callbacks for interactivity."""
 
+import base64
+import hashlib
+import io
+import json
 import os
-from dash import Input, Output, State
+import threading
+from concurrent.futures import Future
+import numpy as np
+import pandas as pd
+import plotly.io as pio
+from dash import Input, Output, State, Patch, ctx, no_update
+from dash.exceptions import PreventUpdate
 from datetime import datetime, timedelta
+from typing import Dict, Any, List, Optional, Tuple
+from flask_caching import Cache
+from src.utils.config_loader import get_config
 from src.utils.logger import log
-from src.dashboard.layouts import (
-    create_overview_tab,
-    create_sentiment_tab,
-    create_burnout_tab,
-    create_alerts_tab
-)
+from src.dashboard.layouts import TAB_LAYOUTS
+
+try:
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
+try:
+    import pyarrow  # noqa: F401
+    _HAS_PYARROW = True
+except ImportError:
+    _HAS_PYARROW = False
+
+# Trailing points of a time series re-sent on every patch; the most recent
+# days are still accumulating and may change between refreshes
+_OPEN_POINTS = 2
+
+# Below this many rows Parquet's footer outweighs its savings over JSON records
+_PARQUET_MIN_ROWS = 200
+
+# Marker the data provider sets on results of failed queries
+_QUERY_FAILED = 'query_failed'
 
 # Lazy imports for data provider and chart generator
 _data_provider = None
 _chart_gen = None
 
+# Server-side cache shared by all sessions; bound to the Flask server in register_callbacks
+cache = Cache()
+
+# Provider calls currently running, so simultaneous identical calls share one query
+_inflight: Dict[tuple, Future] = {}
+_inflight_lock = threading.Lock()
+
 def get_data_provider():
     """Lazy singleton for data provider."""
     global _data_provider
@@ -39,12 +75,446 @@ def get_chart_generator():
     return _chart_gen
 
 
+def _is_cacheable(result: Any) -> bool:
+    """Whether a provider result may be cached.
+    
+    Getters return an empty frame or default dict when a query fails,
+    marked with ``query_failed``; caching those would blank a chart for
+    the whole cache window after one transient error.
+    
+    Args:
+        result: Provider result (DataFrame, dict, or a dict of those)
+        
+    Returns:
+        False if the result, or any frame or dict inside it, is marked as failed
+    """
+    if isinstance(result, dict):
+        if result.get(_QUERY_FAILED):
+            return False
+        return all(_is_cacheable(value) for value in result.values() if isinstance(value, (dict, pd.DataFrame)))
+    return not getattr(result, 'attrs', {}).get(_QUERY_FAILED)
+
+
+@cache.memoize(response_filter=_is_cacheable)
+def fetch_data(method: str, *args):
+    """Call a data provider method, memoized on its name and arguments.
+    
+    Concurrent sessions and interval ticks with the same filters share one
+    query per cache window. Arguments must be hashable (pass tuples, not lists).
+    
+    Args:
+        method: Name of the data provider method
+        *args: Positional arguments for the method
+        
+    Returns:
+        Result of the data provider method
+    """
+    return _call_provider_once(method, args)
+
+
+def _call_provider_once(method: str, args: tuple):
+    """Call a data provider method, joining an identical call already in flight.
+    
+    An interval tick fires several callbacks at once, all missing the cache
+    together; only the first runs the query and the rest wait for its result.
+    
+    Args:
+        method: Name of the data provider method
+        args: Positional arguments for the method
+        
+    Returns:
+        Result of the data provider method
+    """
+    key = (method, args)
+    with _inflight_lock:
+        future = _inflight.get(key)
+        is_owner = future is None
+        if is_owner:
+            future = _inflight[key] = Future()
+    
+    if not is_owner:
+        return future.result()
+    
+    try:
+        result = getattr(get_data_provider(), method)(*args)
+        future.set_result(result)
+        return result
+    except Exception as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _inflight_lock:
+            _inflight.pop(key, None)
+
+
+@cache.memoize(response_filter=lambda rendered: rendered[1])
+def _render_chart_json(data_method: str, chart_method: str, *args) -> Tuple[str, bool]:
+    """Fetch data and build its figure as JSON, memoized on the method names and arguments.
+    
+    The serialized figure is cached, so a hit skips the query, the figure
+    build and Plotly's encoder. The data is fetched past ``fetch_data``'s
+    memo, so a figure is never older than one cache window.
+    
+    Args:
+        data_method: Name of the data provider method
+        chart_method: Name of the chart generator method
+        *args: Positional arguments for the data provider method (hashable)
+        
+    Returns:
+        Tuple of (figure serialized as JSON, whether it may be cached)
+    """
+    data = _call_provider_once(data_method, args)
+    fig = getattr(get_chart_generator(), chart_method)(data)
+    return pio.to_json(fig, validate=False), _is_cacheable(data)
+
+
+def render_chart(data_method: str, chart_method: str, *args) -> Dict[str, Any]:
+    """Return a cached figure as a plain dict for a ``dcc.Graph``.
+    
+    Repeat ticks, tab switches and other sessions with the same filters reuse
+    the serialized figure instead of re-querying and rebuilding it.
+    
+    Args:
+        data_method: Name of the data provider method
+        chart_method: Name of the chart generator method
+        *args: Positional arguments for the data provider method (hashable)
+        
+    Returns:
+        Figure dict with ``data`` and ``layout``
+    """
+    return _loads(_render_chart_json(data_method, chart_method, *args)[0])
+
+
+def _require_tab(active_tab: str, tab: str):
+    """Stop a tab's chart callback unless that tab is the one on screen.
+    
+    Only the active tab's graphs are mounted, but a tick or filter change
+    can still reach a tab that is being switched away from.
+    
+    Args:
+        active_tab: Currently selected tab
+        tab: Tab the callback's graph belongs to
+        
+    Raises:
+        PreventUpdate: If ``tab`` is not active
+    """
+    if active_tab != tab:
+        raise PreventUpdate
+
+
+def _skip_unchanged_tick(payload: Any, last_digest: Optional[str]) -> str:
+    """Digest a callback's output and stop an interval tick that would resend it.
+    
+    The digest is kept per session in a ``dcc.Store``, so one session's
+    ticks never suppress another's, and it works the same in background
+    callback processes. Refresh clicks and filter changes always go through.
+    
+    Args:
+        payload: Output about to be sent (a JSON string, or JSON-compatible data)
+        last_digest: Digest of what this session was last sent
+        
+    Returns:
+        Digest of ``payload``, to store for the next tick
+        
+    Raises:
+        PreventUpdate: If an interval tick would resend the same output
+    """
+    if not isinstance(payload, str):
+        payload = json.dumps(payload, sort_keys=True, default=str)
+    digest = hashlib.blake2b(payload.encode('utf-8'), digest_size=16).hexdigest()
+    if ctx.triggered_id == 'interval-component' and digest == last_digest:
+        raise PreventUpdate
+    return digest
+
+
+def _points_digest(trace: Dict[str, Any], sent: int) -> str:
+    """Fingerprint the points of a trace the browser already has.
+    
+    Covers every x sent and every y except the last ``_OPEN_POINTS``,
+    which are re-sent with each patch anyway.
+    
+    Args:
+        trace: Trace dict with ``x`` and ``y``
+        sent: Number of points the browser was sent
+        
+    Returns:
+        Hex digest
+    """
+    x = np.asarray(trace['x'][:sent]).tolist()
+    y = np.asarray(trace['y'][:max(sent - _OPEN_POINTS, 0)]).tolist()
+    payload = json.dumps([x, y], default=str).encode('utf-8')
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _append_only_update(
+    figure: Dict[str, Any],
+    key: List[Any],
+    state: Optional[Dict[str, Any]],
+    appendable: bool = True
+) -> Tuple[Any, Dict[str, Any]]:
+    """Send a time-series figure as a Patch when it only grew since the last render.
+    
+    When the filters are unchanged and every point the browser already has
+    is unchanged (apart from the last ``_OPEN_POINTS``, which may still move),
+    only the trailing values that moved and the new points are sent. Any
+    other change to earlier points sends the full figure.
+    
+    Args:
+        figure: Full figure dict for the current inputs
+        key: Inputs that must match for an append (everything but the end date)
+        state: What the browser was last sent (from the chart's state store)
+        appendable: False if the series was downsampled, so points can move
+        
+    Returns:
+        Tuple of (figure update, new state for the store); the update is the
+        full figure, a Patch, or ``no_update`` if nothing changed
+    """
+    traces = figure.get('data', [])
+    new_state = {
+        'key': key,
+        'traces': [
+            [
+                trace.get('name'),
+                len(trace['x']),
+                _points_digest(trace, len(trace['x'])),
+                _open_values(trace, len(trace['x']))
+            ]
+            for trace in traces
+        ],
+        'appendable': appendable
+    }
+    
+    if (
+        not appendable
+        or not traces
+        or not state
+        or not state.get('appendable')
+        or state.get('key') != key
+        or len(state.get('traces', [])) != len(traces)
+    ):
+        return figure, new_state
+    
+    for entry, trace in zip(state['traces'], traces):
+        if len(entry) != 4:
+            return figure, new_state
+        name, sent, digest, _ = entry
+        if (
+            name != trace.get('name')
+            or not sent
+            or sent > len(trace['x'])
+            or _points_digest(trace, sent) != digest
+        ):
+            return figure, new_state
+    
+    patch = Patch()
+    changed = False
+    for i, ((_, sent, _, sent_open), trace) in enumerate(zip(state['traces'], traces)):
+        # The trailing points sent may still have been accumulating (e.g. today)
+        first_open = max(sent - _OPEN_POINTS, 0)
+        for j, (old, new) in enumerate(zip(sent_open, _open_values(trace, sent)), start=first_open):
+            if new != old:
+                patch['data'][i]['y'][j] = new
+                changed = True
+        if len(trace['x']) > sent:
+            patch['data'][i]['x'].extend(np.asarray(trace['x'][sent:]).tolist())
+            patch['data'][i]['y'].extend(np.asarray(trace['y'][sent:]).tolist())
+            changed = True
+    return (patch if changed else no_update), new_state
+
+
+def _open_values(trace: Dict[str, Any], sent: int) -> List[Any]:
+    """The last ``_OPEN_POINTS`` y values among the first ``sent`` points.
+    
+    Args:
+        trace: Trace dict with ``y``
+        sent: Number of points the browser was sent
+        
+    Returns:
+        JSON-compatible list of y values
+    """
+    return np.asarray(trace['y'][max(sent - _OPEN_POINTS, 0):sent]).tolist()
+
+
+def _values_only_update(
+    figure: Dict[str, Any],
+    state: Optional[Dict[str, Any]],
+    category_key: str,
+    value_keys: Tuple[str, ...]
+) -> Tuple[Any, Dict[str, Any]]:
+    """Send a category chart as a Patch of its values when its categories are unchanged.
+    
+    Refreshes of a pie or bar chart usually only change the counts; patching
+    those lets Plotly update the existing plot instead of rebuilding it.
+    Return full figures only for the first render or a change of shape.
+    
+    Args:
+        figure: Full figure dict for the current inputs
+        state: What the browser was last sent (from the chart's state store)
+        category_key: Trace field holding the categories (e.g. ``labels``, ``x``)
+        value_keys: Trace fields that carry the values (e.g. ``values``, or ``y`` and ``text``)
+        
+    Returns:
+        Tuple of (figure or Patch, new state for the store)
+    """
+    traces = figure.get('data', [])
+    new_state = {
+        'categories': [np.asarray(trace.get(category_key, [])).tolist() for trace in traces]
+    }
+    if not traces or not state or state.get('categories') != new_state['categories']:
+        return figure, new_state
+    
+    patch = Patch()
+    for i, trace in enumerate(traces):
+        for key in value_keys:
+            patch['data'][i][key] = np.asarray(trace[key]).tolist()
+    return patch, new_state
+
+
+def _json_scalar(value: Any) -> Any:
+    """Convert a NumPy scalar to its Python equivalent for JSON state.
+    
+    Args:
+        value: Scalar value
+        
+    Returns:
+        JSON-compatible scalar
+    """
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _encode_frame(df: pd.DataFrame) -> Any:
+    """Serialize a DataFrame for the data-store.
+    
+    Larger frames are sent as zstd-compressed, base64-encoded Parquet, which
+    dictionary-encodes the repeated label columns; small ones as records.
+    
+    Args:
+        df: DataFrame to send to the browser
+        
+    Returns:
+        ``{'parquet': <base64>}`` or a list of records
+    """
+    if not _HAS_PYARROW or len(df) < _PARQUET_MIN_ROWS:
+        return df.to_dict('records')
+    buf = io.BytesIO()
+    df.to_parquet(buf, engine='pyarrow', compression='zstd', index=False)
+    return {'parquet': base64.b64encode(buf.getvalue()).decode('ascii')}
+
+
+def _store_frame(data_store: Dict[str, Any], key: str) -> pd.DataFrame:
+    """Rebuild one DataFrame from the data-store.
+    
+    Args:
+        data_store: Contents of the data-store
+        key: Name of the dataset in the bundle
+        
+    Returns:
+        DataFrame (empty if the store has no data for ``key``)
+    """
+    payload = (data_store or {}).get(key)
+    if isinstance(payload, dict) and 'parquet' in payload:
+        return pd.read_parquet(io.BytesIO(base64.b64decode(payload['parquet'])), engine='pyarrow')
+    return pd.DataFrame(payload or [])
+
+
+def _filter_value(df: pd.DataFrame, column: str, value: Optional[str]) -> pd.DataFrame:
+    """Keep the rows of a distribution matching a dropdown value.
+    
+    Args:
+        df: DataFrame from the data-store
+        column: Column the dropdown filters on
+        value: Selected value; ``'all'`` or empty keeps every row
+        
+    Returns:
+        Filtered DataFrame
+    """
+    if not value or value == 'all' or column not in df.columns:
+        return df
+    return df[df[column] == value]
+
+
+def _trend_for_sources(df: pd.DataFrame, sources: Optional[List[str]]) -> pd.DataFrame:
+    """Combine the per-source daily sentiment into one trend for the selected sources.
+    
+    Each day's average is re-weighted by post count, matching what
+    ``get_sentiment_trend`` returns for the same selection.
+    
+    Args:
+        df: Daily sentiment with date, source, avg_sentiment and post_count
+        sources: Selected sources; empty means all sources, as in
+            ``get_sentiment_trend``
+        
+    Returns:
+        DataFrame with date, avg_sentiment and post_count
+    """
+    if df.empty or 'source' not in df.columns:
+        return df
+    # One pass of weighted bincounts over the day codes; deselected sources
+    # contribute zero weight instead of being copied out with a mask
+    day_codes, days = pd.factorize(df['date'], sort=True)
+    counts = df['post_count'].to_numpy(dtype=float)
+    if sources:
+        counts = np.where(df['source'].isin(sources).to_numpy(), counts, 0.0)
+    weighted = counts * df['avg_sentiment'].to_numpy(dtype=float)
+    day_counts = np.bincount(day_codes, weights=counts, minlength=len(days))
+    day_sums = np.bincount(day_codes, weights=weighted, minlength=len(days))
+    keep = day_counts > 0
+    return pd.DataFrame({
+        'date': days[keep],
+        'avg_sentiment': day_sums[keep] / day_counts[keep],
+        'post_count': day_counts[keep].astype(np.int64)
+    })
+
+
 def register_callbacks(app):
     """Register all dashboard callbacks.
     
     Args:
         app: Dash app instance
     """
+    dashboard_config = get_config().get_dashboard_config()
+    cache_timeout = dashboard_config.get('cache_timeout', 60)
+    cache_dir = dashboard_config.get('cache_dir', '.cache')
+    
+    # Slow charts can run as background callbacks so they don't hold a
+    # server worker; their job processes need a cache shared on disk
+    background_manager = None
+    if dashboard_config.get('background_callbacks', False):
+        try:
+            import diskcache
+            from dash import DiskcacheManager
+            background_manager = DiskcacheManager(diskcache.Cache(os.path.join(cache_dir, 'callbacks')))
+        except ImportError:
+            log.warning("diskcache not installed, running slow charts as regular callbacks")
+    
+    if background_manager is not None:
+        cache_config = {'CACHE_TYPE': 'FileSystemCache', 'CACHE_DIR': os.path.join(cache_dir, 'data')}
+    else:
+        cache_config = {'CACHE_TYPE': 'SimpleCache'}
+    # Half the budget; DashboardDataProvider's own cache takes the other half
+    cache_config['CACHE_DEFAULT_TIMEOUT'] = max(1, cache_timeout // 2)
+    cache.init_app(app.server, config=cache_config)
+    
+    background = {}
+    if background_manager is not None:
+        background = {'background': True, 'manager': background_manager}
+    
+    def chart_json(data_method: str, chart_method: str, *args) -> str:
+        """Get a figure's cached JSON, also from a background job process.
+        
+        Job processes have no Flask app context, which the cache needs.
+        
+        Args:
+            data_method: Name of the data provider method
+            chart_method: Name of the chart generator method
+            *args: Positional arguments for the data provider method
+            
+        Returns:
+            Figure serialized as JSON
+        """
+        with app.server.app_context():
+            return _render_chart_json(data_method, chart_method, *args)[0]
+    
     # Data provider and chart generator are lazily created on first callback
     
     @app.callback(
@@ -53,24 +523,82 @@ def register_callbacks(app):
     )
     def render_tab_content(active_tab):
         """Render content based on active tab."""
-        if active_tab == 'overview':
-            return create_overview_tab()
-        elif active_tab == 'sentiment':
-            return create_sentiment_tab()
-        elif active_tab == 'burnout':
-            return create_burnout_tab()
-        elif active_tab == 'alerts':
-            return create_alerts_tab()
-        return create_overview_tab()
+        return TAB_LAYOUTS.get(active_tab, TAB_LAYOUTS['overview'])
     
-    @app.callback(
+    # Polling costs a full round of queries per connected browser, so it is
+    # paused client-side while the page is hidden or auto-refresh is off.
+    # The browser's visibilitychange event flips it, so there is no poll of
+    # its own. Only the active tab's graphs are mounted, so each tick
+    # already drives just that tab's callbacks.
+    app.clientside_callback(
+        """
+        function(refresh_seconds) {
+            window.dashRefreshSeconds = refresh_seconds;
+            if (!window.dashVisibilityListener) {
+                window.dashVisibilityListener = function() {
+                    dash_clientside.set_props('interval-component', {
+                        disabled: document.visibilityState === 'hidden' || !window.dashRefreshSeconds
+                    });
+                };
+                document.addEventListener('visibilitychange', window.dashVisibilityListener);
+            }
+            var hidden = document.visibilityState === 'hidden';
+            return [hidden || !refresh_seconds, (refresh_seconds || 60) * 1000];
+        }
+        """,
+        [Output('interval-component', 'disabled'),
+         Output('interval-component', 'interval')],
+        Input('refresh-interval', 'value')
+    )
+    
+    # Timestamp is formatted in the browser; no server round trip per tick
+    app.clientside_callback(
+        """
+        function(n_intervals, n_clicks) {
+            var now = new Date();
+            var pad = function(n) { return String(n).padStart(2, '0'); };
+            return now.getFullYear() + '-' + pad(now.getMonth() + 1) + '-' + pad(now.getDate()) + ' ' +
+                pad(now.getHours()) + ':' + pad(now.getMinutes()) + ':' + pad(now.getSeconds());
+        }
+        """,
         Output('last-updated', 'children'),
         [Input('interval-component', 'n_intervals'),
          Input('refresh-button', 'n_clicks')]
     )
-    def update_timestamp(n_intervals, n_clicks):
-        """Update last updated timestamp."""
-        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    
+    # One query round per date range; dropdown changes only re-slice the store
+    @app.callback(
+        Output('data-store', 'data'),
+        [Input('interval-component', 'n_intervals'),
+         Input('refresh-button', 'n_clicks'),
+         Input('date-range', 'start_date'),
+         Input('date-range', 'end_date'),
+         Input('tabs', 'active_tab')],
+        State('data-store', 'data')
+    )
+    def update_data_store(n_intervals, n_clicks, start_date, end_date, active_tab, data_store):
+        """Fetch the unfiltered overview and sentiment data for the date range."""
+        if active_tab not in ('overview', 'sentiment'):
+            raise PreventUpdate
+        date_range = [start_date, end_date]
+        if ctx.triggered_id == 'tabs' and (data_store or {}).get('date_range') == date_range:
+            raise PreventUpdate
+        try:
+            bundle = fetch_data('get_date_range_bundle', start_date, end_date)
+            store = {
+                'date_range': date_range,
+                'metrics': bundle['metrics'],
+                'sentiment_trend': _encode_frame(bundle['sentiment_trend']),
+                'risk_distribution': _encode_frame(bundle['risk_distribution']),
+                'sentiment_distribution': _encode_frame(bundle['sentiment_distribution']),
+                'indicators': _encode_frame(bundle['indicators'])
+            }
+        except Exception as e:
+            log.error(f"Error updating data store: {str(e)}")
+            return {}
+        # An unchanged store would re-run every overview chart for nothing
+        store['digest'] = _skip_unchanged_tick(store, (data_store or {}).get('digest'))
+        return store
     
     # Overview tab callbacks
     @app.callback(
@@ -78,185 +606,232 @@ def register_callbacks(app):
          Output('high-risk-count', 'children'),
          Output('avg-sentiment', 'children'),
          Output('active-alerts', 'children')],
-        [Input('interval-component', 'n_intervals'),
-         Input('refresh-button', 'n_clicks'),
-         Input('date-range', 'start_date'),
-         Input('date-range', 'end_date')]
+        Input('data-store', 'data')
     )
-    def update_key_metrics(n_intervals, n_clicks, start_date, end_date):
+    def update_key_metrics(data_store):
         """Update key metrics cards."""
-        try:
-            data_provider = get_data_provider()
-            metrics = data_provider.get_key_metrics(start_date, end_date)
-            return (
-                f"{metrics.get('total_users', 0):,}",
-                f"{metrics.get('high_risk_users', 0):,}",
-                f"{metrics.get('avg_sentiment', 0):.2f}",
-                f"{metrics.get('active_alerts', 0):,}"
-            )
-        except Exception as e:
-            log.error(f"Error updating metrics: {str(e)}")
+        metrics = (data_store or {}).get('metrics')
+        if not metrics:
             return "--", "--", "--", "--"
+        return (
+            f"{metrics.get('total_users', 0):,}",
+            f"{metrics.get('high_risk_users', 0):,}",
+            f"{metrics.get('avg_sentiment', 0):.2f}",
+            f"{metrics.get('active_alerts', 0):,}"
+        )
     
     @app.callback(
-        Output('sentiment-trend-chart', 'figure'),
-        [Input('interval-component', 'n_intervals'),
-         Input('refresh-button', 'n_clicks'),
-         Input('date-range', 'start_date'),
-         Input('date-range', 'end_date'),
-         Input('source-filter', 'value')]
+        [Output('sentiment-trend-chart', 'figure'),
+         Output('sentiment-trend-state', 'data')],
+        [Input('data-store', 'data'),
+         Input('source-filter', 'value')],
+        [State('date-range', 'start_date'),
+         State('sentiment-trend-state', 'data')]
     )
-    def update_sentiment_trend(n_intervals, n_clicks, start_date, end_date, sources):
+    def update_sentiment_trend(data_store, sources, start_date, trend_state):
         """Update sentiment trend chart."""
+        chart_gen = get_chart_generator()
         try:
-            data_provider = get_data_provider()
-            chart_gen = get_chart_generator()
-            data = get_data_provider().get_sentiment_trend(start_date, end_date, sources)
-            return get_chart_generator().create_sentiment_trend_chart(data)
+            data = _trend_for_sources(_store_frame(data_store, 'sentiment_trend'), sources)
+            figure = chart_gen.create_sentiment_trend_chart(data)
+            return _append_only_update(
+                figure, [start_date, sorted(sources or [])], trend_state,
+                appendable=len(data) <= chart_gen.max_points
+            )
         except Exception as e:
             log.error(f"Error updating sentiment trend: {str(e)}")
-            chart_gen = get_chart_generator()
-            return get_chart_generator().create_empty_chart("Error loading data")
+            return chart_gen.create_empty_chart("Error loading data"), None
     
     @app.callback(
-        Output('risk-distribution-chart', 'figure'),
-        [Input('interval-component', 'n_intervals'),
-         Input('refresh-button', 'n_clicks'),
-         Input('date-range', 'start_date'),
-         Input('date-range', 'end_date'),
-         Input('risk-filter', 'value')]
+        [Output('risk-distribution-chart', 'figure'),
+         Output('risk-distribution-state', 'data')],
+        [Input('data-store', 'data'),
+         Input('risk-filter', 'value')],
+        State('risk-distribution-state', 'data')
     )
-    def update_risk_distribution(n_intervals, n_clicks, start_date, end_date, risk_level):
+    def update_risk_distribution(data_store, risk_level, distribution_state):
         """Update risk distribution chart."""
+        chart_gen = get_chart_generator()
         try:
-            data = get_data_provider().get_risk_distribution(start_date, end_date, risk_level)
-            return get_chart_generator().create_risk_distribution_chart(data)
+            data = _filter_value(_store_frame(data_store, 'risk_distribution'), 'risk_level', risk_level)
+            figure = chart_gen.create_risk_distribution_chart(data)
+            return _values_only_update(figure, distribution_state, 'labels', ('values',))
         except Exception as e:
             log.error(f"Error updating risk distribution: {str(e)}")
-            return get_chart_generator().create_empty_chart("Error loading data")
+            return chart_gen.create_empty_chart("Error loading data"), None
     
     @app.callback(
-        Output('indicators-chart', 'figure'),
-        [Input('interval-component', 'n_intervals'),
-         Input('refresh-button', 'n_clicks'),
-         Input('date-range', 'start_date'),
-         Input('date-range', 'end_date')]
+        [Output('indicators-chart', 'figure'),
+         Output('indicators-state', 'data')],
+        Input('data-store', 'data'),
+        [State('date-range', 'start_date'),
+         State('indicators-state', 'data')]
     )
-    def update_indicators(n_intervals, n_clicks, start_date, end_date):
+    def update_indicators(data_store, start_date, indicators_state):
         """Update mental health indicators chart."""
+        chart_gen = get_chart_generator()
         try:
-            data = get_data_provider().get_mental_health_indicators(start_date, end_date)
-            return get_chart_generator().create_indicators_chart(data)
+            data = _store_frame(data_store, 'indicators')
+            figure = chart_gen.create_indicators_chart(data)
+            return _append_only_update(
+                figure, [start_date], indicators_state,
+                appendable=len(data) <= chart_gen.max_points
+            )
         except Exception as e:
             log.error(f"Error updating indicators: {str(e)}")
-            return get_chart_generator().create_empty_chart("Error loading data")
+            return chart_gen.create_empty_chart("Error loading data"), None
     
     # Sentiment tab callbacks
     @app.callback(
-        Output('sentiment-distribution-chart', 'figure'),
-        [Input('interval-component', 'n_intervals'),
-         Input('date-range', 'start_date'),
-         Input('date-range', 'end_date'),
-         Input('sentiment-filter', 'value')]
+        [Output('sentiment-distribution-chart', 'figure'),
+         Output('sentiment-distribution-state', 'data')],
+        [Input('data-store', 'data'),
+         Input('sentiment-filter', 'value')],
+        [State('tabs', 'active_tab'),
+         State('sentiment-distribution-state', 'data')]
     )
-    def update_sentiment_distribution(n_intervals, start_date, end_date, sentiment_label):
+    def update_sentiment_distribution(data_store, sentiment_label, active_tab, distribution_state):
         """Update sentiment distribution chart."""
+        _require_tab(active_tab, 'sentiment')
+        chart_gen = get_chart_generator()
         try:
-            data = get_data_provider().get_sentiment_distribution(start_date, end_date, sentiment_label)
-            return get_chart_generator().create_sentiment_distribution_chart(data)
+            data = _filter_value(
+                _store_frame(data_store, 'sentiment_distribution'), 'sentiment_label', sentiment_label
+            )
+            figure = chart_gen.create_sentiment_distribution_chart(data)
+            return _values_only_update(figure, distribution_state, 'x', ('y', 'text'))
         except Exception as e:
             log.error(f"Error updating sentiment distribution: {str(e)}")
-            return get_chart_generator().create_empty_chart("Error loading data")
+            return chart_gen.create_empty_chart("Error loading data"), None
     
     @app.callback(
-        Output('sentiment-by-source-chart', 'figure'),
+        [Output('sentiment-by-source-chart', 'figure'),
+         Output('sentiment-by-source-digest', 'data')],
         [Input('interval-component', 'n_intervals'),
          Input('date-range', 'start_date'),
-         Input('date-range', 'end_date')]
+         Input('date-range', 'end_date')],
+        [State('tabs', 'active_tab'),
+         State('sentiment-by-source-digest', 'data')]
     )
-    def update_sentiment_by_source(n_intervals, start_date, end_date):
+    def update_sentiment_by_source(n_intervals, start_date, end_date, active_tab, last_digest):
         """Update sentiment by source chart."""
+        _require_tab(active_tab, 'sentiment')
         try:
-            data = get_data_provider().get_sentiment_by_source(start_date, end_date)
-            return get_chart_generator().create_sentiment_by_source_chart(data)
+            figure_json = chart_json(
+                'get_sentiment_by_source', 'create_sentiment_by_source_chart', start_date, end_date
+            )
         except Exception as e:
             log.error(f"Error updating sentiment by source: {str(e)}")
-            return get_chart_generator().create_empty_chart("Error loading data")
+            return get_chart_generator().create_empty_chart("Error loading data"), None
+        return _loads(figure_json), _skip_unchanged_tick(figure_json, last_digest)
     
     @app.callback(
-        Output('keyword-chart', 'figure'),
+        [Output('keyword-chart', 'figure'),
+         Output('keyword-digest', 'data')],
         [Input('interval-component', 'n_intervals'),
          Input('date-range', 'start_date'),
-         Input('date-range', 'end_date')]
+         Input('date-range', 'end_date')],
+        [State('tabs', 'active_tab'),
+         State('keyword-digest', 'data')],
+        **background
     )
-    def update_keyword_chart(n_intervals, start_date, end_date):
+    def update_keyword_chart(n_intervals, start_date, end_date, active_tab, last_digest):
         """Update keyword analysis chart."""
+        _require_tab(active_tab, 'sentiment')
         try:
-            data = get_data_provider().get_keyword_analysis(start_date, end_date)
-            return get_chart_generator().create_keyword_chart(data)
+            figure_json = chart_json(
+                'get_keyword_analysis', 'create_keyword_chart', start_date, end_date
+            )
         except Exception as e:
             log.error(f"Error updating keyword chart: {str(e)}")
-            return get_chart_generator().create_empty_chart("Error loading data")
+            return get_chart_generator().create_empty_chart("Error loading data"), None
+        return _loads(figure_json), _skip_unchanged_tick(figure_json, last_digest)
     
     # Burnout tab callbacks
     @app.callback(
-        Output('burnout-heatmap', 'figure'),
+        [Output('burnout-heatmap', 'figure'),
+         Output('burnout-heatmap-digest', 'data')],
         [Input('interval-component', 'n_intervals'),
          Input('date-range', 'start_date'),
          Input('date-range', 'end_date'),
-         Input('risk-filter', 'value')]
+         Input('risk-filter', 'value')],
+        [State('tabs', 'active_tab'),
+         State('burnout-heatmap-digest', 'data')],
+        **background
     )
-    def update_burnout_heatmap(n_intervals, start_date, end_date, risk_level):
+    def update_burnout_heatmap(n_intervals, start_date, end_date, risk_level, active_tab, last_digest):
         """Update burnout risk heatmap."""
+        _require_tab(active_tab, 'burnout')
         try:
-            data = get_data_provider().get_burnout_heatmap_data(start_date, end_date, risk_level)
-            return get_chart_generator().create_burnout_heatmap(data)
+            figure_json = chart_json(
+                'get_burnout_heatmap_data', 'create_burnout_heatmap', start_date, end_date, risk_level
+            )
         except Exception as e:
             log.error(f"Error updating burnout heatmap: {str(e)}")
-            return get_chart_generator().create_empty_chart("Error loading data")
+            return get_chart_generator().create_empty_chart("Error loading data"), None
+        return _loads(figure_json), _skip_unchanged_tick(figure_json, last_digest)
     
     @app.callback(
-        Output('risk-score-distribution', 'figure'),
+        [Output('risk-score-distribution', 'figure'),
+         Output('risk-score-digest', 'data')],
         [Input('interval-component', 'n_intervals'),
          Input('date-range', 'start_date'),
-         Input('date-range', 'end_date')]
+         Input('date-range', 'end_date')],
+        [State('tabs', 'active_tab'),
+         State('risk-score-digest', 'data')]
     )
-    def update_risk_score_distribution(n_intervals, start_date, end_date):
+    def update_risk_score_distribution(n_intervals, start_date, end_date, active_tab, last_digest):
         """Update risk score distribution."""
+        _require_tab(active_tab, 'burnout')
         try:
-            data = get_data_provider().get_risk_scores(start_date, end_date)
-            return get_chart_generator().create_risk_score_distribution(data)
+            figure_json = chart_json(
+                'get_risk_scores', 'create_risk_score_distribution', start_date, end_date
+            )
         except Exception as e:
             log.error(f"Error updating risk score distribution: {str(e)}")
-            return get_chart_generator().create_empty_chart("Error loading data")
+            return get_chart_generator().create_empty_chart("Error loading data"), None
+        return _loads(figure_json), _skip_unchanged_tick(figure_json, last_digest)
     
     @app.callback(
-        Output('contributing-factors-chart', 'figure'),
+        [Output('contributing-factors-chart', 'figure'),
+         Output('contributing-factors-digest', 'data')],
         [Input('interval-component', 'n_intervals'),
          Input('date-range', 'start_date'),
-         Input('date-range', 'end_date')]
+         Input('date-range', 'end_date')],
+        [State('tabs', 'active_tab'),
+         State('contributing-factors-digest', 'data')],
+        **background
     )
-    def update_contributing_factors(n_intervals, start_date, end_date):
+    def update_contributing_factors(n_intervals, start_date, end_date, active_tab, last_digest):
         """Update contributing factors chart."""
+        _require_tab(active_tab, 'burnout')
         try:
-            data = get_data_provider().get_contributing_factors(start_date, end_date)
-            return get_chart_generator().create_contributing_factors_chart(data)
+            figure_json = chart_json(
+                'get_contributing_factors', 'create_contributing_factors_chart', start_date, end_date
+            )
         except Exception as e:
             log.error(f"Error updating contributing factors: {str(e)}")
-            return get_chart_generator().create_empty_chart("Error loading data")
+            return get_chart_generator().create_empty_chart("Error loading data"), None
+        return _loads(figure_json), _skip_unchanged_tick(figure_json, last_digest)
     
     # Alerts tab callbacks
     @app.callback(
-        Output('alert-timeline-chart', 'figure'),
+        [Output('alert-timeline-chart', 'figure'),
+         Output('alert-timeline-state', 'data')],
         [Input('interval-component', 'n_intervals'),
          Input('date-range', 'start_date'),
-         Input('date-range', 'end_date')]
+         Input('date-range', 'end_date')],
+        [State('tabs', 'active_tab'),
+         State('alert-timeline-state', 'data')]
     )
-    def update_alert_timeline(n_intervals, start_date, end_date):
+    def update_alert_timeline(n_intervals, start_date, end_date, active_tab, timeline_state):
         """Update alert timeline chart."""
+        _require_tab(active_tab, 'alerts')
         try:
-            data = get_data_provider().get_alert_timeline(start_date, end_date)
-            return get_chart_generator().create_alert_timeline_chart(data)
+            figure = render_chart(
+                'get_alert_timeline', 'create_alert_timeline_chart', start_date, end_date
+            )
+            return _append_only_update(figure, [start_date], timeline_state)
         except Exception as e:
             log.error(f"Error updating alert timeline: {str(e)}")
-            return get_chart_generator().create_empty_chart("Error loading data")
+            return get_chart_generator().create_empty_chart("Error loading data"), None
@@ -1,14 +1,168 @@
 """Chart generation for dashboard visualizations."""
 
-import plotly.graph_objects as go
-import plotly.express as px
+import plotly.io as pio
+import numpy as np
 import pandas as pd
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional, Tuple
 from src.utils.config_loader import get_config
 
+# Serialize figures with orjson (C encoder) when it is installed; Dash goes
+# through plotly.io, so this covers every callback response
+try:
+    import orjson  # noqa: F401
+    pio.json.config.default_engine = 'orjson'
+except ImportError:
+    pass
+
+
+def _axis(title: str, value_range: Optional[List[float]] = None) -> Dict[str, Any]:
+    """Build an axis layout dict.
+    
+    Args:
+        title: Axis title
+        value_range: Optional fixed [min, max] range
+        
+    Returns:
+        Axis layout dict
+    """
+    axis = {'title': {'text': title}}
+    if value_range is not None:
+        axis['range'] = value_range
+    return axis
+
+
+def _iso_dates(values: pd.Series) -> pd.Series:
+    """Convert datetime values to ISO strings so orjson can encode them directly.
+    
+    Args:
+        values: Date column
+        
+    Returns:
+        Column of ISO date strings (unchanged if not datetime)
+    """
+    if pd.api.types.is_datetime64_any_dtype(values):
+        return values.dt.strftime('%Y-%m-%d')
+    return values
+
+
+def _downsample(x: pd.Series, y: pd.Series, max_points: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Min/max-decimate a line series to at most ``max_points`` points.
+    
+    Each bucket keeps its lowest and highest point, so peaks and dips stay
+    visible while the browser only receives about one point per pixel.
+    
+    Args:
+        x: X values (sorted)
+        y: Y values
+        max_points: Maximum number of points to keep
+        
+    Returns:
+        Tuple of (x, y) arrays
+    """
+    x_values = np.asarray(x)
+    y_values = np.asarray(y, dtype=float)
+    if len(y_values) <= max_points:
+        return x_values, y_values
+    
+    edges = np.linspace(0, len(y_values), max_points // 2 + 1).astype(int)
+    keep = []
+    for lo, hi in zip(edges[:-1], edges[1:]):
+        bucket = y_values[lo:hi]
+        keep.append(lo + np.argmin(bucket))
+        keep.append(lo + np.argmax(bucket))
+    keep = np.unique(keep)
+    return x_values[keep], y_values[keep]
+
+
+# Display labels for category values; unknown values are added on first sight
+_RISK_LABELS = {
+    'critical': 'Critical',
+    'high': 'High',
+    'medium': 'Medium',
+    'low': 'Low'
+}
+
+_SENTIMENT_LABELS = {
+    'very_negative': 'Very Negative',
+    'negative': 'Negative',
+    'neutral': 'Neutral',
+    'positive': 'Positive',
+    'very_positive': 'Very Positive'
+}
+
+_SOURCE_LABELS = {
+    'twitter': 'Twitter',
+    'reddit': 'Reddit',
+    'survey': 'Survey'
+}
+
+_FACTOR_LABELS: Dict[str, str] = {}
+
+_DEFAULT_COLOR = '#757575'
+
+# Shared style objects; figures reference them and nothing mutates them
+_SENTIMENT_LINE = {'color': '#2E86AB', 'width': 3}
+_SENTIMENT_MARKER = {'size': 8}
+
+_INDICATOR_LINES = {
+    'stress': {'color': '#FF6B6B', 'width': 2},
+    'anxiety': {'color': '#4ECDC4', 'width': 2},
+    'depression': {'color': '#45B7D1', 'width': 2},
+    'burnout': {'color': '#FFA07A', 'width': 2}
+}
+
+_HORIZONTAL_LEGEND = {'orientation': 'h', 'yanchor': 'bottom', 'y': 1.02, 'xanchor': 'right', 'x': 1}
+_VERTICAL_LEGEND = {'orientation': 'v', 'yanchor': 'middle', 'y': 0.5}
+_HEATMAP_COLORBAR = {'title': {'text': 'Risk Score'}}
+_HEATMAP_TEXTFONT = {'size': 10}
+_EMPTY_FONT = {'size': 16, 'color': 'gray'}
+_HIDDEN_AXIS = {'showgrid': False, 'showticklabels': False, 'zeroline': False}
+
+# Dashed neutral reference line for the sentiment trend
+_NEUTRAL_LINE = {
+    'type': 'line', 'xref': 'paper', 'x0': 0, 'x1': 1, 'yref': 'y', 'y0': 0.5, 'y1': 0.5,
+    'line': {'dash': 'dash', 'color': 'gray'}
+}
+_NEUTRAL_ANNOTATION = {
+    'text': 'Neutral', 'xref': 'paper', 'x': 1, 'xanchor': 'right',
+    'yref': 'y', 'y': 0.5, 'yanchor': 'bottom', 'showarrow': False
+}
+
+_SENTIMENT_COLORS = {
+    'very_negative': '#d32f2f',
+    'negative': '#f57c00',
+    'neutral': '#757575',
+    'positive': '#66bb6a',
+    'very_positive': '#388e3c'
+}
+
+
+def _display_labels(values: pd.Series, labels: Dict[str, str]) -> pd.Series:
+    """Map category values to title-cased display labels.
+    
+    Only distinct values missing from ``labels`` are formatted (and then
+    remembered), so repeated refreshes are a plain dict lookup per row.
+    
+    Args:
+        values: Column of category values
+        labels: Label cache for this kind of category
+        
+    Returns:
+        Column of display labels
+    """
+    for value in values.unique():
+        if isinstance(value, str) and value not in labels:
+            labels[value] = value.replace('_', ' ').title()
+    return values.map(labels)
+
 
 class ChartGenerator:
-    """Generate charts for dashboard."""
+    """Generate charts for dashboard.
+    
+    Figures are built as plain ``{"data": [...], "layout": {...}}`` dicts,
+    which ``dcc.Graph`` accepts directly, so no ``go.Figure`` object model
+    is constructed and torn down again for serialization.
+    """
     
     def __init__(self):
         """Initialize chart generator."""
@@ -17,395 +171,386 @@ class ChartGenerator:
         
         self.theme = dashboard_config.get('theme', 'plotly_white')
         self.colors = dashboard_config.get('color_scheme', {})
+        self.risk_colors = {
+            'critical': self.colors.get('critical', '#d32f2f'),
+            'high': self.colors.get('high', '#f57c00'),
+            'medium': self.colors.get('medium', '#fbc02d'),
+            'low': self.colors.get('low', '#388e3c')
+        }
+        self.max_points = dashboard_config.get('max_points', 1000)
+        
+        # Theme template as a plain dict, resolved once and shared by every figure
+        self.template = pio.templates[self.theme].to_plotly_json()
     
-    def create_sentiment_trend_chart(self, df: pd.DataFrame) -> go.Figure:
+    def _figure(self, data: List[Dict[str, Any]], **layout) -> Dict[str, Any]:
+        """Assemble a figure dict with the theme template applied.
+        
+        Args:
+            data: Trace dicts
+            **layout: Layout properties
+            
+        Returns:
+            Plotly figure dict
+        """
+        layout['template'] = self.template
+        return {'data': data, 'layout': layout}
+    
+    def create_sentiment_trend_chart(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Create sentiment trend line chart.
         
         Args:
             df: DataFrame with date and avg_sentiment columns
             
         Returns:
-            Plotly figure
+            Plotly figure dict
         """
-        if df.empty:
+        if df is None or not len(df):
             return self.create_empty_chart("No sentiment data available")
         
-        fig = go.Figure()
-        
-        fig.add_trace(go.Scatter(
-            x=df['date'],
-            y=df['avg_sentiment'],
-            mode='lines+markers',
-            name='Average Sentiment',
-            line=dict(color='#2E86AB', width=3),
-            marker=dict(size=8)
-        ))
-        
-        # Add reference line at 0.5 (neutral)
-        fig.add_hline(y=0.5, line_dash="dash", line_color="gray", 
-                      annotation_text="Neutral")
-        
-        fig.update_layout(
-            template=self.theme,
-            xaxis_title="Date",
-            yaxis_title="Sentiment Score",
-            yaxis_range=[0, 1],
+        x, y = _downsample(_iso_dates(df['date']), df['avg_sentiment'], self.max_points)
+        
+        trace = {
+            'type': 'scattergl',
+            'x': x,
+            'y': y,
+            'mode': 'lines+markers',
+            'name': 'Average Sentiment',
+            'line': _SENTIMENT_LINE,
+            'marker': _SENTIMENT_MARKER
+        }
+        
+        return self._figure(
+            [trace],
+            xaxis=_axis("Date"),
+            yaxis=_axis("Sentiment Score", [0, 1]),
+            # Reference line at 0.5 (neutral)
+            shapes=[_NEUTRAL_LINE],
+            annotations=[_NEUTRAL_ANNOTATION],
             hovermode='x unified',
             showlegend=False
         )
-        
-        return fig
     
-    def create_risk_distribution_chart(self, df: pd.DataFrame) -> go.Figure:
+    def create_risk_distribution_chart(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Create risk distribution pie chart.
         
         Args:
             df: DataFrame with risk_level and count columns
             
         Returns:
-            Plotly figure
+            Plotly figure dict
         """
-        if df.empty:
+        if df is None or not len(df):
             return self.create_empty_chart("No risk data available")
         
-        color_map = {
-            'critical': self.colors.get('critical', '#d32f2f'),
-            'high': self.colors.get('high', '#f57c00'),
-            'medium': self.colors.get('medium', '#fbc02d'),
-            'low': self.colors.get('low', '#388e3c')
-        }
-        
-        colors = [color_map.get(level, '#757575') for level in df['risk_level']]
+        colors = df['risk_level'].map(self.risk_colors).fillna(_DEFAULT_COLOR).to_numpy()
         
-        fig = go.Figure(data=[go.Pie(
-            labels=df['risk_level'].str.title(),
-            values=df['count'],
-            marker=dict(colors=colors),
-            hole=0.4,
-            textinfo='label+percent',
-            textposition='outside'
-        )])
+        trace = {
+            'type': 'pie',
+            'labels': _display_labels(df['risk_level'], _RISK_LABELS).to_numpy(),
+            'values': df['count'].to_numpy(),
+            'marker': {'colors': colors},
+            'hole': 0.4,
+            'textinfo': 'label+percent',
+            'textposition': 'outside'
+        }
         
-        fig.update_layout(
-            template=self.theme,
+        return self._figure(
+            [trace],
             showlegend=True,
-            legend=dict(orientation="v", yanchor="middle", y=0.5)
+            legend=_VERTICAL_LEGEND
         )
-        
-        return fig
     
-    def create_indicators_chart(self, df: pd.DataFrame) -> go.Figure:
+    def create_indicators_chart(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Create mental health indicators chart.
         
         Args:
             df: DataFrame with date and indicator columns
             
         Returns:
-            Plotly figure
+            Plotly figure dict
         """
-        if df.empty:
+        if df is None or not len(df):
             return self.create_empty_chart("No indicator data available")
         
-        fig = go.Figure()
-        
-        indicators = ['stress', 'anxiety', 'depression', 'burnout']
-        colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#FFA07A']
+        dates = _iso_dates(df['date'])
+        traces = []
         
-        for indicator, color in zip(indicators, colors):
+        for indicator, line in _INDICATOR_LINES.items():
             if indicator in df.columns:
-                fig.add_trace(go.Scatter(
-                    x=df['date'],
-                    y=df[indicator],
-                    mode='lines',
-                    name=indicator.title(),
-                    line=dict(color=color, width=2)
-                ))
-        
-        fig.update_layout(
-            template=self.theme,
-            xaxis_title="Date",
-            yaxis_title="Indicator Score",
-            yaxis_range=[0, 1],
+                x, y = _downsample(dates, df[indicator], self.max_points)
+                traces.append({
+                    'type': 'scattergl',
+                    'x': x,
+                    'y': y,
+                    'mode': 'lines',
+                    'name': indicator.title(),
+                    'line': line
+                })
+        
+        return self._figure(
+            traces,
+            xaxis=_axis("Date"),
+            yaxis=_axis("Indicator Score", [0, 1]),
             hovermode='x unified',
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+            legend=_HORIZONTAL_LEGEND
         )
-        
-        return fig
     
-    def create_sentiment_distribution_chart(self, df: pd.DataFrame) -> go.Figure:
+    def create_sentiment_distribution_chart(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Create sentiment distribution bar chart.
         
         Args:
             df: DataFrame with sentiment_label and count columns
             
         Returns:
-            Plotly figure
+            Plotly figure dict
         """
-        if df.empty:
+        if df is None or not len(df):
             return self.create_empty_chart("No sentiment data available")
         
-        color_map = {
-            'very_negative': '#d32f2f',
-            'negative': '#f57c00',
-            'neutral': '#757575',
-            'positive': '#66bb6a',
-            'very_positive': '#388e3c'
-        }
-        
-        colors = [color_map.get(label, '#757575') for label in df['sentiment_label']]
+        colors = df['sentiment_label'].map(_SENTIMENT_COLORS).fillna(_DEFAULT_COLOR).to_numpy()
+        counts = df['count'].to_numpy()
         
-        fig = go.Figure(data=[go.Bar(
-            x=df['sentiment_label'].str.replace('_', ' ').str.title(),
-            y=df['count'],
-            marker_color=colors,
-            text=df['count'],
-            textposition='outside'
-        )])
+        trace = {
+            'type': 'bar',
+            'x': _display_labels(df['sentiment_label'], _SENTIMENT_LABELS).to_numpy(),
+            'y': counts,
+            'marker': {'color': colors},
+            'text': counts,
+            'textposition': 'outside'
+        }
         
-        fig.update_layout(
-            template=self.theme,
-            xaxis_title="Sentiment",
-            yaxis_title="Count",
+        return self._figure(
+            [trace],
+            xaxis=_axis("Sentiment"),
+            yaxis=_axis("Count"),
             showlegend=False
         )
-        
-        return fig
     
-    def create_sentiment_by_source_chart(self, df: pd.DataFrame) -> go.Figure:
+    def create_sentiment_by_source_chart(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Create sentiment by source bar chart.
         
         Args:
             df: DataFrame with source and avg_sentiment columns
             
         Returns:
-            Plotly figure
+            Plotly figure dict
         """
-        if df.empty:
+        if df is None or not len(df):
             return self.create_empty_chart("No source data available")
         
-        fig = go.Figure(data=[go.Bar(
-            x=df['source'].str.title(),
-            y=df['avg_sentiment'],
-            marker_color='#2E86AB',
-            text=df['avg_sentiment'].round(2),
-            textposition='outside'
-        )])
-        
-        fig.update_layout(
-            template=self.theme,
-            xaxis_title="Data Source",
-            yaxis_title="Average Sentiment",
-            yaxis_range=[0, 1],
+        avg_sentiment = df['avg_sentiment'].to_numpy(dtype=float)
+        
+        trace = {
+            'type': 'bar',
+            'x': _display_labels(df['source'], _SOURCE_LABELS).to_numpy(),
+            'y': avg_sentiment,
+            'marker': {'color': '#2E86AB'},
+            'text': np.round(avg_sentiment, 2),
+            'textposition': 'outside'
+        }
+        
+        return self._figure(
+            [trace],
+            xaxis=_axis("Data Source"),
+            yaxis=_axis("Average Sentiment", [0, 1]),
             showlegend=False
         )
-        
-        return fig
     
-    def create_keyword_chart(self, df: pd.DataFrame) -> go.Figure:
+    def create_keyword_chart(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Create keyword frequency bar chart.
         
         Args:
             df: DataFrame with keyword and count columns
             
         Returns:
-            Plotly figure
+            Plotly figure dict
         """
-        if df.empty:
+        if df is None or not len(df):
             return self.create_empty_chart("No keyword data available")
         
-        fig = go.Figure(data=[go.Bar(
-            y=df['keyword'],
-            x=df['count'],
-            orientation='h',
-            marker_color='#FF6B6B',
-            text=df['count'],
-            textposition='outside'
-        )])
-        
-        fig.update_layout(
-            template=self.theme,
-            xaxis_title="Frequency",
-            yaxis_title="Keyword",
+        counts = df['count'].to_numpy()
+        
+        trace = {
+            'type': 'bar',
+            'y': df['keyword'].to_numpy(),
+            'x': counts,
+            'orientation': 'h',
+            'marker': {'color': '#FF6B6B'},
+            'text': counts,
+            'textposition': 'outside'
+        }
+        
+        return self._figure(
+            [trace],
+            xaxis=_axis("Frequency"),
+            yaxis=_axis("Keyword"),
             height=500,
             showlegend=False
         )
-        
-        return fig
     
-    def create_burnout_heatmap(self, df: pd.DataFrame) -> go.Figure:
+    def create_burnout_heatmap(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Create burnout risk heatmap.
         
         Args:
             df: DataFrame with date, user_id_hash, and burnout_risk_score
             
         Returns:
-            Plotly figure
+            Plotly figure dict
         """
-        if df.empty:
+        if df is None or not len(df):
             return self.create_empty_chart("No burnout data available")
         
-        # Pivot data for heatmap
-        pivot = df.pivot_table(
-            index='user_id_hash',
-            columns='date',
-            values='burnout_risk_score',
-            aggfunc='mean'
-        )
+        # Pivot data for heatmap (user x date, mean score per cell)
+        pivot = df.groupby(['user_id_hash', 'date'])['burnout_risk_score'].mean().unstack()
         
-        # Limit to top 20 users by average risk
+        # Limit to top 20 users by risk on the latest date
         if len(pivot) > 20:
-            pivot = pivot.nlargest(20, pivot.columns[-1])
+            latest = np.nan_to_num(pivot.iloc[:, -1].to_numpy(), nan=-np.inf)
+            top = np.argpartition(-latest, 20)[:20]
+            pivot = pivot.iloc[top[np.argsort(-latest[top], kind='stable')]]
+        
+        z = pivot.to_numpy(copy=False)
+        text = np.round(z, 2)
         
         # Anonymize user IDs for display
-        pivot.index = [f"User {i+1}" for i in range(len(pivot))]
-        
-        fig = go.Figure(data=go.Heatmap(
-            z=pivot.values,
-            x=pivot.columns,
-            y=pivot.index,
-            colorscale='RdYlGn_r',
-            zmid=0.5,
-            text=pivot.values.round(2),
-            texttemplate='%{text}',
-            textfont={"size": 10},
-            colorbar=dict(title="Risk Score")
-        ))
-        
-        fig.update_layout(
-            template=self.theme,
-            xaxis_title="Date",
-            yaxis_title="User",
+        users = [f"User {i+1}" for i in range(len(pivot))]
+        
+        trace = {
+            'type': 'heatmap',
+            'z': z,
+            'x': _iso_dates(pivot.columns.to_series()).to_numpy(),
+            'y': users,
+            'colorscale': 'RdYlGn_r',
+            'zmid': 0.5,
+            'text': text,
+            'texttemplate': '%{text}',
+            'textfont': _HEATMAP_TEXTFONT,
+            'colorbar': _HEATMAP_COLORBAR
+        }
+        
+        return self._figure(
+            [trace],
+            xaxis=_axis("Date"),
+            yaxis=_axis("User"),
             height=600
         )
-        
-        return fig
     
-    def create_risk_score_distribution(self, df: pd.DataFrame) -> go.Figure:
+    def create_risk_score_distribution(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Create risk score histogram.
         
         Args:
             df: DataFrame with burnout_risk_score column
             
         Returns:
-            Plotly figure
+            Plotly figure dict
         """
-        if df.empty:
+        if df is None or not len(df):
             return self.create_empty_chart("No risk score data available")
         
-        fig = go.Figure(data=[go.Histogram(
-            x=df['burnout_risk_score'],
-            nbinsx=20,
-            marker_color='#FF6B6B',
-            opacity=0.7
-        )])
-        
-        fig.update_layout(
-            template=self.theme,
-            xaxis_title="Burnout Risk Score",
-            yaxis_title="Frequency",
+        trace = {
+            'type': 'histogram',
+            'x': df['burnout_risk_score'].to_numpy(),
+            'nbinsx': 20,
+            'marker': {'color': '#FF6B6B'},
+            'opacity': 0.7
+        }
+        
+        return self._figure(
+            [trace],
+            xaxis=_axis("Burnout Risk Score"),
+            yaxis=_axis("Frequency"),
             showlegend=False
         )
-        
-        return fig
     
-    def create_contributing_factors_chart(self, df: pd.DataFrame) -> go.Figure:
+    def create_contributing_factors_chart(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Create contributing factors bar chart.
         
         Args:
             df: DataFrame with factor_name and avg_importance columns
             
         Returns:
-            Plotly figure
+            Plotly figure dict
         """
-        if df.empty:
+        if df is None or not len(df):
             return self.create_empty_chart("No factor data available")
         
-        fig = go.Figure(data=[go.Bar(
-            y=df['factor_name'].str.replace('_', ' ').str.title(),
-            x=df['avg_importance'],
-            orientation='h',
-            marker_color='#4ECDC4',
-            text=df['avg_importance'].round(3),
-            textposition='outside'
-        )])
-        
-        fig.update_layout(
-            template=self.theme,
-            xaxis_title="Importance Score",
-            yaxis_title="Factor",
+        importance = df['avg_importance'].to_numpy(dtype=float)
+        
+        trace = {
+            'type': 'bar',
+            'y': _display_labels(df['factor_name'], _FACTOR_LABELS).to_numpy(),
+            'x': importance,
+            'orientation': 'h',
+            'marker': {'color': '#4ECDC4'},
+            'text': np.round(importance, 3),
+            'textposition': 'outside'
+        }
+        
+        return self._figure(
+            [trace],
+            xaxis=_axis("Importance Score"),
+            yaxis=_axis("Factor"),
             showlegend=False
         )
-        
-        return fig
     
-    def create_alert_timeline_chart(self, df: pd.DataFrame) -> go.Figure:
+    def create_alert_timeline_chart(self, df: pd.DataFrame) -> Dict[str, Any]:
         """Create alert timeline stacked bar chart.
         
         Args:
             df: DataFrame with date, severity, and count columns
             
         Returns:
-            Plotly figure
+            Plotly figure dict
         """
-        if df.empty:
+        if df is None or not len(df):
             return self.create_empty_chart("No alert data available")
         
-        fig = go.Figure()
-        
         severities = ['critical', 'high', 'medium', 'low']
-        colors = {
-            'critical': self.colors.get('critical', '#d32f2f'),
-            'high': self.colors.get('high', '#f57c00'),
-            'medium': self.colors.get('medium', '#fbc02d'),
-            'low': self.colors.get('low', '#388e3c')
-        }
+        groups = dict(iter(df.groupby('severity', sort=False)))
+        traces = []
         
         for severity in severities:
-            severity_data = df[df['severity'] == severity]
-            if not severity_data.empty:
-                fig.add_trace(go.Bar(
-                    x=severity_data['date'],
-                    y=severity_data['count'],
-                    name=severity.title(),
-                    marker_color=colors.get(severity, '#757575')
-                ))
-        
-        fig.update_layout(
-            template=self.theme,
-            xaxis_title="Date",
-            yaxis_title="Alert Count",
+            severity_data = groups.get(severity)
+            if severity_data is not None and len(severity_data):
+                traces.append({
+                    'type': 'bar',
+                    'x': _iso_dates(severity_data['date']).to_numpy(),
+                    'y': severity_data['count'].to_numpy(),
+                    'name': severity.title(),
+                    'marker': {'color': self.risk_colors.get(severity, _DEFAULT_COLOR)}
+                })
+        
+        return self._figure(
+            traces,
+            xaxis=_axis("Date"),
+            yaxis=_axis("Alert Count"),
             barmode='stack',
             hovermode='x unified',
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+            legend=_HORIZONTAL_LEGEND
         )
-        
-        return fig
     
-    def create_empty_chart(self, message: str = "No data available") -> go.Figure:
+    def create_empty_chart(self, message: str = "No data available") -> Dict[str, Any]:
         """Create empty chart with message.
         
         Args:
             message: Message to display
             
         Returns:
-            Empty Plotly figure
+            Empty Plotly figure dict
         """
-        fig = go.Figure()
-        
-        fig.add_annotation(
-            text=message,
-            xref="paper",
-            yref="paper",
-            x=0.5,
-            y=0.5,
-            showarrow=False,
-            font=dict(size=16, color="gray")
-        )
+        annotation = {
+            'text': message,
+            'xref': 'paper',
+            'yref': 'paper',
+            'x': 0.5,
+            'y': 0.5,
+            'showarrow': False,
+            'font': _EMPTY_FONT
+        }
         
-        fig.update_layout(
-            template=self.theme,
-            xaxis=dict(showgrid=False, showticklabels=False, zeroline=False),
-            yaxis=dict(showgrid=False, showticklabels=False, zeroline=False)
+        return self._figure(
+            [],
+            annotations=[annotation],
+            xaxis=_HIDDEN_AXIS,
+            yaxis=_HIDDEN_AXIS
         )
-        
-        return fig
@@ -1,21 +1,749 @@
 """Data provider for dashboard queries."""
 
+import functools
 import json
-from collections import Counter
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
-from datetime import datetime
-from typing import Dict, Any, List
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Any, Iterable, List, Optional, Sequence, Tuple
 from src.etl.loaders.database_loader import get_loader
+from src.utils.config_loader import get_config
+from src.utils.date_utils import day_bounds
 from src.utils.logger import log
 
+try:
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
+try:
+    import pyarrow  # noqa: F401
+    # Arrow-backed strings: lowercasing and value_counts run in Arrow compute kernels
+    _STRING_DTYPE = 'string[pyarrow]'
+except ImportError:
+    _STRING_DTYPE = 'string'
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+# Bundle queries are independent and I/O-bound; run them side by side
+_BUNDLE_WORKERS = 5
+
+
+def _parse_to_list(val: Any) -> List[Any]:
+    """Parse a stored keyword cell into a list of keywords.
+    
+    Args:
+        val: A list, a JSON array string, or a comma-separated string
+        
+    Returns:
+        List of keywords (empty for anything else)
+    """
+    if isinstance(val, list):
+        return val
+    if not isinstance(val, str):
+        return []
+    try:
+        parsed = _loads(val)
+    except Exception:
+        parsed = None
+    if isinstance(parsed, list):
+        return parsed
+    # Fallback: comma-separated string
+    return [p.strip() for p in val.split(',') if p.strip()]
+
+
+_INDICATOR_KEYS = ('stress_score', 'anxiety_score', 'depression_score', 'burnout_score')
+_INDICATOR_COLUMNS = ['stress', 'anxiety', 'depression', 'burnout']
+
+# Marker on results returned in place of data after a failed query;
+# _ttl_cached and the callbacks' memos skip results carrying it
+_QUERY_FAILED = 'query_failed'
+
+# Empty results with the columns the charts expect; returned as copies
+_EMPTY_INDICATORS = pd.DataFrame({
+    'date': pd.Series([], dtype=_STRING_DTYPE),
+    **{column: pd.Series([], dtype='float64') for column in _INDICATOR_COLUMNS}
+})
+_EMPTY_KEYWORDS = pd.DataFrame({
+    'keyword': pd.Series([], dtype=_STRING_DTYPE),
+    'count': pd.Series([], dtype='int64')
+})
+
+# Trend columns are declared rather than inferred from the values
+_TREND_DTYPES = {'avg_sentiment': 'float32', 'post_count': 'int32'}
+
+# Days still open to late ETL loads; earlier days of the trend are kept
+# between refreshes instead of being re-queried
+_TREND_OPEN_DAYS = 2
+
+# Date ranges whose closed trend days are kept
+_TREND_HISTORY_SIZE = 8
+
+# Seconds before kept trend days are re-queried even if their row count held
+_TREND_HISTORY_TTL = 15 * 60
+
+# Rows per fetch when the Python fallbacks stream a result set
+_CHUNK_ROWS = 10000
+
+
+def _group_sums_numpy(codes: np.ndarray, vals: np.ndarray, ngroups: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Per-group column sums and row counts of vals using bincount.
+    
+    Args:
+        codes: Group code per row (0..ngroups-1)
+        vals: 2D array of values, one row per code
+        ngroups: Number of groups
+        
+    Returns:
+        Tuple of (sums of shape (ngroups, vals.shape[1]), counts of shape (ngroups,))
+    """
+    counts = np.bincount(codes, minlength=ngroups).astype(np.float64)
+    sums = np.stack(
+        [np.bincount(codes, weights=vals[:, j], minlength=ngroups) for j in range(vals.shape[1])],
+        axis=1
+    )
+    return sums, counts
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _group_sums(codes, vals, ngroups):
+        """Per-group column sums and row counts of vals, one column per thread."""
+        counts = np.zeros(ngroups)
+        for i in range(codes.shape[0]):
+            counts[codes[i]] += 1
+        sums = np.zeros((ngroups, vals.shape[1]))
+        for j in prange(vals.shape[1]):
+            for i in range(codes.shape[0]):
+                sums[codes[i], j] += vals[i, j]
+        return sums, counts
+else:
+    _group_sums = _group_sums_numpy
+
+
+def _indicator_sums(df: pd.DataFrame) -> pd.DataFrame:
+    """Sum indicator scores per date from raw JSON rows.
+    
+    Cells that are not a JSON object, or scores that are missing, count as 0.
+    
+    Args:
+        df: DataFrame with date and mental_health_indicators columns
+        
+    Returns:
+        DataFrame indexed by date with one sum column per indicator plus row count n
+    """
+    vals = np.zeros((len(df), len(_INDICATOR_KEYS)), dtype=np.float32)
+    for i, val in enumerate(df['mental_health_indicators']):
+        if isinstance(val, str) and val:
+            try:
+                val = _loads(val)
+            except Exception:
+                continue
+        if not isinstance(val, dict):
+            continue
+        for j, key in enumerate(_INDICATOR_KEYS):
+            try:
+                vals[i, j] = float(val.get(key) or 0)
+            except (TypeError, ValueError):
+                pass
+    
+    codes, dates = pd.factorize(df['date'])
+    sums, counts = _group_sums(codes.astype(np.int32), vals, len(dates))
+    out = pd.DataFrame(sums, index=dates, columns=_INDICATOR_COLUMNS)
+    out['n'] = counts
+    return out
+
+
+def _indicator_means(chunks: Iterable[pd.DataFrame]) -> pd.DataFrame:
+    """Average indicator scores per date, accumulating chunk by chunk.
+    
+    Python fallback for databases without JSON functions. Only per-date
+    sums are kept between chunks, so memory does not grow with the range.
+    
+    Args:
+        chunks: DataFrames with date and mental_health_indicators columns
+        
+    Returns:
+        DataFrame with date, stress, anxiety, depression and burnout columns
+    """
+    total = None
+    for chunk in chunks:
+        if chunk.empty:
+            continue
+        part = _indicator_sums(chunk)
+        total = part if total is None else total.add(part, fill_value=0)
+    if total is None:
+        return pd.DataFrame()
+    
+    total = total.sort_index()
+    out = total[_INDICATOR_COLUMNS].div(total['n'], axis=0)
+    out.index.name = 'date'
+    return out.reset_index()
+
+
+def _factor_sums(df: pd.DataFrame) -> pd.DataFrame:
+    """Sum importance per factor name from raw contributing_factors rows.
+    
+    Factors are flattened into parallel name/score arrays, names are
+    interned to integer codes, and the scores are summed per code.
+    
+    Args:
+        df: DataFrame with a contributing_factors column
+        
+    Returns:
+        DataFrame indexed by factor name with importance sum and count n
+    """
+    names = []
+    scores = []
+    for val in df['contributing_factors']:
+        if isinstance(val, str) and val:
+            try:
+                val = _loads(val)
+            except Exception:
+                continue
+        if not isinstance(val, list):
+            continue
+        for factor in val:
+            if not isinstance(factor, dict):
+                continue
+            name = factor.get('factor_name') or factor.get('name')
+            if not name:
+                continue
+            try:
+                score = float(factor.get('importance_score') or factor.get('importance') or 0)
+            except (TypeError, ValueError):
+                score = 0.0
+            names.append(name)
+            scores.append(score)
+    
+    codes, factors = pd.factorize(pd.Series(names, dtype=object))
+    sums, counts = _group_sums(
+        codes.astype(np.int32), np.asarray(scores, dtype=np.float64).reshape(-1, 1), len(factors)
+    )
+    return pd.DataFrame({'importance': sums[:, 0], 'n': counts}, index=factors)
+
+
+def _factor_means(chunks: Iterable[pd.DataFrame]) -> pd.DataFrame:
+    """Average importance per factor, accumulating chunk by chunk, top 10.
+    
+    Python fallback for databases without JSON functions.
+    
+    Args:
+        chunks: DataFrames with a contributing_factors column
+        
+    Returns:
+        DataFrame with factor_name and avg_importance columns
+    """
+    total = None
+    for chunk in chunks:
+        if chunk.empty:
+            continue
+        part = _factor_sums(chunk)
+        total = part if total is None else total.add(part, fill_value=0)
+    if total is None or total.empty:
+        return pd.DataFrame()
+    
+    top = (total['importance'] / total['n']).nlargest(10)
+    return pd.DataFrame({
+        'factor_name': top.index.to_numpy(dtype=object),
+        'avg_importance': top.to_numpy()
+    })
+
+
+def _keyword_counts(df: pd.DataFrame) -> pd.Series:
+    """Count lowercased keywords in one frame of keywords_detected cells.
+    
+    Args:
+        df: DataFrame with a keywords_detected column
+        
+    Returns:
+        Series of counts indexed by keyword
+    """
+    keywords = (
+        df['keywords_detected'].map(_parse_to_list)
+        .explode()
+        .dropna()
+        .astype(str)
+        .astype(_STRING_DTYPE)
+        .str.lower()
+    )
+    return keywords[keywords != ''].value_counts()
+
+
+# SQL for the filterable queries, built once per filter shape so repeated
+# calls hand the driver the identical string and hit its statement cache
+@functools.lru_cache(maxsize=32)
+def _sentiment_trend_sql(n_sources: int, use_rollup: bool) -> str:
+    """Sentiment trend query for a given number of source filters.
+    
+    Args:
+        n_sources: Number of ``?`` placeholders in the source filter (0 = no filter)
+        use_rollup: Read daily_sentiment_rollup instead of joining the raw tables
+        
+    Returns:
+        SQL string taking start, end and then the sources as parameters
+    """
+    placeholders = ', '.join(['?'] * n_sources)
+    if use_rollup:
+        # Pre-aggregated per day and source by the ETL
+        sources_filter = f"AND source IN ({placeholders})" if n_sources else ""
+        return f"""
+        SELECT
+            date,
+            SUM(avg_sentiment * post_count) / SUM(post_count) as avg_sentiment,
+            SUM(post_count) as post_count
+        FROM daily_sentiment_rollup
+        WHERE date >= ? AND date < ?
+            {sources_filter}
+        GROUP BY date
+        ORDER BY date
+        """
+    sources_filter = f"AND r.source IN ({placeholders})" if n_sources else ""
+    return f"""
+    SELECT
+        substr(p.timestamp, 1, 10) as date,
+        AVG(p.sentiment_score) as avg_sentiment,
+        COUNT(*) as post_count
+    FROM processed_sentiment_data p
+    JOIN raw_sentiment_data r ON p.record_id = r.record_id
+    WHERE p.timestamp >= ? AND p.timestamp < ?
+        {sources_filter}
+    GROUP BY date
+    ORDER BY date
+    """
+
+
+@functools.lru_cache(maxsize=2)
+def _key_metrics_sql(approx_distinct: bool) -> str:
+    """Key metrics query: one round trip, each table scanned once for the date window.
+    
+    Args:
+        approx_distinct: Count users with APPROX_COUNT_DISTINCT (HyperLogLog)
+            instead of an exact COUNT(DISTINCT); for engines that have it
+            
+    Returns:
+        SQL string taking the start and end bounds three times as parameters
+    """
+    if approx_distinct:
+        distinct_users = "APPROX_COUNT_DISTINCT(user_id_hash)"
+    else:
+        distinct_users = "COUNT(DISTINCT user_id_hash)"
+    return f"""
+    WITH psd AS (
+        SELECT user_id_hash, sentiment_score
+        FROM processed_sentiment_data
+        WHERE timestamp >= ? AND timestamp < ?
+    ),
+    bp AS (
+        SELECT user_id_hash
+        FROM burnout_predictions
+        WHERE prediction_date >= ? AND prediction_date < ?
+            AND risk_level IN ('high', 'critical')
+    ),
+    ah AS (
+        SELECT status
+        FROM alert_history
+        WHERE alert_timestamp >= ? AND alert_timestamp < ?
+    )
+    SELECT
+        (SELECT {distinct_users} FROM psd) AS total_users,
+        (SELECT {distinct_users} FROM bp) AS high_risk_users,
+        (SELECT AVG(sentiment_score) FROM psd) AS avg_sentiment,
+        (SELECT COUNT(*) FROM ah WHERE status = 'sent') AS active_alerts
+    """
+
+
+@functools.lru_cache(maxsize=4)
+def _risk_distribution_sql(filter_risk: bool, use_rollup: bool) -> str:
+    """Risk distribution query, optionally filtered to one risk level."""
+    risk_filter = "AND risk_level = ?" if filter_risk else ""
+    if use_rollup:
+        # The rollup stores each level's severity rank, so no per-group CASE
+        return f"""
+        SELECT
+            risk_level,
+            SUM(prediction_count) as count
+        FROM daily_risk_rollup
+        WHERE date >= ? AND date < ?
+            {risk_filter}
+        GROUP BY risk_level_ord, risk_level
+        ORDER BY risk_level_ord
+        """
+    return f"""
+    SELECT
+        risk_level,
+        COUNT(*) as count
+    FROM burnout_predictions
+    WHERE prediction_date >= ? AND prediction_date < ?
+        {risk_filter}
+    GROUP BY risk_level
+    ORDER BY
+        CASE risk_level
+            WHEN 'critical' THEN 1
+            WHEN 'high' THEN 2
+            WHEN 'medium' THEN 3
+            WHEN 'low' THEN 4
+        END
+    """
+
+
+@functools.lru_cache(maxsize=4)
+def _sentiment_distribution_sql(filter_label: bool, use_rollup: bool) -> str:
+    """Sentiment label distribution query, optionally filtered to one label."""
+    sentiment_filter = "AND sentiment_label = ?" if filter_label else ""
+    if use_rollup:
+        source, count, date = "daily_sentiment_rollup", "SUM(post_count)", "date"
+    else:
+        source, count, date = "processed_sentiment_data", "COUNT(*)", "timestamp"
+    return f"""
+    SELECT
+        sentiment_label,
+        {count} as count
+    FROM {source}
+    WHERE {date} >= ? AND {date} < ?
+        {sentiment_filter}
+    GROUP BY sentiment_label
+    """
+
+
+# Highest-risk users kept per day in the heatmap
+_HEATMAP_USERS_PER_DAY = 50
+
+
+@functools.lru_cache(maxsize=2)
+def _heatmap_sql(filter_risk: bool) -> str:
+    """Burnout heatmap query, optionally filtered to one risk level.
+    
+    Keeps the highest-risk users of each day, so the row limit drops the
+    oldest days rather than most of every day, and only each day's top
+    rows reach the final sort.
+    """
+    risk_filter = "AND risk_level = ?" if filter_risk else ""
+    return f"""
+    SELECT date, user_id_hash, burnout_risk_score, risk_level
+    FROM (
+        SELECT
+            prediction_date as date,
+            user_id_hash,
+            burnout_risk_score,
+            risk_level,
+            ROW_NUMBER() OVER (
+                PARTITION BY DATE(prediction_date)
+                ORDER BY burnout_risk_score DESC
+            ) as day_rank
+        FROM burnout_predictions
+        WHERE prediction_date >= ? AND prediction_date < ?
+            {risk_filter}
+    )
+    WHERE day_rank <= {_HEATMAP_USERS_PER_DAY}
+    ORDER BY date DESC, burnout_risk_score DESC
+    LIMIT 1000
+    """
+
+
+# DuckDB versions of the JSON-heavy queries, run against the attached SQLite file
+_DUCKDB_SQL = {
+    'indicators': """
+    SELECT
+        substr(timestamp, 1, 10) AS date,
+        AVG(COALESCE(TRY_CAST(json_extract_string(ind, '$.stress_score') AS DOUBLE), 0)) AS stress,
+        AVG(COALESCE(TRY_CAST(json_extract_string(ind, '$.anxiety_score') AS DOUBLE), 0)) AS anxiety,
+        AVG(COALESCE(TRY_CAST(json_extract_string(ind, '$.depression_score') AS DOUBLE), 0)) AS depression,
+        AVG(COALESCE(TRY_CAST(json_extract_string(ind, '$.burnout_score') AS DOUBLE), 0)) AS burnout
+    FROM (
+        SELECT
+            timestamp,
+            CASE
+                WHEN json_valid(mental_health_indicators)
+                    AND json_type(mental_health_indicators) = 'OBJECT'
+                THEN mental_health_indicators
+            END AS ind
+        FROM s.processed_sentiment_data
+        WHERE timestamp >= ? AND timestamp < ?
+    )
+    GROUP BY 1
+    ORDER BY 1
+    """,
+    'keywords': """
+    SELECT keyword, COUNT(*) AS count
+    FROM (
+        SELECT lower(trim(UNNEST(
+            CASE
+                WHEN json_valid(keywords_detected) AND json_type(keywords_detected) = 'ARRAY'
+                THEN json_extract_string(keywords_detected, '$[*]')
+                ELSE string_split(keywords_detected, ',')
+            END
+        ))) AS keyword
+        FROM s.processed_sentiment_data
+        WHERE timestamp >= ? AND timestamp < ?
+    )
+    WHERE keyword <> ''
+    GROUP BY keyword
+    ORDER BY count DESC
+    LIMIT 20
+    """,
+    'factors': """
+    SELECT factor_name, AVG(importance) AS avg_importance
+    FROM (
+        SELECT
+            COALESCE(
+                NULLIF(json_extract_string(factor, '$.factor_name'), ''),
+                NULLIF(json_extract_string(factor, '$.name'), '')
+            ) AS factor_name,
+            COALESCE(
+                NULLIF(TRY_CAST(json_extract_string(factor, '$.importance_score') AS DOUBLE), 0),
+                NULLIF(TRY_CAST(json_extract_string(factor, '$.importance') AS DOUBLE), 0),
+                0
+            ) AS importance
+        FROM (
+            SELECT UNNEST(json_extract(contributing_factors, '$[*]')) AS factor
+            FROM s.burnout_predictions
+            WHERE prediction_date >= ? AND prediction_date < ?
+                AND json_valid(contributing_factors)
+                AND json_type(contributing_factors) = 'ARRAY'
+        )
+        WHERE json_type(factor) = 'OBJECT'
+    )
+    WHERE factor_name IS NOT NULL
+    GROUP BY factor_name
+    ORDER BY avg_importance DESC
+    LIMIT 10
+    """,
+}
+
+
+def _connect_duckdb(db_path: str):
+    """Open an in-memory DuckDB connection with the SQLite file attached as ``s``.
+    
+    Only loads the sqlite extension: installing it downloads it, so that is a
+    deploy step (``python -c "import duckdb; duckdb.execute('INSTALL sqlite')"``)
+    rather than something to do on dashboard start.
+    
+    Args:
+        db_path: Path to the SQLite database
+        
+    Returns:
+        DuckDB connection
+        
+    Raises:
+        ImportError: If duckdb is not installed
+        duckdb.Error: If the sqlite extension is not installed or the file
+            cannot be attached
+    """
+    import duckdb
+    conn = duckdb.connect()
+    try:
+        conn.execute("LOAD sqlite")
+        path = db_path.replace("'", "''")
+        conn.execute(f"ATTACH '{path}' AS s (TYPE SQLITE, READ_ONLY)")
+    except Exception:
+        conn.close()
+        raise
+    log.info(f"Attached {db_path} to DuckDB for dashboard aggregations")
+    return conn
+
+
+def _failed(result: Any) -> Any:
+    """Mark a getter's fallback result as coming from a failed query.
+    
+    The dashboard's caches skip marked results, so a transient error (e.g.
+    the database being locked during an ETL write) is retried on the next
+    refresh instead of being served until the cache expires.
+    
+    Args:
+        result: Empty DataFrame or default dict returned in place of data
+        
+    Returns:
+        The result, marked with ``_QUERY_FAILED``
+    """
+    if isinstance(result, pd.DataFrame):
+        result = result.copy(deep=False)
+        result.attrs[_QUERY_FAILED] = True
+    else:
+        result[_QUERY_FAILED] = True
+    return result
+
+
+def _cache_key_part(value: Any) -> Any:
+    """Make a method argument hashable and order-insensitive for cache keys."""
+    if isinstance(value, (list, tuple, set)):
+        return tuple(sorted(value, key=str))
+    return value
+
+
+def _shallow_copy(result: Any) -> Any:
+    """Copy a cached result without duplicating its column data."""
+    if isinstance(result, pd.DataFrame):
+        return result.copy(deep=False)
+    return result.copy()
+
+
+def _ttl_cached(method: Callable) -> Callable:
+    """Cache a provider method's result per arguments for ``self._cache_ttl`` seconds.
+    
+    List arguments (e.g. sources) are keyed as sorted tuples, so the same
+    selection in a different order hits the same entry. Callers get a
+    shallow copy: adding or replacing columns never touches the cached frame.
+    Results marked by ``_failed`` are not cached, so the next call retries.
+    
+    Args:
+        method: Provider method to wrap
+        
+    Returns:
+        Wrapped method
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (
+            method.__name__,
+            tuple(_cache_key_part(a) for a in args),
+            tuple(sorted((k, _cache_key_part(v)) for k, v in kwargs.items()))
+        )
+        now = time.monotonic()
+        with self._cache_lock:
+            hit = self._cache.get(key)
+        if hit is not None and now - hit[0] < self._cache_ttl:
+            return _shallow_copy(hit[1])
+        
+        result = method(self, *args, **kwargs)
+        if _is_failed(result):
+            return result
+        with self._cache_lock:
+            self._cache[key] = (now, result)
+            if len(self._cache) > self._cache_size:
+                # Drop expired entries, then the oldest if still full
+                self._cache = {
+                    k: v for k, v in self._cache.items() if now - v[0] < self._cache_ttl
+                }
+                while len(self._cache) > self._cache_size:
+                    self._cache.pop(next(iter(self._cache)))
+        return _shallow_copy(result)
+    
+    return wrapper
+
+
+def _is_failed(result: Any) -> bool:
+    """Whether a getter's result was marked by ``_failed``."""
+    if isinstance(result, pd.DataFrame):
+        return bool(result.attrs.get(_QUERY_FAILED))
+    return isinstance(result, dict) and bool(result.get(_QUERY_FAILED))
+
 
 class DashboardDataProvider:
     """Provide data for dashboard visualizations."""
     
     def __init__(self):
         """Initialize data provider."""
-        self.loader = get_loader()
+        # Opened on first query, so building the provider costs no connection
+        self._loader = None
+        self._loader_lock = threading.Lock()
+        
+        # Short-lived result cache so tab switches and refreshes skip SQL.
+        # The callbacks' memo sits on top of it, so each layer gets half of
+        # cache_timeout and a result is never older than cache_timeout.
+        dashboard_config = get_config().get_dashboard_config()
+        self._cache_ttl = dashboard_config.get('cache_timeout', 60) / 2
+        self._cache_size = 256
+        self._cache: Dict[tuple, Tuple[float, Any]] = {}
+        self._cache_lock = threading.Lock()
+        
+        # Per range start: (first day not covered, per-source trend rows of
+        # closed days, their row count when stored, monotonic time stored)
+        self._trend_history: Dict[str, Tuple[str, pd.DataFrame, int, float]] = {}
+        self._trend_history_lock = threading.Lock()
+        
+        # Optional DuckDB engine for the JSON/aggregation-heavy queries
+        self._duck = None
+        if dashboard_config.get('analytics_engine', 'sqlite') == 'duckdb':
+            db_path = getattr(self.loader, 'db_path', None)
+            if db_path is None:
+                log.warning("DuckDB analytics engine needs the SQLite warehouse, using default queries")
+            else:
+                try:
+                    self._duck = _connect_duckdb(db_path)
+                except ImportError:
+                    log.warning("duckdb not installed, using SQLite for dashboard aggregations")
+                except Exception as e:
+                    log.warning(
+                        f"Could not attach SQLite file to DuckDB ({e}); is the sqlite "
+                        "extension installed? Using SQLite"
+                    )
+    
+    @property
+    def loader(self):
+        """Database loader, created on first use."""
+        if self._loader is None:
+            with self._loader_lock:
+                if self._loader is None:
+                    self._loader = get_loader()
+        return self._loader
+    
+    def _has_rollup(self, name: str) -> bool:
+        """Whether the loader maintains the given daily rollup table."""
+        return name in getattr(self.loader, 'rollups', ())
+    
+    def _duck_query(self, name: str, params: Sequence[Any]) -> Optional[pd.DataFrame]:
+        """Run one of the DuckDB queries, if the DuckDB engine is enabled.
+        
+        Args:
+            name: Key into _DUCKDB_SQL
+            params: Query parameters
+            
+        Returns:
+            Query results, or None if DuckDB is disabled or the query failed
+        """
+        if self._duck is None:
+            return None
+        try:
+            # A cursor per call: DuckDB connections are not shared across threads
+            return self._duck.cursor().execute(_DUCKDB_SQL[name], list(params)).df()
+        except Exception as e:
+            log.warning(f"DuckDB {name} query failed ({e}), falling back to SQLite")
+            return None
     
+    def _query_row(self, sql: str, params: Sequence[Any]) -> Dict[str, Any]:
+        """Fetch the first row of a query as a dict.
+        
+        Single-row aggregates skip DataFrame construction when the loader
+        can return the row directly.
+        
+        Args:
+            sql: SQL query
+            params: Query parameters
+            
+        Returns:
+            Column-to-value dict (empty if there are no rows)
+        """
+        query_row = getattr(self.loader, 'query_row', None)
+        if query_row is None:
+            df = self.loader.query(sql, params)
+            return df.iloc[0].to_dict() if not df.empty else {}
+        return query_row(sql, params) or {}
+    
+    def _query_chunks(self, sql: str, params: Sequence[Any]) -> Iterable[pd.DataFrame]:
+        """Stream a query's results in _CHUNK_ROWS-sized frames.
+        
+        Loaders without chunked reads return the whole result as one frame.
+        
+        Args:
+            sql: SQL query
+            params: Query parameters
+            
+        Returns:
+            Iterable of DataFrames
+        """
+        query_chunks = getattr(self.loader, 'query_chunks', None)
+        if query_chunks is None:
+            return [self.loader.query(sql, params)]
+        return query_chunks(sql, params, chunksize=_CHUNK_ROWS)
+    
+    @_ttl_cached
     def get_key_metrics(self, start_date: str, end_date: str) -> Dict[str, Any]:
         """Get key metrics for overview.
         
@@ -26,34 +754,64 @@ class DashboardDataProvider:
         Returns:
             Dictionary of metrics
         """
+        approx = getattr(self.loader, 'dialect', 'sqlite') == 'bigquery'
+        sql = _key_metrics_sql(approx)
+        params = day_bounds(start_date, end_date) * 3
+        
         try:
-            # Total users
-            total_users = self._query_total_users(start_date, end_date)
-            
-            # High risk users
-            high_risk = self._query_high_risk_users(start_date, end_date)
-            
-            # Average sentiment
-            avg_sentiment = self._query_avg_sentiment(start_date, end_date)
-            
-            # Active alerts
-            active_alerts = self._query_active_alerts(start_date, end_date)
-            
+            row = self._query_row(sql, params)
+            avg_sentiment = row.get('avg_sentiment')
             return {
-                'total_users': total_users,
-                'high_risk_users': high_risk,
-                'avg_sentiment': avg_sentiment,
-                'active_alerts': active_alerts
+                'total_users': int(row.get('total_users') or 0),
+                'high_risk_users': int(row.get('high_risk_users') or 0),
+                'avg_sentiment': float(avg_sentiment) if pd.notna(avg_sentiment) else 0.0,
+                'active_alerts': int(row.get('active_alerts') or 0)
             }
         except Exception as e:
             log.error(f"Error getting key metrics: {str(e)}")
-            return {
+            return _failed({
                 'total_users': 0,
                 'high_risk_users': 0,
                 'avg_sentiment': 0,
                 'active_alerts': 0
+            })
+    
+    def get_date_range_bundle(self, start_date: str, end_date: str) -> Dict[str, Any]:
+        """Get everything the overview and sentiment tabs derive from one date range.
+        
+        The frames are unfiltered, so the risk, sentiment and source
+        dropdowns can be applied to them without another query. The
+        queries run concurrently, so the bundle arrives in the time of the
+        slowest query rather than the sum of all of them.
+        
+        Args:
+            start_date: Start date
+            end_date: End date
+            
+        Returns:
+            Dictionary with metrics, sentiment_trend (per day and source),
+            risk_distribution, sentiment_distribution and indicators
+        """
+        # Scoped to the call so no worker threads outlive it
+        with ThreadPoolExecutor(max_workers=_BUNDLE_WORKERS) as pool:
+            futures = {
+                'metrics': pool.submit(self.get_key_metrics, start_date, end_date),
+                'sentiment_trend': pool.submit(
+                    self.get_daily_sentiment_by_source, start_date, end_date
+                ),
+                'risk_distribution': pool.submit(
+                    self.get_risk_distribution, start_date, end_date
+                ),
+                'sentiment_distribution': pool.submit(
+                    self.get_sentiment_distribution, start_date, end_date
+                ),
+                'indicators': pool.submit(
+                    self.get_mental_health_indicators, start_date, end_date
+                )
             }
+            return {key: future.result() for key, future in futures.items()}
     
+    @_ttl_cached
     def get_sentiment_trend(
         self,
         start_date: str,
@@ -70,30 +828,142 @@ class DashboardDataProvider:
         Returns:
             DataFrame with sentiment trend data
         """
-        sources_filter = ""
-        if sources:
-            sources_str = "', '".join(sources)
-            sources_filter = f"AND r.source IN ('{sources_str}')"
+        use_rollup = self._has_rollup('daily_sentiment_rollup')
+        sql = _sentiment_trend_sql(len(sources or ()), use_rollup)
+        params = [*day_bounds(start_date, end_date), *(sources or ())]
         
-        sql = f"""
-        SELECT
-            substr(p.timestamp, 1, 10) as date,
-            AVG(p.sentiment_score) as avg_sentiment,
-            COUNT(*) as post_count
-        FROM processed_sentiment_data p
-        JOIN raw_sentiment_data r ON p.record_id = r.record_id
-        WHERE p.timestamp >= '{start_date} 00:00:00' AND p.timestamp <= '{end_date} 23:59:59'
-            {sources_filter}
-        GROUP BY date
-        ORDER BY date
+        try:
+            return self.loader.query(sql, params, dtype=_TREND_DTYPES)
+        except Exception as e:
+            log.error(f"Error getting sentiment trend: {str(e)}")
+            return _failed(pd.DataFrame())
+    
+    @_ttl_cached
+    def get_daily_sentiment_by_source(self, start_date: str, end_date: str) -> pd.DataFrame:
+        """Get the sentiment trend split by data source.
+        
+        Rows can be filtered by source and re-weighted by post_count to give
+        the trend for any source selection. Days older than
+        ``_TREND_OPEN_DAYS`` no longer change, so they are remembered per
+        range start and only the newer days are queried on refresh.
+        
+        Args:
+            start_date: Start date
+            end_date: End date
+            
+        Returns:
+            DataFrame with date, source, avg_sentiment and post_count
         """
+        start, stop = day_bounds(start_date, end_date)
+        closed = (datetime.now().date() - timedelta(days=_TREND_OPEN_DAYS)).isoformat()
+        with self._trend_history_lock:
+            entry = self._trend_history.get(start)
+        covered, history = start, None
+        if entry is not None:
+            entry_covered, entry_history, stamp, stored_at = entry
+            # Backfills, deletes and resets of closed days change their row
+            # count; the TTL bounds edits that keep it
+            if (
+                time.monotonic() - stored_at < _TREND_HISTORY_TTL
+                and self._closed_days_stamp(start, entry_covered) == stamp
+            ):
+                covered, history = entry_covered, entry_history
+        if history is not None and stop <= covered:
+            return history[history['date'] < stop].reset_index(drop=True)
         
         try:
-            return self.loader.query(sql)
+            recent = self._query_daily_sentiment_by_source(covered, stop)
         except Exception as e:
-            log.error(f"Error getting sentiment trend: {str(e)}")
-            return pd.DataFrame()
+            log.error(f"Error getting daily sentiment by source: {str(e)}")
+            return _failed(pd.DataFrame())
+        
+        result = recent if history is None else pd.concat([history, recent], ignore_index=True)
+        new_covered = max(covered, min(closed, stop))
+        stamp = self._closed_days_stamp(start, new_covered) if new_covered > covered else None
+        with self._trend_history_lock:
+            if history is None:
+                # Missing or stale; replaced below if closed days were queried
+                self._trend_history.pop(start, None)
+            if stamp is not None:
+                self._trend_history.pop(start, None)
+                if len(self._trend_history) >= _TREND_HISTORY_SIZE:
+                    self._trend_history.pop(next(iter(self._trend_history)))
+                self._trend_history[start] = (
+                    new_covered,
+                    result[result['date'] < new_covered].reset_index(drop=True),
+                    stamp,
+                    time.monotonic()
+                )
+        return result
+    
+    def _closed_days_stamp(self, lower: str, upper: str) -> Optional[int]:
+        """Count the sentiment rows of days in [lower, upper), to detect changes to them.
+        
+        Args:
+            lower: First day (YYYY-MM-DD)
+            upper: Day after the last day (YYYY-MM-DD)
+            
+        Returns:
+            Row count, or None if it could not be read
+        """
+        if self._has_rollup('daily_sentiment_rollup'):
+            sql = """
+            SELECT COALESCE(SUM(post_count), 0) AS row_count
+            FROM daily_sentiment_rollup
+            WHERE date >= ? AND date < ?
+            """
+        else:
+            sql = """
+            SELECT COUNT(*) AS row_count
+            FROM processed_sentiment_data
+            WHERE timestamp >= ? AND timestamp < ?
+            """
+        try:
+            return int(self._query_row(sql, (lower, upper)).get('row_count') or 0)
+        except Exception as e:
+            log.warning(f"Could not check cached sentiment trend days ({e}), re-querying them")
+            return None
+    
+    def _query_daily_sentiment_by_source(self, lower: str, upper: str) -> pd.DataFrame:
+        """Query the per-source daily sentiment for days in [lower, upper).
+        
+        Args:
+            lower: First day (YYYY-MM-DD)
+            upper: Day after the last day (YYYY-MM-DD)
+            
+        Returns:
+            DataFrame with date, source, avg_sentiment and post_count
+        """
+        if self._has_rollup('daily_sentiment_rollup'):
+            sql = """
+            SELECT
+                date,
+                source,
+                SUM(avg_sentiment * post_count) / SUM(post_count) as avg_sentiment,
+                SUM(post_count) as post_count
+            FROM daily_sentiment_rollup
+            WHERE date >= ? AND date < ?
+            GROUP BY date, source
+            ORDER BY date
+            """
+        else:
+            sql = """
+            SELECT
+                substr(p.timestamp, 1, 10) as date,
+                r.source,
+                AVG(p.sentiment_score) as avg_sentiment,
+                COUNT(*) as post_count
+            FROM processed_sentiment_data p
+            JOIN raw_sentiment_data r ON p.record_id = r.record_id
+            WHERE p.timestamp >= ? AND p.timestamp < ?
+            GROUP BY date, r.source
+            ORDER BY date
+            """
+        return self.loader.query(
+            sql, (lower, upper), dtype={**_TREND_DTYPES, 'source': _STRING_DTYPE}
+        )
     
+    @_ttl_cached
     def get_risk_distribution(self, start_date: str, end_date: str, risk_level: str = 'all') -> pd.DataFrame:
         """Get distribution of risk levels.
         
@@ -104,30 +974,19 @@ class DashboardDataProvider:
         Returns:
             DataFrame with risk distribution
         """
-        risk_filter = "" if (not risk_level or risk_level == 'all') else f"AND risk_level = '{risk_level}'"
-        sql = f"""
-        SELECT
-            risk_level,
-            COUNT(*) as count
-        FROM burnout_predictions
-        WHERE prediction_date >= '{start_date}' AND prediction_date <= '{end_date}'
-            {risk_filter}
-        GROUP BY risk_level
-        ORDER BY
-            CASE risk_level
-                WHEN 'critical' THEN 1
-                WHEN 'high' THEN 2
-                WHEN 'medium' THEN 3
-                WHEN 'low' THEN 4
-            END
-        """
+        filter_risk = bool(risk_level) and risk_level != 'all'
+        sql = _risk_distribution_sql(filter_risk, self._has_rollup('daily_risk_rollup'))
+        params = list(day_bounds(start_date, end_date))
+        if filter_risk:
+            params.append(risk_level)
         
         try:
-            return self.loader.query(sql)
+            return self.loader.query(sql, params, dtype={'risk_level': _STRING_DTYPE, 'count': 'int32'})
         except Exception as e:
             log.error(f"Error getting risk distribution: {str(e)}")
-            return pd.DataFrame()
+            return _failed(pd.DataFrame())
     
+    @_ttl_cached
     def get_mental_health_indicators(
         self,
         start_date: str,
@@ -135,71 +994,62 @@ class DashboardDataProvider:
     ) -> pd.DataFrame:
         """Get mental health indicators over time (SQLite-friendly).
         
-        We pull rows and aggregate in Python by parsing JSON strings from
-        `mental_health_indicators`.
+        Scores are pulled out of the `mental_health_indicators` JSON and
+        averaged per day inside SQLite. Rows that are not a JSON object, or
+        lack a score, count as 0 for it.
+        
+        Args:
+            start_date: Start date
+            end_date: End date
+            
+        Returns:
+            DataFrame with date, stress, anxiety, depression and burnout columns
         """
-        sql = f"""
-        SELECT substr(timestamp, 1, 10) AS date, mental_health_indicators
-        FROM processed_sentiment_data
-        WHERE timestamp >= '{start_date} 00:00:00' AND timestamp <= '{end_date} 23:59:59'
+        sql = """
+        SELECT
+            date,
+            AVG(COALESCE(CAST(json_extract(ind, '$.stress_score') AS REAL), 0)) AS stress,
+            AVG(COALESCE(CAST(json_extract(ind, '$.anxiety_score') AS REAL), 0)) AS anxiety,
+            AVG(COALESCE(CAST(json_extract(ind, '$.depression_score') AS REAL), 0)) AS depression,
+            AVG(COALESCE(CAST(json_extract(ind, '$.burnout_score') AS REAL), 0)) AS burnout
+        FROM (
+            SELECT
+                substr(timestamp, 1, 10) AS date,
+                CASE
+                    WHEN json_valid(mental_health_indicators)
+                        AND json_type(mental_health_indicators) = 'object'
+                    THEN mental_health_indicators
+                END AS ind
+            FROM processed_sentiment_data
+            WHERE timestamp >= ? AND timestamp < ?
+        )
+        GROUP BY date
         ORDER BY date
         """
+        bounds = day_bounds(start_date, end_date)
+        df = self._duck_query('indicators', bounds)
+        if df is not None:
+            return df if not df.empty else _EMPTY_INDICATORS.copy()
         try:
-            df = self.loader.query(sql)
-            if df.empty:
-                return pd.DataFrame()
-            # Parse JSON safely
-            def parse_ind(row):
-                v = row
-                if isinstance(v, dict):
-                    return v
-                if isinstance(v, str) and v:
-                    try:
-                        parsed = json.loads(v)
-                        # Only accept object (dict); otherwise fallback to empty dict
-                        return parsed if isinstance(parsed, dict) else {}
-                    except Exception:
-                        return {}
-                # Any other type (float/None/etc.) -> empty dict
-                return {}
-            df['parsed'] = df['mental_health_indicators'].apply(parse_ind)
-            # Build aggregate per date
-            agg = (
-                df.groupby('date')['parsed']
-                .apply(lambda xs: {
-                    'stress': pd.Series([
-                        x.get('stress_score', 0) if isinstance(x, dict) else 0 for x in xs
-                    ]).mean() if len(xs) else 0,
-                    'anxiety': pd.Series([
-                        x.get('anxiety_score', 0) if isinstance(x, dict) else 0 for x in xs
-                    ]).mean() if len(xs) else 0,
-                    'depression': pd.Series([
-                        x.get('depression_score', 0) if isinstance(x, dict) else 0 for x in xs
-                    ]).mean() if len(xs) else 0,
-                    'burnout': pd.Series([
-                        x.get('burnout_score', 0) if isinstance(x, dict) else 0 for x in xs
-                    ]).mean() if len(xs) else 0,
-                })
-                .reset_index(name='vals')
-            )
-            # Expand dict into columns with robust guards
-            def _safe(d, key):
-                if isinstance(d, dict):
-                    return d.get(key, 0)
-                return 0
-            out = pd.concat([
-                agg['date'],
-                agg['vals'].apply(lambda d: _safe(d, 'stress')),
-                agg['vals'].apply(lambda d: _safe(d, 'anxiety')),
-                agg['vals'].apply(lambda d: _safe(d, 'depression')),
-                agg['vals'].apply(lambda d: _safe(d, 'burnout')),
-            ], axis=1)
-            out.columns = ['date', 'stress', 'anxiety', 'depression', 'burnout']
-            return out
+            df = self.loader.query(sql, bounds)
         except Exception as e:
-            log.error(f"Error getting mental health indicators: {str(e)}")
-            return pd.DataFrame()
+            # Databases without JSON functions: aggregate the raw rows here
+            log.warning(f"SQL indicator aggregation failed ({e}), aggregating in Python")
+            raw_sql = """
+            SELECT substr(timestamp, 1, 10) AS date, mental_health_indicators
+            FROM processed_sentiment_data
+            WHERE timestamp >= ? AND timestamp < ?
+            """
+            try:
+                df = _indicator_means(self._query_chunks(raw_sql, bounds))
+            except Exception as e:
+                log.error(f"Error getting mental health indicators: {str(e)}")
+                return _failed(_EMPTY_INDICATORS)
+        if df.empty:
+            return _EMPTY_INDICATORS.copy()
+        return df
     
+    @_ttl_cached
     def get_sentiment_distribution(
         self,
         start_date: str,
@@ -215,23 +1065,19 @@ class DashboardDataProvider:
         Returns:
             DataFrame with sentiment distribution
         """
-        sentiment_filter = "" if (not sentiment_label or sentiment_label == 'all') else f"AND sentiment_label = '{sentiment_label}'"
-        sql = f"""
-        SELECT
-            sentiment_label,
-            COUNT(*) as count
-        FROM processed_sentiment_data
-        WHERE timestamp >= '{start_date} 00:00:00' AND timestamp <= '{end_date} 23:59:59'
-            {sentiment_filter}
-        GROUP BY sentiment_label
-        """
+        filter_label = bool(sentiment_label) and sentiment_label != 'all'
+        sql = _sentiment_distribution_sql(filter_label, self._has_rollup('daily_sentiment_rollup'))
+        params = list(day_bounds(start_date, end_date))
+        if filter_label:
+            params.append(sentiment_label)
         
         try:
-            return self.loader.query(sql)
+            return self.loader.query(sql, params, dtype={'sentiment_label': _STRING_DTYPE, 'count': 'int32'})
         except Exception as e:
             log.error(f"Error getting sentiment distribution: {str(e)}")
-            return pd.DataFrame()
+            return _failed(pd.DataFrame())
     
+    @_ttl_cached
     def get_sentiment_by_source(
         self,
         start_date: str,
@@ -246,60 +1092,67 @@ class DashboardDataProvider:
         Returns:
             DataFrame with sentiment by source
         """
-        sql = f"""
-        SELECT
-            r.source,
-            AVG(p.sentiment_score) as avg_sentiment,
-            COUNT(*) as count
-        FROM processed_sentiment_data p
-        JOIN raw_sentiment_data r ON p.record_id = r.record_id
-        WHERE p.timestamp >= '{start_date} 00:00:00' AND p.timestamp <= '{end_date} 23:59:59'
-        GROUP BY r.source
-        """
+        params = day_bounds(start_date, end_date)
+        if self._has_rollup('daily_sentiment_rollup'):
+            sql = """
+            SELECT
+                source,
+                SUM(avg_sentiment * post_count) / SUM(post_count) as avg_sentiment,
+                SUM(post_count) as count
+            FROM daily_sentiment_rollup
+            WHERE date >= ? AND date < ?
+            GROUP BY source
+            """
+        else:
+            sql = """
+            SELECT
+                r.source,
+                AVG(p.sentiment_score) as avg_sentiment,
+                COUNT(*) as count
+            FROM processed_sentiment_data p
+            JOIN raw_sentiment_data r ON p.record_id = r.record_id
+            WHERE p.timestamp >= ? AND p.timestamp < ?
+            GROUP BY r.source
+            """
         
         try:
-            return self.loader.query(sql)
+            return self.loader.query(
+                sql, params, dtype={'source': _STRING_DTYPE, 'avg_sentiment': 'float32', 'count': 'int32'}
+            )
         except Exception as e:
             log.error(f"Error getting sentiment by source: {str(e)}")
-            return pd.DataFrame()
+            return _failed(pd.DataFrame())
     
+    @_ttl_cached
     def get_keyword_analysis(self, start_date: str, end_date: str) -> pd.DataFrame:
         """Get keyword frequency analysis (SQLite-friendly)."""
-        sql = f"""
+        sql = """
         SELECT keywords_detected
         FROM processed_sentiment_data
-        WHERE timestamp >= '{start_date} 00:00:00' AND timestamp <= '{end_date} 23:59:59'
+        WHERE timestamp >= ? AND timestamp < ?
         """
+        bounds = day_bounds(start_date, end_date)
+        df = self._duck_query('keywords', bounds)
+        if df is not None:
+            return df if not df.empty else _EMPTY_KEYWORDS.copy()
         try:
-            df = self.loader.query(sql)
-            if df.empty:
-                return pd.DataFrame()
-            all_keywords = []
-            for val in df['keywords_detected']:
-                if isinstance(val, list):
-                    all_keywords.extend(val)
-                elif isinstance(val, str):
-                    # Try JSON first
-                    parsed = None
-                    try:
-                        parsed = json.loads(val)
-                    except Exception:
-                        parsed = None
-                    if isinstance(parsed, list):
-                        all_keywords.extend([str(x) for x in parsed])
-                    else:
-                        # Fallback: comma-separated string
-                        parts = [p.strip() for p in val.split(',') if p.strip()]
-                        all_keywords.extend(parts)
-            if not all_keywords:
-                return pd.DataFrame()
-            counts = Counter([k.lower() for k in all_keywords if k])
-            top = counts.most_common(20)
-            return pd.DataFrame(top, columns=['keyword', 'count'])
+            counts = None
+            for chunk in self._query_chunks(sql, bounds):
+                part = _keyword_counts(chunk)
+                counts = part if counts is None else counts.add(part, fill_value=0)
+            if counts is None or counts.empty:
+                return _EMPTY_KEYWORDS.copy()
+            # Partial selection of the top 20 rather than sorting every keyword
+            top = counts.nlargest(20)
+            return pd.DataFrame({
+                'keyword': top.index.to_numpy(dtype=object),
+                'count': top.to_numpy(dtype='int64')
+            })
         except Exception as e:
             log.error(f"Error getting keyword analysis: {str(e)}")
-            return pd.DataFrame()
+            return _failed(_EMPTY_KEYWORDS)
     
+    @_ttl_cached
     def get_burnout_heatmap_data(
         self,
         start_date: str,
@@ -315,26 +1168,21 @@ class DashboardDataProvider:
         Returns:
             DataFrame with burnout risk by date and user
         """
-        risk_filter = "" if (not risk_level or risk_level == 'all') else f"AND risk_level = '{risk_level}'"
-        sql = f"""
-        SELECT
-            prediction_date as date,
-            user_id_hash,
-            burnout_risk_score,
-            risk_level
-        FROM burnout_predictions
-        WHERE prediction_date >= '{start_date}' AND prediction_date <= '{end_date}'
-            {risk_filter}
-        ORDER BY date, burnout_risk_score DESC
-        LIMIT 1000
-        """
+        filter_risk = bool(risk_level) and risk_level != 'all'
+        sql = _heatmap_sql(filter_risk)
+        params = list(day_bounds(start_date, end_date))
+        if filter_risk:
+            params.append(risk_level)
         
         try:
-            return self.loader.query(sql)
+            return self.loader.query(
+                sql, params, dtype={'burnout_risk_score': 'float32', 'risk_level': _STRING_DTYPE}
+            )
         except Exception as e:
             log.error(f"Error getting burnout heatmap data: {str(e)}")
-            return pd.DataFrame()
+            return _failed(pd.DataFrame())
     
+    @_ttl_cached
     def get_risk_scores(self, start_date: str, end_date: str) -> pd.DataFrame:
         """Get burnout risk scores.
         
@@ -345,18 +1193,21 @@ class DashboardDataProvider:
         Returns:
             DataFrame with risk scores
         """
-        sql = f"""
+        sql = """
         SELECT burnout_risk_score
         FROM burnout_predictions
-        WHERE prediction_date >= '{start_date}' AND prediction_date <= '{end_date}'
+        WHERE prediction_date >= ? AND prediction_date < ?
         """
         
         try:
-            return self.loader.query(sql)
+            return self.loader.query(
+                sql, day_bounds(start_date, end_date), dtype={'burnout_risk_score': 'float32'}
+            )
         except Exception as e:
             log.error(f"Error getting risk scores: {str(e)}")
-            return pd.DataFrame()
+            return _failed(pd.DataFrame())
     
+    @_ttl_cached
     def get_contributing_factors(
         self,
         start_date: str,
@@ -364,53 +1215,70 @@ class DashboardDataProvider:
     ) -> pd.DataFrame:
         """Get top contributing factors to burnout (SQLite-friendly).
         
-        Reads `contributing_factors` as JSON array per row and aggregates
-        average importance per factor.
+        Flattens the `contributing_factors` JSON arrays with json_each and
+        averages importance per factor inside SQLite.
+        
+        Args:
+            start_date: Start date
+            end_date: End date
+            
+        Returns:
+            DataFrame with the 10 factors of highest average importance
         """
-        sql = f"""
-        SELECT contributing_factors
-        FROM burnout_predictions
-        WHERE DATE(prediction_date) BETWEEN '{start_date}' AND '{end_date}'
+        sql = """
+        SELECT factor_name, AVG(importance) AS avg_importance
+        FROM (
+            SELECT
+                COALESCE(
+                    NULLIF(json_extract(je.value, '$.factor_name'), ''),
+                    NULLIF(json_extract(je.value, '$.name'), '')
+                ) AS factor_name,
+                CAST(COALESCE(
+                    NULLIF(json_extract(je.value, '$.importance_score'), 0),
+                    NULLIF(json_extract(je.value, '$.importance'), 0),
+                    0
+                ) AS REAL) AS importance
+            FROM burnout_predictions bp,
+                json_each(
+                    CASE
+                        WHEN json_valid(bp.contributing_factors)
+                            AND json_type(bp.contributing_factors) = 'array'
+                        THEN bp.contributing_factors
+                        ELSE '[]'
+                    END
+                ) je
+            WHERE bp.prediction_date >= ? AND bp.prediction_date < ?
+                AND je.type = 'object'
+        )
+        WHERE factor_name IS NOT NULL
+        GROUP BY factor_name
+        ORDER BY avg_importance DESC
+        LIMIT 10
         """
+        bounds = day_bounds(start_date, end_date)
+        df = self._duck_query('factors', bounds)
+        if df is not None:
+            return df if not df.empty else pd.DataFrame()
         try:
-            df = self.loader.query(sql)
-            if df.empty:
-                return pd.DataFrame()
-            bag = {}
-            cnt = {}
-            for val in df['contributing_factors']:
-                items = None
-                if isinstance(val, list):
-                    items = val
-                elif isinstance(val, str) and val:
-                    try:
-                        parsed = json.loads(val)
-                        if isinstance(parsed, list):
-                            items = parsed
-                    except Exception:
-                        items = None
-                if not items:
-                    continue
-                for it in items:
-                    if isinstance(it, dict):
-                        name = it.get('factor_name') or it.get('name')
-                        imp = it.get('importance_score') or it.get('importance') or 0
-                        if not name:
-                            continue
-                        bag[name] = bag.get(name, 0) + float(imp)
-                        cnt[name] = cnt.get(name, 0) + 1
-            if not bag:
-                return pd.DataFrame()
-            data = [
-                {'factor_name': k, 'avg_importance': bag[k] / max(1, cnt.get(k, 1))}
-                for k in bag.keys()
-            ]
-            out = pd.DataFrame(data).sort_values('avg_importance', ascending=False).head(10)
-            return out
+            df = self.loader.query(sql, bounds)
         except Exception as e:
-            log.error(f"Error getting contributing factors: {str(e)}")
+            # Databases without JSON functions: aggregate the raw rows here
+            log.warning(f"SQL factor aggregation failed ({e}), aggregating in Python")
+            raw_sql = """
+            SELECT contributing_factors
+            FROM burnout_predictions
+            WHERE prediction_date >= ? AND prediction_date < ?
+            """
+            try:
+                df = _factor_means(self._query_chunks(raw_sql, bounds))
+            except Exception as e:
+                log.error(f"Error getting contributing factors: {str(e)}")
+                return _failed(pd.DataFrame())
+        if df.empty:
             return pd.DataFrame()
+        return df
     
+    @_ttl_cached
     def get_alert_timeline(self, start_date: str, end_date: str) -> pd.DataFrame:
         """Get alert timeline data.
         
@@ -421,77 +1289,29 @@ class DashboardDataProvider:
         Returns:
             DataFrame with alert timeline
         """
-        sql = f"""
-        SELECT
-            substr(alert_timestamp, 1, 10) as date,
-            severity,
-            COUNT(*) as count
-        FROM alert_history
-        WHERE alert_timestamp >= '{start_date} 00:00:00' AND alert_timestamp <= '{end_date} 23:59:59'
-        GROUP BY date, severity
-        ORDER BY date
-        """
+        if self._has_rollup('daily_alert_rollup'):
+            sql = """
+            SELECT date, severity, alert_count as count
+            FROM daily_alert_rollup
+            WHERE date >= ? AND date < ?
+            ORDER BY date
+            """
+        else:
+            sql = """
+            SELECT
+                substr(alert_timestamp, 1, 10) as date,
+                severity,
+                COUNT(*) as count
+            FROM alert_history
+            WHERE alert_timestamp >= ? AND alert_timestamp < ?
+            GROUP BY date, severity
+            ORDER BY date
+            """
         
         try:
-            return self.loader.query(sql)
+            return self.loader.query(
+                sql, day_bounds(start_date, end_date), dtype={'severity': _STRING_DTYPE, 'count': 'int32'}
+            )
         except Exception as e:
             log.error(f"Error getting alert timeline: {str(e)}")
-            return pd.DataFrame()
-    
-    def _query_total_users(self, start_date: str, end_date: str) -> int:
-        """Query total unique users."""
-        sql = f"""
-        SELECT COUNT(DISTINCT user_id_hash) as count
-        FROM processed_sentiment_data
-        WHERE timestamp >= '{start_date} 00:00:00' AND timestamp <= '{end_date} 23:59:59'
-        """
-        
-        try:
-            result = self.loader.query(sql)
-            return int(result.iloc[0]['count']) if not result.empty else 0
-        except:
-            return 0
-    
-    def _query_high_risk_users(self, start_date: str, end_date: str) -> int:
-        """Query high risk users count."""
-        sql = f"""
-        SELECT COUNT(DISTINCT user_id_hash) as count
-        FROM burnout_predictions
-        WHERE prediction_date >= '{start_date}' AND prediction_date <= '{end_date}'
-            AND risk_level IN ('high', 'critical')
-        """
-        
-        try:
-            result = self.loader.query(sql)
-            return int(result.iloc[0]['count']) if not result.empty else 0
-        except:
-            return 0
-    
-    def _query_avg_sentiment(self, start_date: str, end_date: str) -> float:
-        """Query average sentiment score."""
-        sql = f"""
-        SELECT AVG(sentiment_score) as avg_score
-        FROM processed_sentiment_data
-        WHERE timestamp >= '{start_date} 00:00:00' AND timestamp <= '{end_date} 23:59:59'
-        """
-        
-        try:
-            result = self.loader.query(sql)
-            return float(result.iloc[0]['avg_score']) if not result.empty else 0.0
-        except:
-            return 0.0
-    
-    def _query_active_alerts(self, start_date: str, end_date: str) -> int:
-        """Query active alerts count."""
-        sql = f"""
-        SELECT COUNT(*) as count
-        FROM alert_history
-        WHERE alert_timestamp >= '{start_date} 00:00:00' AND alert_timestamp <= '{end_date} 23:59:59'
-            AND status = 'sent'
-        """
-        
-        try:
-            result = self.loader.query(sql)
-            return int(result.iloc[0]['count']) if not result.empty else 0
-        except:
-            return 0
+            return _failed(pd.DataFrame())
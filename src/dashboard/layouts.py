@@ -4,6 +4,46 @@ from dash import dcc, html
 import dash_bootstrap_components as dbc
 from datetime import datetime, timedelta
 
+# Static styles, shared by every build of the layout
+_ACCENT = '#667eea'
+_ACCENT_ICON_STYLE = {'color': _ACCENT}
+_TITLE_STYLE = {'color': '#2d3748', 'fontWeight': '700', 'marginBottom': '0.5rem'}
+_SUBTITLE_STYLE = {'color': '#718096', 'fontSize': '1.1rem'}
+_TIMESTAMP_STYLE = {'color': '#4a5568'}
+_REFRESH_BUTTON_STYLE = {
+    'background': 'linear-gradient(135deg, #667eea 0%, #764ba2 100%)',
+    'border': 'none',
+    'boxShadow': '0 4px 6px rgba(102, 126, 234, 0.4)'
+}
+_HEADER_STYLE = {
+    'marginBottom': '2rem', 'padding': '1.5rem',
+    'background': 'linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%)',
+    'borderRadius': '15px',
+    'boxShadow': '0 10px 25px rgba(0,0,0,0.1)'
+}
+
+# Metric card icon colors by Bootstrap color name, with their icon styles
+_METRIC_COLORS = {
+    'primary': '#667eea',
+    'danger': '#f56565',
+    'success': '#48bb78',
+    'warning': '#ed8936'
+}
+_METRIC_ICON_STYLES = {name: {'color': color} for name, color in _METRIC_COLORS.items()}
+_METRIC_VALUE_STYLE = {'fontWeight': '700', 'color': '#2d3748', 'marginBottom': '0.5rem'}
+_METRIC_TITLE_STYLE = {'color': '#718096', 'fontSize': '0.9rem', 'marginBottom': '0'}
+_METRIC_BODY_STYLE = {'padding': '1rem'}
+_METRIC_CARD_STYLE = {
+    'borderRadius': '15px',
+    'border': 'none',
+    'boxShadow': '0 4px 15px rgba(0,0,0,0.1)',
+    'transition': 'transform 0.3s ease',
+    'background': 'white'
+}
+
+# WebGL (scattergl) charts render at device resolution on HiDPI screens
+_GL_GRAPH_CONFIG = {'plotGlPixelRatio': 2}
+
 
 def create_layout():
     """Create main dashboard layout.
@@ -13,7 +53,7 @@ def create_layout():
     """
     return dbc.Container([
         # Header
-        create_header(),
+        _HEADER,
         
         html.Hr(),
         
@@ -38,14 +78,15 @@ def create_layout():
             ], width=9)
         ]),
         
-        # Auto-refresh interval
+        # Auto-refresh interval; period and pausing are driven client-side
         dcc.Interval(
             id='interval-component',
-            interval=30*1000,  # 30 seconds
+            interval=60*1000,  # 60 seconds
             n_intervals=0
         ),
         
-        # Store for data
+        # Unfiltered data for the selected date range; the dropdown
+        # filters are applied to it without another query
         dcc.Store(id='data-store'),
         
     ], fluid=True, className="p-4")
@@ -61,36 +102,31 @@ def create_header():
         dbc.Col([
             html.Div([
                 html.H1([
-                    html.I(className="fas fa-brain me-3", style={'color': '#667eea'}),
+                    html.I(className="fas fa-brain me-3", style=_ACCENT_ICON_STYLE),
                     "Mental Health Analytics"
-                ], style={'color': '#2d3748', 'fontWeight': '700', 'marginBottom': '0.5rem'}),
+                ], style=_TITLE_STYLE),
                 html.P(
                     "AI-powered sentiment analysis and burnout prediction for proactive mental health care",
-                    style={'color': '#718096', 'fontSize': '1.1rem'}
+                    style=_SUBTITLE_STYLE
                 )
             ])
         ], width=8),
         dbc.Col([
             html.Div([
                 html.P([
-                    html.I(className="fas fa-clock me-2", style={'color': '#667eea'}),
-                    html.Span(id="last-updated", children=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                             style={'color': '#4a5568'})
+                    html.I(className="fas fa-clock me-2", style=_ACCENT_ICON_STYLE),
+                    # Filled client-side on load and on every refresh
+                    html.Span(id="last-updated", style=_TIMESTAMP_STYLE)
                 ], className="text-end mb-2"),
                 dbc.Button([
                     html.I(className="fas fa-sync-alt me-2"),
                     "Refresh Data"
                 ], id="refresh-button", 
-                   style={'background': 'linear-gradient(135deg, #667eea 0%, #764ba2 100%)',
-                          'border': 'none',
-                          'boxShadow': '0 4px 6px rgba(102, 126, 234, 0.4)'},
+                   style=_REFRESH_BUTTON_STYLE,
                    size="sm", className="float-end")
             ])
         ], width=4)
-    ], style={'marginBottom': '2rem', 'padding': '1.5rem', 
-              'background': 'linear-gradient(135deg, #f5f7fa 0%, #c3cfe2 100%)',
-              'borderRadius': '15px',
-              'boxShadow': '0 10px 25px rgba(0,0,0,0.1)'})
+    ], style=_HEADER_STYLE)
 
 
 def create_sidebar():
@@ -161,6 +197,23 @@ def create_sidebar():
                 value=['twitter', 'reddit', 'survey'],
                 className="mb-3"
             ),
+            
+            html.Hr(),
+            
+            # Auto-refresh period
+            html.Label("Auto-refresh", className="fw-bold"),
+            dcc.Dropdown(
+                id='refresh-interval',
+                options=[
+                    {'label': 'Off', 'value': 0},
+                    {'label': 'Every 30 seconds', 'value': 30},
+                    {'label': 'Every minute', 'value': 60},
+                    {'label': 'Every 5 minutes', 'value': 300}
+                ],
+                value=60,
+                clearable=False,
+                className="mb-3"
+            ),
         ])
     ], className="shadow-sm")
 
@@ -172,6 +225,11 @@ def create_overview_tab():
         Overview tab component
     """
     return html.Div([
+        # What each chart was last sent, for partial (Patch) updates
+        dcc.Store(id='sentiment-trend-state'),
+        dcc.Store(id='indicators-state'),
+        dcc.Store(id='risk-distribution-state'),
+        
         # Key metrics cards
         dbc.Row([
             dbc.Col([
@@ -214,7 +272,7 @@ def create_overview_tab():
                 dbc.Card([
                     dbc.CardHeader("Sentiment Trend Over Time"),
                     dbc.CardBody([
-                        dcc.Graph(id='sentiment-trend-chart')
+                        dcc.Graph(id='sentiment-trend-chart', config=_GL_GRAPH_CONFIG)
                     ])
                 ], className="shadow-sm")
             ], width=8),
@@ -233,7 +291,7 @@ def create_overview_tab():
                 dbc.Card([
                     dbc.CardHeader("Mental Health Indicators"),
                     dbc.CardBody([
-                        dcc.Graph(id='indicators-chart')
+                        dcc.Graph(id='indicators-chart', config=_GL_GRAPH_CONFIG)
                     ])
                 ], className="shadow-sm")
             ], width=12)
@@ -248,6 +306,12 @@ def create_sentiment_tab():
         Sentiment tab component
     """
     return html.Div([
+        # What the distribution chart was last sent, for partial (Patch) updates
+        dcc.Store(id='sentiment-distribution-state'),
+        # Digest of what each polled chart last sent, to skip unchanged ticks
+        dcc.Store(id='sentiment-by-source-digest'),
+        dcc.Store(id='keyword-digest'),
+        
         dbc.Row([
             dbc.Col([
                 dbc.Card([
@@ -298,6 +362,11 @@ def create_burnout_tab():
         Burnout tab component
     """
     return html.Div([
+        # Digest of what each polled chart last sent, to skip unchanged ticks
+        dcc.Store(id='burnout-heatmap-digest'),
+        dcc.Store(id='risk-score-digest'),
+        dcc.Store(id='contributing-factors-digest'),
+        
         dbc.Row([
             dbc.Col([
                 dbc.Card([
@@ -348,6 +417,9 @@ def create_alerts_tab():
         Alerts tab component
     """
     return html.Div([
+        # What the timeline chart was last sent, for append-only updates
+        dcc.Store(id='alert-timeline-state'),
+        
         dbc.Row([
             dbc.Col([
                 dbc.Card([
@@ -384,25 +456,24 @@ def create_metric_card(title, value_id, icon, color):
     Returns:
         Metric card component
     """
-    color_map = {
-        'primary': '#667eea',
-        'danger': '#f56565',
-        'success': '#48bb78',
-        'warning': '#ed8936'
-    }
-    
     return dbc.Card([
         dbc.CardBody([
             html.Div([
                 html.I(className=f"{icon} fa-3x mb-3", 
-                      style={'color': color_map.get(color, '#667eea')}),
-                html.H2(id=value_id, children="--", 
-                       style={'fontWeight': '700', 'color': '#2d3748', 'marginBottom': '0.5rem'}),
-                html.P(title, style={'color': '#718096', 'fontSize': '0.9rem', 'marginBottom': '0'})
-            ], className="text-center", style={'padding': '1rem'})
+                      style=_METRIC_ICON_STYLES.get(color, _ACCENT_ICON_STYLE)),
+                html.H2(id=value_id, children="--", style=_METRIC_VALUE_STYLE),
+                html.P(title, style=_METRIC_TITLE_STYLE)
+            ], className="text-center", style=_METRIC_BODY_STYLE)
         ])
-    ], style={'borderRadius': '15px',
-              'border': 'none',
-              'boxShadow': '0 4px 15px rgba(0,0,0,0.1)',
-              'transition': 'transform 0.3s ease',
-              'background': 'white'})
+    ], style=_METRIC_CARD_STYLE)
+
+
+# Static component trees, built once at import. The sidebar is left out
+# because its date range defaults to the last 30 days at build time.
+_HEADER = create_header()
+TAB_LAYOUTS = {
+    'overview': create_overview_tab(),
+    'sentiment': create_sentiment_tab(),
+    'burnout': create_burnout_tab(),
+    'alerts': create_alerts_tab()
+}
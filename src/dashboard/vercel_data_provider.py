@@ -1,16 +1,135 @@
 """Lightweight CSV-based data provider for Vercel deployment."""
 
+import ast
+import functools
 import os
 import json
+import stat
+import tempfile
+import numpy as np
 import pandas as pd
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, List
-from collections import Counter
+from typing import Callable, Dict, Any, List, Optional, Tuple
 
 # Project root
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 
+# Writable fallback for the typed CSV copies (the deployed tree may be read-only);
+# only used while it is private to the current user, see _private_cache_dir
+_CACHE_DIR = Path(tempfile.gettempdir()) / "health_dashboard"
+
+# Bumped whenever _load changes what it stores, so older copies are ignored
+_CACHE_VERSION = 3
+
+def _private_cache_dir() -> Optional[Path]:
+    """Create the temp-dir cache directory and return it if only we can write to it.
+    
+    The copies there are unpickled, and the temp dir is shared, so a
+    directory (or symlink) another user could write to would let them run
+    code in the dashboard process. Such a directory is not used.
+    
+    Returns:
+        The cache directory, or None if it is missing or not private
+    """
+    try:
+        _CACHE_DIR.mkdir(mode=0o700, exist_ok=True)
+        st = os.lstat(_CACHE_DIR)
+    except OSError:
+        return None
+    if not stat.S_ISDIR(st.st_mode):
+        return None
+    getuid = getattr(os, 'getuid', None)
+    if getuid is not None and (st.st_uid != getuid() or st.st_mode & 0o077):
+        return None
+    return _CACHE_DIR
+
+
+def _parse_list(val: Any) -> List[Any]:
+    """Parse a stored list cell (JSON or Python literal) into a list.
+    
+    Args:
+        val: A list, or its JSON / Python repr string
+        
+    Returns:
+        List of items (empty for anything else)
+    """
+    if isinstance(val, list):
+        return val
+    if not isinstance(val, str):
+        return []
+    try:
+        parsed = json.loads(val)
+    except ValueError:
+        try:
+            parsed = ast.literal_eval(val)
+        except (ValueError, SyntaxError, TypeError):
+            return []
+    return parsed if isinstance(parsed, list) else []
+
+
+def _date_slice(df: pd.DataFrame, column: str, start_date: str, end_date: str) -> pd.DataFrame:
+    """Rows of a frame sorted by ``column`` with start_date <= column <= end_date.
+    
+    Two binary searches and a positional slice instead of comparing every row.
+    
+    Args:
+        df: DataFrame sorted by ``column`` (datetime64)
+        column: Timestamp column
+        start_date: Start date
+        end_date: End date
+        
+    Returns:
+        Slice of ``df``
+    """
+    values = df[column].to_numpy()
+    lo = values.searchsorted(np.datetime64(pd.Timestamp(start_date)), side='left')
+    hi = values.searchsorted(np.datetime64(pd.Timestamp(end_date)), side='right')
+    return df.iloc[lo:hi]
+
+
+# Results kept per provider; the CSVs are read once, so results never go stale
+_MEMO_SIZE = 256
+
+
+def _memoized(method: Callable) -> Callable:
+    """Cache a getter's result per arguments for the life of the provider.
+    
+    Callers get a shallow copy, so the cached frame is never mutated.
+    
+    Args:
+        method: Provider getter
+        
+    Returns:
+        Wrapped getter
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (
+            method.__name__,
+            tuple(tuple(a) if isinstance(a, list) else a for a in args),
+            tuple(sorted(kwargs.items()))
+        )
+        try:
+            result = self._memo[key]
+        except KeyError:
+            result = method(self, *args, **kwargs)
+            if len(self._memo) >= _MEMO_SIZE:
+                self._memo.pop(next(iter(self._memo)), None)
+            self._memo[key] = result
+        return result.copy(deep=False) if isinstance(result, pd.DataFrame) else result.copy()
+    return wrapper
+
+
+# Highest-risk users kept per day in the heatmap
+_HEATMAP_USERS_PER_DAY = 50
+
+# Risk levels counted as high risk in the key metrics
+_HIGH_RISK_LEVELS = ['high', 'critical']
+
+# Demo proxy weights for stress, anxiety, depression and burnout
+_INDICATOR_WEIGHTS = np.array([0.8, 0.7, 0.6, 0.5])
+
 
 class VercelDataProvider:
     """Provide data from precomputed CSVs for Vercel serverless."""
@@ -26,59 +145,115 @@ class VercelDataProvider:
         self._sentiment_df = None
         self._predictions_df = None
         self._alerts_df = None
+        
+        self._memo: Dict[tuple, Any] = {}
+    
+    @staticmethod
+    def _load(csv_path: Path, date_column: str, list_columns: Tuple[str, ...] = ()) -> pd.DataFrame:
+        """Load a demo CSV through a pickled copy with its dtypes already set.
+        
+        The CSV is only tokenized, and its timestamps and list cells parsed,
+        when no pickle at least as new as the CSV exists next to it or in
+        the temp dir (only if that directory is private to this user).
+        
+        Args:
+            csv_path: Path to the CSV file
+            date_column: Timestamp column to parse to datetime64
+            list_columns: Columns of serialized lists to parse into lists
+            
+        Returns:
+            DataFrame sorted by ``date_column``
+        """
+        cache_name = f"{csv_path.stem}.v{_CACHE_VERSION}.pkl"
+        cache_paths = [csv_path.with_name(cache_name)]
+        cache_dir = _private_cache_dir()
+        if cache_dir is not None:
+            cache_paths.append(cache_dir / cache_name)
+        csv_mtime = csv_path.stat().st_mtime
+        for cache_path in cache_paths:
+            if cache_path.exists() and cache_path.stat().st_mtime >= csv_mtime:
+                try:
+                    return pd.read_pickle(cache_path)
+                except Exception:
+                    pass
+        
+        df = pd.read_csv(csv_path)
+        df[date_column] = pd.to_datetime(df[date_column], format='ISO8601')
+        for column in list_columns:
+            if column in df.columns:
+                df[column] = df[column].map(_parse_list)
+        # Sorted by date so getters can binary-search their range
+        df = df.sort_values(date_column, kind='stable', ignore_index=True)
+        for cache_path in cache_paths:
+            try:
+                df.to_pickle(cache_path)
+                break
+            except OSError:
+                continue
+        return df
     
     @property
     def sentiment_df(self):
         if self._sentiment_df is None:
-            self._sentiment_df = pd.read_csv(self.sentiment_csv)
+            self._sentiment_df = self._load(
+                self.sentiment_csv, 'timestamp', list_columns=('keywords_detected',)
+            )
         return self._sentiment_df
     
     @property
     def predictions_df(self):
         if self._predictions_df is None:
-            self._predictions_df = pd.read_csv(self.predictions_csv)
+            self._predictions_df = self._load(self.predictions_csv, 'prediction_date')
         return self._predictions_df
     
     @property
     def alerts_df(self):
         if self._alerts_df is None:
-            self._alerts_df = pd.read_csv(self.alerts_csv)
+            self._alerts_df = self._load(self.alerts_csv, 'alert_timestamp')
         return self._alerts_df
     
+    @_memoized
     def get_key_metrics(self, start_date: str, end_date: str) -> Dict[str, Any]:
         """Get key metrics from CSVs."""
-        df_s = self.sentiment_df
-        df_p = self.predictions_df
-        df_a = self.alerts_df
-        
-        # Filter by date
-        df_s_filtered = df_s[(df_s['timestamp'] >= start_date) & (df_s['timestamp'] <= end_date)]
-        df_p_filtered = df_p[(df_p['prediction_date'] >= start_date) & (df_p['prediction_date'] <= end_date)]
-        df_a_filtered = df_a[(df_a['alert_timestamp'] >= start_date) & (df_a['alert_timestamp'] <= end_date)]
+        df_s = _date_slice(self.sentiment_df, 'timestamp', start_date, end_date)
+        df_p = _date_slice(self.predictions_df, 'prediction_date', start_date, end_date)
+        df_a = _date_slice(self.alerts_df, 'alert_timestamp', start_date, end_date)
         
+        # One pass per column over the sliced arrays, no intermediate frames
+        scores = df_s['sentiment_score'].to_numpy(dtype=float)
+        high_risk = np.isin(df_p['risk_level'].to_numpy(), _HIGH_RISK_LEVELS)
         return {
-            'total_users': df_s_filtered['user_id_hash'].nunique() if not df_s_filtered.empty else 0,
-            'high_risk_users': df_p_filtered[df_p_filtered['risk_level'].isin(['high', 'critical'])]['user_id_hash'].nunique() if not df_p_filtered.empty else 0,
-            'avg_sentiment': df_s_filtered['sentiment_score'].mean() if not df_s_filtered.empty else 0.0,
-            'active_alerts': len(df_a_filtered[df_a_filtered['status'] == 'sent']) if not df_a_filtered.empty else 0
+            'total_users': len(pd.unique(df_s['user_id_hash'].to_numpy())),
+            'high_risk_users': len(pd.unique(df_p['user_id_hash'].to_numpy()[high_risk])),
+            'avg_sentiment': float(np.nanmean(scores)) if len(scores) else 0.0,
+            'active_alerts': int(np.count_nonzero(df_a['status'].to_numpy() == 'sent'))
         }
     
+    def get_date_range_bundle(self, start_date: str, end_date: str) -> Dict[str, Any]:
+        """Get all unfiltered overview and sentiment tab data in one call."""
+        return {
+            'metrics': self.get_key_metrics(start_date, end_date),
+            'sentiment_trend': self.get_sentiment_trend(start_date, end_date),
+            'risk_distribution': self.get_risk_distribution(start_date, end_date),
+            'sentiment_distribution': self.get_sentiment_distribution(start_date, end_date),
+            'indicators': self.get_mental_health_indicators(start_date, end_date)
+        }
+    
+    @_memoized
     def get_sentiment_trend(self, start_date: str, end_date: str, sources: List[str] = None) -> pd.DataFrame:
         """Get sentiment trend."""
-        df = self.sentiment_df.copy()
-        df = df[(df['timestamp'] >= start_date) & (df['timestamp'] <= end_date)]
+        df = _date_slice(self.sentiment_df, 'timestamp', start_date, end_date)
         if df.empty:
             return pd.DataFrame()
         
-        df['date'] = pd.to_datetime(df['timestamp']).dt.date
-        agg = df.groupby('date').agg({'sentiment_score': 'mean', 'record_id': 'count'}).reset_index()
+        agg = df.groupby(df['timestamp'].dt.date).agg({'sentiment_score': 'mean', 'record_id': 'count'}).reset_index()
         agg.columns = ['date', 'avg_sentiment', 'post_count']
         return agg
     
+    @_memoized
     def get_risk_distribution(self, start_date: str, end_date: str, risk_level: str = 'all') -> pd.DataFrame:
         """Get risk distribution."""
-        df = self.predictions_df.copy()
-        df = df[(df['prediction_date'] >= start_date) & (df['prediction_date'] <= end_date)]
+        df = _date_slice(self.predictions_df, 'prediction_date', start_date, end_date)
         if risk_level and risk_level != 'all':
             df = df[df['risk_level'] == risk_level]
         if df.empty:
@@ -86,26 +261,27 @@ class VercelDataProvider:
         
         return df.groupby('risk_level').size().reset_index(name='count')
     
+    @_memoized
     def get_mental_health_indicators(self, start_date: str, end_date: str) -> pd.DataFrame:
         """Get mental health indicators (simplified for demo)."""
-        df = self.sentiment_df.copy()
-        df = df[(df['timestamp'] >= start_date) & (df['timestamp'] <= end_date)]
+        df = self.sentiment_df
+        df = _date_slice(df, 'timestamp', start_date, end_date)
         if df.empty:
             return pd.DataFrame()
         
-        df['date'] = pd.to_datetime(df['timestamp']).dt.date
+        dates = df['timestamp'].dt.date
         # Simplified: use sentiment as proxy for indicators
-        agg = df.groupby('date')['sentiment_score'].mean().reset_index()
-        agg['stress'] = (1 - agg['sentiment_score']) * 0.8
-        agg['anxiety'] = (1 - agg['sentiment_score']) * 0.7
-        agg['depression'] = (1 - agg['sentiment_score']) * 0.6
-        agg['burnout'] = (1 - agg['sentiment_score']) * 0.5
-        return agg[['date', 'stress', 'anxiety', 'depression', 'burnout']]
+        agg = df['sentiment_score'].groupby(dates).mean()
+        # All four indicators in one broadcast instead of four column assignments
+        scaled = np.outer(1 - agg.to_numpy(), _INDICATOR_WEIGHTS)
+        out = pd.DataFrame(scaled, columns=['stress', 'anxiety', 'depression', 'burnout'])
+        out.insert(0, 'date', agg.index.to_numpy())
+        return out
     
+    @_memoized
     def get_sentiment_distribution(self, start_date: str, end_date: str, sentiment_label: str = 'all') -> pd.DataFrame:
         """Get sentiment distribution."""
-        df = self.sentiment_df.copy()
-        df = df[(df['timestamp'] >= start_date) & (df['timestamp'] <= end_date)]
+        df = _date_slice(self.sentiment_df, 'timestamp', start_date, end_date)
         if sentiment_label and sentiment_label != 'all':
             df = df[df['sentiment_label'] == sentiment_label]
         if df.empty:
@@ -117,46 +293,47 @@ class VercelDataProvider:
         """Get sentiment by source (demo: return empty)."""
         return pd.DataFrame(columns=['source', 'avg_sentiment', 'count'])
     
+    @_memoized
     def get_keyword_analysis(self, start_date: str, end_date: str) -> pd.DataFrame:
         """Get keyword analysis."""
-        df = self.sentiment_df.copy()
-        df = df[(df['timestamp'] >= start_date) & (df['timestamp'] <= end_date)]
+        df = _date_slice(self.sentiment_df, 'timestamp', start_date, end_date)
         if df.empty or 'keywords_detected' not in df.columns:
             return pd.DataFrame()
         
-        all_keywords = []
-        for val in df['keywords_detected'].dropna():
-            if isinstance(val, str):
-                try:
-                    parsed = json.loads(val)
-                    if isinstance(parsed, list):
-                        all_keywords.extend([str(x).lower() for x in parsed if x])
-                except:
-                    pass
-        
-        if not all_keywords:
+        # Cells were parsed into lists at load time; flatten them in one pass
+        keywords = df['keywords_detected'].explode().dropna()
+        keywords = keywords[keywords.astype(bool)]
+        if keywords.empty:
             return pd.DataFrame()
         
-        counts = Counter(all_keywords)
-        top = counts.most_common(20)
-        return pd.DataFrame(top, columns=['keyword', 'count'])
+        # Lowercase in one pass, count with unique and pick the top 20 by partition
+        keywords = keywords.astype(str).str.lower().to_numpy()
+        values, counts = np.unique(keywords, return_counts=True)
+        k = min(20, len(counts))
+        idx = np.argpartition(-counts, k - 1)[:k]
+        order = idx[np.argsort(-counts[idx], kind='stable')]
+        return pd.DataFrame({'keyword': values[order], 'count': counts[order]})
     
+    @_memoized
     def get_burnout_heatmap_data(self, start_date: str, end_date: str, risk_level: str = 'all') -> pd.DataFrame:
         """Get burnout heatmap data."""
-        df = self.predictions_df.copy()
-        df = df[(df['prediction_date'] >= start_date) & (df['prediction_date'] <= end_date)]
+        df = _date_slice(self.predictions_df, 'prediction_date', start_date, end_date)
         if risk_level and risk_level != 'all':
             df = df[df['risk_level'] == risk_level]
         if df.empty:
             return pd.DataFrame()
         
-        df['date'] = df['prediction_date']
-        return df[['date', 'user_id_hash', 'burnout_risk_score', 'risk_level']].head(1000)
+        # Each day's highest-risk users, newest days first, as the SQL provider does
+        cols = ['prediction_date', 'user_id_hash', 'burnout_risk_score', 'risk_level']
+        ranked = df[cols].sort_values('burnout_risk_score', ascending=False, kind='stable')
+        top = ranked.groupby(ranked['prediction_date'].dt.normalize(), sort=False).head(_HEATMAP_USERS_PER_DAY)
+        top = top.sort_values(['prediction_date', 'burnout_risk_score'], ascending=False, kind='stable')
+        return top.head(1000).rename(columns={'prediction_date': 'date'})
     
+    @_memoized
     def get_risk_scores(self, start_date: str, end_date: str) -> pd.DataFrame:
         """Get risk scores."""
-        df = self.predictions_df.copy()
-        df = df[(df['prediction_date'] >= start_date) & (df['prediction_date'] <= end_date)]
+        df = _date_slice(self.predictions_df, 'prediction_date', start_date, end_date)
         if df.empty:
             return pd.DataFrame()
         
@@ -166,12 +343,12 @@ class VercelDataProvider:
         """Get contributing factors (demo: return empty)."""
         return pd.DataFrame(columns=['factor_name', 'avg_importance'])
     
+    @_memoized
     def get_alert_timeline(self, start_date: str, end_date: str) -> pd.DataFrame:
         """Get alert timeline."""
-        df = self.alerts_df.copy()
-        df = df[(df['alert_timestamp'] >= start_date) & (df['alert_timestamp'] <= end_date)]
+        df = _date_slice(self.alerts_df, 'alert_timestamp', start_date, end_date)
         if df.empty:
             return pd.DataFrame()
         
-        df['date'] = pd.to_datetime(df['alert_timestamp']).dt.date
-        return df.groupby(['date', 'severity']).size().reset_index(name='count')
+        dates = df['alert_timestamp'].dt.date.rename('date')
+        return df.groupby([dates, 'severity']).size().reset_index(name='count')
@@ -6,6 +6,9 @@ from datetime import datetime
 import hashlib
 from src.utils.logger import log
 
+# Fields every record must carry with a non-None value
+_REQUIRED_FIELDS = ('record_id', 'user_id_hash', 'source', 'timestamp')
+
 
 class BaseExtractor(ABC):
     """Abstract base class for data extractors."""
@@ -41,12 +44,31 @@ class BaseExtractor(ABC):
         combined = f"{user_id}{salt}".encode('utf-8')
         return hashlib.sha256(combined).hexdigest()
     
+    def anonymize_user_ids(self, user_ids: List[str], salt: str = "") -> List[str]:
+        """Anonymize a batch of user IDs.
+        
+        Produces the same hashes as ``anonymize_user_id``. The salt is a
+        suffix, so it cannot be fed to a shared hasher ahead of the ID;
+        the batch form saves the per-call method and attribute lookups.
+        
+        Args:
+            user_ids: Original user IDs
+            salt: Salt for hashing
+            
+        Returns:
+            Anonymized user ID hashes, in input order
+        """
+        sha256 = hashlib.sha256
+        suffix = salt.encode('utf-8')
+        return [sha256(str(user_id).encode('utf-8') + suffix).hexdigest() for user_id in user_ids]
+    
     def create_record(
         self,
         user_id: str,
         text_content: str,
         timestamp: datetime,
-        metadata: Dict[str, Any] = None
+        metadata: Dict[str, Any] = None,
+        user_id_hash: str = None
     ) -> Dict[str, Any]:
         """Create standardized record for loading.
         
@@ -55,6 +77,8 @@ class BaseExtractor(ABC):
             text_content: Text content
             timestamp: Content timestamp
             metadata: Additional metadata
+            user_id_hash: Precomputed ``anonymize_user_id(user_id)``, e.g.
+                from ``anonymize_user_ids`` over a whole batch
             
         Returns:
             Standardized record dictionary
@@ -65,7 +89,7 @@ class BaseExtractor(ABC):
         
         return {
             'record_id': record_id,
-            'user_id_hash': self.anonymize_user_id(user_id),
+            'user_id_hash': user_id_hash or self.anonymize_user_id(user_id),
             'source': self.source_name,
             'text_content': text_content,
             'timestamp': timestamp.isoformat(),
@@ -86,20 +110,20 @@ class BaseExtractor(ABC):
         # Simplified - in production, use langdetect or similar
         return 'en'
     
-    def validate_record(self, record: Dict[str, Any]) -> bool:
+    def validate_record(self, record: Dict[str, Any], warn: bool = True) -> bool:
         """Validate record has required fields.
         
         Args:
             record: Record to validate
+            warn: Log a warning naming the first missing field
             
         Returns:
             True if valid, False otherwise
         """
-        required_fields = ['record_id', 'user_id_hash', 'source', 'timestamp']
-        
-        for field in required_fields:
-            if field not in record or record[field] is None:
-                log.warning(f"Invalid record: missing {field}")
+        for field in _REQUIRED_FIELDS:
+            if record.get(field) is None:
+                if warn:
+                    log.warning(f"Invalid record: missing {field}")
                 return False
         
         return True
@@ -115,11 +139,18 @@ class BaseExtractor(ABC):
         
         try:
             records = self.extract(**kwargs)
-            valid_records = [r for r in records if self.validate_record(r)]
+            # One pass with a single summary warning rather than one per bad record
+            valid_records = [r for r in records if self.validate_record(r, warn=False)]
+            invalid_count = len(records) - len(valid_records)
+            if invalid_count:
+                log.warning(
+                    f"Dropped {invalid_count} records from {self.source_name} "
+                    f"missing one of {', '.join(_REQUIRED_FIELDS)}"
+                )
             
             log.info(
                 f"Extracted {len(valid_records)} valid records from {self.source_name} "
-                f"({len(records) - len(valid_records)} invalid)"
+                f"({invalid_count} invalid)"
             )
             
             return valid_records
@@ -2,6 +2,7 @@
 
 from typing import List, Dict, Any
 from datetime import datetime
+import numpy as np
 import pandas as pd
 import requests
 from pathlib import Path
@@ -124,8 +125,10 @@ class SurveyExtractor(BaseExtractor):
         try:
             df = pd.read_csv(file_path)
             records = []
+            # Hash the whole user column in one batch rather than per row
+            user_hashes = self.anonymize_user_ids(df[user_column].astype(str).tolist())
             
-            for _, row in df.iterrows():
+            for (_, row), user_hash in zip(df.iterrows(), user_hashes):
                 # Parse timestamp
                 try:
                     timestamp = pd.to_datetime(row[timestamp_column])
@@ -137,6 +140,7 @@ class SurveyExtractor(BaseExtractor):
                     user_id=str(row[user_column]),
                     text_content=str(row[text_column]),
                     timestamp=timestamp,
+                    user_id_hash=user_hash,
                     metadata={
                         'survey_type': row.get('survey_type', 'general'),
                         'additional_fields': {
@@ -231,17 +235,19 @@ class SurveyExtractor(BaseExtractor):
             "Feeling isolated working from home, missing team interactions"
         ]
         
-        data = []
-        for i in range(num_records):
-            data.append({
-                'user_id': f'user_{i % 50}',  # 50 unique users
-                'response_text': sample_texts[i % len(sample_texts)],
-                'timestamp': (datetime.utcnow() - pd.Timedelta(days=i % 30)).isoformat(),
-                'survey_type': 'employee_wellbeing',
-                'department': ['Engineering', 'Sales', 'Marketing', 'HR'][i % 4]
-            })
-        
-        df = pd.DataFrame(data)
+        # Build each column as an array in one shot
+        idx = np.arange(num_records)
+        timestamps = pd.Timestamp(datetime.utcnow()) - pd.to_timedelta(idx % 30, unit='D')
+        departments = np.array(['Engineering', 'Sales', 'Marketing', 'HR'])
+        
+        df = pd.DataFrame({
+            'user_id': np.char.add('user_', (idx % 50).astype(str)),  # 50 unique users
+            'response_text': np.array(sample_texts)[idx % len(sample_texts)],
+            'timestamp': timestamps.strftime('%Y-%m-%dT%H:%M:%S.%f'),
+            'survey_type': 'employee_wellbeing',
+            'department': departments[idx % len(departments)]
+        })
+        
         df.to_csv(output_path, index=False)
         
         log.info(f"Created sample survey data at {output_path}")
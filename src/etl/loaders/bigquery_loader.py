@@ -1,9 +1,12 @@
 """BigQuery data loader."""
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Sequence
 from datetime import datetime
+import google.auth
+from google.auth.transport.requests import AuthorizedSession
 from google.cloud import bigquery
 from google.cloud.exceptions import NotFound
+from requests.adapters import HTTPAdapter
 import pandas as pd
 from src.utils.config_loader import get_config
 from src.utils.logger import log
@@ -12,6 +15,9 @@ from src.utils.logger import log
 class BigQueryLoader:
     """Load data into BigQuery tables."""
     
+    # SQL dialect, for queries that use engine-specific functions
+    dialect = 'bigquery'
+    
     def __init__(self):
         """Initialize BigQuery loader."""
         self.config = get_config()
@@ -21,7 +27,16 @@ class BigQueryLoader:
         self.dataset_id = bq_config.get('dataset_id')
         self.tables = bq_config.get('tables', {})
         
-        self.client = bigquery.Client(project=self.project_id)
+        # Keep more keep-alive connections for many small queries; the
+        # authorized session is handed to the client through its
+        # constructor rather than patched onto it afterwards
+        credentials, _ = google.auth.default(scopes=bigquery.Client.SCOPE)
+        session = AuthorizedSession(credentials)
+        session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=20))
+        self.client = bigquery.Client(project=self.project_id, credentials=credentials, _http=session)
+        
+        # Storage Read API client, created on first bulk read
+        self._bqstorage_client = None
     
     def load(
         self,
@@ -134,23 +149,126 @@ class BigQueryLoader:
         table_name = self.tables.get('alerts', 'alert_history')
         return self.load(data, table_name)
     
-    def query(self, sql: str) -> pd.DataFrame:
+    def query(
+        self,
+        sql: str,
+        params: Optional[Sequence[Any]] = None,
+        job_config: Optional[bigquery.QueryJobConfig] = None,
+        dtype: Optional[Dict[str, Any]] = None,
+        parse_dates: Optional[List[str]] = None
+    ) -> pd.DataFrame:
         """Execute a query and return results as DataFrame.
         
         Args:
-            sql: SQL query to execute
+            sql: SQL query to execute, using ``?`` placeholders for parameters
+            params: Values bound to the placeholders
+            job_config: Optional job configuration; ``params`` replace its query parameters
+            dtype: Column dtypes to cast the results to
+            parse_dates: Columns to parse as datetimes
             
         Returns:
             Query results as DataFrame
         """
+        if params:
+            job_config = job_config or bigquery.QueryJobConfig()
+            job_config.query_parameters = [
+                self._query_parameter(value) for value in params
+            ]
+        
         try:
-            query_job = self.client.query(sql)
+            query_job = self.client.query(sql, job_config=job_config)
             df = query_job.to_dataframe()
+            if dtype:
+                df = df.astype(dtype)
+            for column in parse_dates or ():
+                df[column] = pd.to_datetime(df[column])
             return df
         except Exception as e:
             log.error(f"Error executing query: {str(e)}")
             raise
     
+    def query_row(self, sql: str, params: Optional[Sequence[Any]] = None) -> Optional[Dict[str, Any]]:
+        """Execute a query and return its first row, without building a DataFrame.
+        
+        Args:
+            sql: SQL query to execute, using ``?`` placeholders for parameters
+            params: Values bound to the placeholders
+            
+        Returns:
+            First row as a column-to-value dict, or None if there are no rows
+        """
+        job_config = None
+        if params:
+            job_config = bigquery.QueryJobConfig(query_parameters=[
+                self._query_parameter(value) for value in params
+            ])
+        
+        try:
+            rows = self.client.query(sql, job_config=job_config).result(max_results=1)
+            row = next(iter(rows), None)
+            return dict(row.items()) if row is not None else None
+        except Exception as e:
+            log.error(f"Error executing query: {str(e)}")
+            raise
+    
+    def query_arrow(self, sql: str, params: Optional[Sequence[Any]] = None) -> pd.DataFrame:
+        """Execute a query and stream its results through the Storage Read API.
+        
+        Results are downloaded as Arrow record batches instead of paged JSON,
+        which is much faster for large result sets. Falls back to the REST
+        path if ``google-cloud-bigquery-storage`` is not installed.
+        
+        Args:
+            sql: SQL query to execute, using ``?`` placeholders for parameters
+            params: Values bound to the placeholders
+            
+        Returns:
+            Query results as DataFrame
+        """
+        job_config = bigquery.QueryJobConfig(use_query_cache=True)
+        if params:
+            job_config.query_parameters = [
+                self._query_parameter(value) for value in params
+            ]
+        
+        try:
+            if self._bqstorage_client is None:
+                from google.cloud import bigquery_storage
+                self._bqstorage_client = bigquery_storage.BigQueryReadClient()
+        except ImportError:
+            log.warning("google-cloud-bigquery-storage not installed, using REST results")
+            return self.query(sql, job_config=job_config)
+        
+        try:
+            query_job = self.client.query(sql, job_config=job_config)
+            table = query_job.result().to_arrow(bqstorage_client=self._bqstorage_client)
+            return table.to_pandas()
+        except Exception as e:
+            log.error(f"Error executing query: {str(e)}")
+            raise
+    
+    @staticmethod
+    def _query_parameter(value: Any) -> bigquery.ScalarQueryParameter:
+        """Build a positional query parameter with a matching BigQuery type.
+        
+        Args:
+            value: Python value to bind
+            
+        Returns:
+            Positional scalar query parameter
+        """
+        if isinstance(value, bool):
+            param_type = 'BOOL'
+        elif isinstance(value, int):
+            param_type = 'INT64'
+        elif isinstance(value, float):
+            param_type = 'FLOAT64'
+        elif isinstance(value, datetime):
+            param_type = 'TIMESTAMP'
+        else:
+            param_type = 'STRING'
+        return bigquery.ScalarQueryParameter(None, param_type, value)
+    
     def get_unprocessed_records(self, limit: int = 1000) -> pd.DataFrame:
         """Get raw records that haven't been processed yet.
         
@@ -170,10 +288,10 @@ class BigQueryLoader:
             ON r.record_id = p.record_id
         WHERE p.record_id IS NULL
         ORDER BY r.timestamp DESC
-        LIMIT {limit}
+        LIMIT ?
         """
         
-        return self.query(sql)
+        return self.query(sql, (int(limit),))
     
     def delete_old_records(self, table_name: str, days: int) -> int:
         """Delete records older than specified days.
@@ -189,11 +307,12 @@ class BigQueryLoader:
         
         sql = f"""
         DELETE FROM `{table_ref}`
-        WHERE timestamp < TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL {days} DAY)
+        WHERE timestamp < TIMESTAMP_SUB(CURRENT_TIMESTAMP(), INTERVAL ? DAY)
         """
+        job_config = bigquery.QueryJobConfig(query_parameters=[self._query_parameter(int(days))])
         
         try:
-            query_job = self.client.query(sql)
+            query_job = self.client.query(sql, job_config=job_config)
             query_job.result()
             
             rows_affected = query_job.num_dml_affected_rows
@@ -1,12 +1,17 @@
 """Unified database loader supporting multiple warehouses."""
 
+from functools import lru_cache
 from src.utils.config_loader import get_config
 from src.utils.logger import log
 
 
+@lru_cache(maxsize=1)
 def get_loader():
     """Get the appropriate database loader based on configuration.
     
+    The loader is created once per process and shared, so connections,
+    credentials and HTTP pools are reused by every caller.
+    
     Returns:
         Database loader instance (BigQueryLoader or SQLiteLoader)
     """
@@ -1,16 +1,100 @@
 """SQLite data loader - 100% FREE local database."""
 
+import json
+import queue
 import sqlite3
+from contextlib import contextmanager
 import pandas as pd
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Optional, Sequence, Set
 from pathlib import Path
 from src.utils.config_loader import get_config
+from src.utils.date_utils import day_bounds
 from src.utils.logger import log
 
 
+# (index name, table, columns) for the range predicates used by dashboard queries
+_INDEXES = [
+    ('idx_psd_ts', 'processed_sentiment_data', 'timestamp'),
+    # Narrows prediction_date ranges. The heatmap's per-day window and its
+    # final ORDER BY each still sort (temp B-tree); the index does not order them
+    ('idx_bp_date_score', 'burnout_predictions', 'prediction_date, burnout_risk_score DESC'),
+    ('idx_ah_ts', 'alert_history', 'alert_timestamp'),
+]
+
+# Daily rollups the dashboard reads instead of re-aggregating raw rows. Each
+# entry lists its source tables, the timestamp column its days come from,
+# an optional row filter, its columns (primary key first) and the SELECT
+# that (re)computes them.
+_ROLLUPS = {
+    'daily_sentiment_rollup': {
+        'sources': ('processed_sentiment_data',),
+        'timestamp': 'timestamp',
+        'filter': 'source IS NOT NULL',
+        'key': ('date', 'source', 'sentiment_label'),
+        'values': ('avg_sentiment REAL', 'post_count INTEGER'),
+        'select': """
+            SELECT
+                substr(timestamp, 1, 10),
+                source,
+                sentiment_label,
+                AVG(sentiment_score),
+                COUNT(*)
+            FROM processed_sentiment_data
+            {where}
+            GROUP BY 1, 2, 3
+        """,
+    },
+    'daily_risk_rollup': {
+        'sources': ('burnout_predictions',),
+        'timestamp': 'prediction_date',
+        'key': ('date', 'risk_level'),
+        # Severity rank (1 = critical) so readers sort on an integer
+        'values': ('risk_level_ord INTEGER', 'prediction_count INTEGER'),
+        'select': """
+            SELECT
+                substr(prediction_date, 1, 10),
+                risk_level,
+                CASE risk_level
+                    WHEN 'critical' THEN 1
+                    WHEN 'high' THEN 2
+                    WHEN 'medium' THEN 3
+                    WHEN 'low' THEN 4
+                    ELSE 5
+                END,
+                COUNT(*)
+            FROM burnout_predictions
+            {where}
+            GROUP BY 1, 2
+        """,
+    },
+    'daily_alert_rollup': {
+        'sources': ('alert_history',),
+        'timestamp': 'alert_timestamp',
+        'key': ('date', 'severity'),
+        'values': ('alert_count INTEGER',),
+        'select': """
+            SELECT substr(alert_timestamp, 1, 10), severity, COUNT(*)
+            FROM alert_history
+            {where}
+            GROUP BY 1, 2
+        """,
+    },
+}
+
+# Applied to every connection: 64 MB page cache, 256 MB memory map, temp tables in RAM
+_PRAGMAS = [
+    "PRAGMA cache_size = -65536",
+    "PRAGMA mmap_size = 268435456",
+    "PRAGMA temp_store = MEMORY",
+]
+
+
 class SQLiteLoader:
     """Load data into SQLite database (free local option)."""
     
+    # SQL dialect, for queries that use engine-specific functions
+    dialect = 'sqlite'
+    
     def __init__(self):
         """Initialize SQLite loader."""
         self.config = get_config()
@@ -22,8 +106,52 @@ class SQLiteLoader:
         # Ensure directory exists
         Path(self.db_path).parent.mkdir(parents=True, exist_ok=True)
         
-        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self.conn = self._connect()
+        # WAL lets the pooled readers run while the ETL writes; under WAL,
+        # NORMAL sync only fsyncs at checkpoints and is still crash-safe
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA synchronous = NORMAL")
         log.info(f"Connected to SQLite database: {self.db_path}")
+        
+        # Prewarmed read connections so concurrent dashboard queries don't
+        # serialize on the writer connection (an in-memory DB can't be shared)
+        self._read_pool = None
+        pool_size = sqlite_config.get('read_pool_size', 4)
+        if pool_size and self.db_path != ':memory:':
+            self._read_pool = queue.Queue()
+            for _ in range(pool_size):
+                self._read_pool.put(self._connect(isolation_level=None))
+        self.add_processed_source()
+        self.create_indexes()
+        self.rollups = self.create_rollups()
+    
+    def _connect(self, **kwargs) -> sqlite3.Connection:
+        """Open a connection to the database with the shared PRAGMAs applied.
+        
+        Args:
+            **kwargs: Extra sqlite3.connect arguments
+            
+        Returns:
+            SQLite connection
+        """
+        # Prepared statements are cached per SQL string; parameterized queries
+        # keep that string constant so dashboard refreshes reuse compiled plans
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, cached_statements=256, **kwargs)
+        for pragma in _PRAGMAS:
+            conn.execute(pragma)
+        return conn
+    
+    @contextmanager
+    def _read_connection(self):
+        """Borrow a pooled read connection, or the main one without a pool."""
+        if self._read_pool is None:
+            yield self.conn
+            return
+        conn = self._read_pool.get()
+        try:
+            yield conn
+        finally:
+            self._read_pool.put(conn)
     
     def create_tables(self):
         """Create all required tables."""
@@ -55,7 +183,8 @@ class SQLiteLoader:
                 mental_health_indicators TEXT,
                 keywords_detected TEXT,
                 processing_timestamp TEXT NOT NULL,
-                model_version TEXT NOT NULL
+                model_version TEXT NOT NULL,
+                source TEXT
             )
         ''')
         
@@ -119,6 +248,139 @@ class SQLiteLoader:
         
         self.conn.commit()
         log.info("SQLite tables created successfully")
+        self.add_processed_source()
+        self.create_indexes()
+        self.rollups = self.create_rollups()
+    
+    def add_processed_source(self):
+        """Copy each post's source onto processed_sentiment_data.
+        
+        Dashboard queries group and filter by source; keeping it on the
+        processed row saves joining raw_sentiment_data for one column.
+        Databases created before the column existed get it added and
+        backfilled from the raw table.
+        """
+        columns = [
+            row[1] for row in self.conn.execute("PRAGMA table_info(processed_sentiment_data)")
+        ]
+        if not columns or 'source' in columns:
+            return
+        log.info("Adding source column to processed_sentiment_data")
+        self.conn.execute("ALTER TABLE processed_sentiment_data ADD COLUMN source TEXT")
+        self.conn.execute('''
+            UPDATE processed_sentiment_data
+            SET source = (
+                SELECT r.source FROM raw_sentiment_data r
+                WHERE r.record_id = processed_sentiment_data.record_id
+            )
+        ''')
+        self.conn.commit()
+    
+    def create_indexes(self):
+        """Create indices on the date columns the dashboard filters by.
+        
+        Only tables that already exist are indexed, so this is safe to run
+        on every connect. record_id joins are covered by the primary keys.
+        """
+        existing = {
+            row[0] for row in
+            self.conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+        }
+        created = False
+        for name, table, columns in _INDEXES:
+            if table in existing:
+                self.conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table}({columns})")
+                created = True
+        # Superseded by idx_bp_date_score, which has the same leading column
+        self.conn.execute("DROP INDEX IF EXISTS idx_bp_date")
+        if created:
+            # Refresh planner statistics only when they are missing or stale
+            self.conn.execute("PRAGMA optimize")
+            self.conn.commit()
+    
+    def create_rollups(self) -> Set[str]:
+        """Create the daily rollup tables whose source tables exist.
+        
+        New rollups, and rollups whose columns changed since they were
+        created, are (re)built from the source tables.
+        
+        Returns:
+            Names of the rollups that are available
+        """
+        existing = {
+            row[0] for row in
+            self.conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+        }
+        available = set()
+        for name, spec in _ROLLUPS.items():
+            if not set(spec['sources']) <= existing:
+                continue
+            columns = list(spec['key']) + [v.split()[0] for v in spec['values']]
+            if name in existing:
+                current = [row[1] for row in self.conn.execute(f"PRAGMA table_info({name})")]
+                if current == columns:
+                    available.add(name)
+                    continue
+                log.info(f"Rebuilding {name} with columns {columns}")
+                self.conn.execute(f"DROP TABLE {name}")
+            
+            key_ddl = ', '.join(f"{k} TEXT NOT NULL" for k in spec['key'])
+            value_ddl = ', '.join(f"{v} NOT NULL" for v in spec['values'])
+            self.conn.execute(
+                f"CREATE TABLE {name} ({key_ddl}, {value_ddl}, PRIMARY KEY ({', '.join(spec['key'])}))"
+            )
+            self.refresh_rollup(name)
+            available.add(name)
+        self.conn.commit()
+        return available
+    
+    def refresh_rollup(
+        self,
+        name: str,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None
+    ):
+        """Recompute a rollup's rows for whole days between start_date and end_date.
+        
+        The days' old rows are deleted first, in the same transaction, so
+        groups whose source rows were deleted or moved do not linger.
+        
+        Args:
+            name: Rollup table name
+            start_date: First day to recompute (YYYY-MM-DD); all days if omitted
+            end_date: Last day to recompute (YYYY-MM-DD)
+        """
+        spec = _ROLLUPS[name]
+        date_column = spec['key'][0]
+        conditions, params = [], []
+        if spec.get('filter'):
+            conditions.append(spec['filter'])
+        if start_date and end_date:
+            conditions.append(f"{spec['timestamp']} >= ? AND {spec['timestamp']} < ?")
+            params = list(day_bounds(start_date, end_date))
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        stale = f"WHERE {date_column} >= ? AND {date_column} < ?" if params else ""
+        
+        with self.conn:
+            self.conn.execute(f"DELETE FROM {name} {stale}", params)
+            self.conn.execute(
+                f"INSERT INTO {name} " + spec['select'].format(where=where),
+                params
+            )
+    
+    def _refresh_loaded_days(self, name: str, data: List[Dict[str, Any]], column: str):
+        """Refresh a rollup for the span of days covered by freshly loaded records.
+        
+        Args:
+            name: Rollup table name
+            data: Records that were just loaded
+            column: Record field holding the date or timestamp
+        """
+        if name not in self.rollups:
+            return
+        days = sorted(str(r[column])[:10] for r in data if r.get(column))
+        if days:
+            self.refresh_rollup(name, days[0], days[-1])
     
     def load(self, data: List[Dict[str, Any]], table_name: str) -> int:
         """Load data into SQLite table.
@@ -140,7 +402,9 @@ class SQLiteLoader:
             # Convert complex types to JSON strings
             for col in df.columns:
                 if df[col].dtype == 'object':
-                    df[col] = df[col].apply(lambda x: str(x) if isinstance(x, (dict, list)) else x)
+                    df[col] = df[col].apply(
+                        lambda x: json.dumps(x, default=str) if isinstance(x, (dict, list)) else x
+                    )
             
             df.to_sql(table_name, self.conn, if_exists='append', index=False)
             
@@ -151,29 +415,87 @@ class SQLiteLoader:
             log.error(f"Error loading data into {table_name}: {str(e)}")
             raise
     
-    def query(self, sql: str) -> pd.DataFrame:
+    def query(
+        self,
+        sql: str,
+        params: Optional[Sequence[Any]] = None,
+        dtype: Optional[Dict[str, Any]] = None,
+        parse_dates: Optional[List[str]] = None
+    ) -> pd.DataFrame:
         """Execute a query and return results as DataFrame.
         
         Args:
-            sql: SQL query to execute
+            sql: SQL query to execute, using ``?`` placeholders for parameters
+            params: Values bound to the placeholders
+            dtype: Column dtypes, instead of inferring them from the values
+            parse_dates: Columns to parse as datetimes
             
         Returns:
             Query results as DataFrame
         """
         try:
-            df = pd.read_sql_query(sql, self.conn)
-            return df
+            with self._read_connection() as conn:
+                return pd.read_sql_query(
+                    sql, conn, params=params, dtype=dtype, parse_dates=parse_dates
+                )
+        except Exception as e:
+            log.error(f"Error executing query: {str(e)}")
+            raise
+    
+    def query_row(self, sql: str, params: Optional[Sequence[Any]] = None) -> Optional[Dict[str, Any]]:
+        """Execute a query and return its first row, without building a DataFrame.
+        
+        Args:
+            sql: SQL query to execute, using ``?`` placeholders for parameters
+            params: Values bound to the placeholders
+            
+        Returns:
+            First row as a column-to-value dict, or None if there are no rows
+        """
+        try:
+            with self._read_connection() as conn:
+                cursor = conn.execute(sql, params or ())
+                row = cursor.fetchone()
+                if row is None:
+                    return None
+                return {col[0]: value for col, value in zip(cursor.description, row)}
         except Exception as e:
             log.error(f"Error executing query: {str(e)}")
             raise
     
+    def query_chunks(
+        self,
+        sql: str,
+        params: Optional[Sequence[Any]] = None,
+        chunksize: int = 10000,
+        dtype: Optional[Dict[str, Any]] = None
+    ) -> Iterator[pd.DataFrame]:
+        """Execute a query and yield results in DataFrames of chunksize rows.
+        
+        Args:
+            sql: SQL query to execute, using ``?`` placeholders for parameters
+            params: Values bound to the placeholders
+            chunksize: Rows fetched per DataFrame
+            dtype: Column dtypes, instead of inferring them for every chunk
+            
+        Yields:
+            Result DataFrames of up to chunksize rows
+        """
+        with self._read_connection() as conn:
+            yield from pd.read_sql_query(
+                sql, conn, params=params, chunksize=chunksize, dtype=dtype
+            )
+    
     def load_raw_sentiment_data(self, data: List[Dict[str, Any]]) -> int:
         """Load raw sentiment data."""
         return self.load(data, 'raw_sentiment_data')
     
     def load_processed_sentiment_data(self, data: List[Dict[str, Any]]) -> int:
-        """Load processed sentiment data."""
-        return self.load(data, 'processed_sentiment_data')
+        """Load processed sentiment data and refresh the days it touches in the rollup."""
+        loaded = self.load(data, 'processed_sentiment_data')
+        if loaded:
+            self._refresh_loaded_days('daily_sentiment_rollup', data, 'timestamp')
+        return loaded
     
     def load_user_features(self, data: List[Dict[str, Any]]) -> int:
         """Load user features."""
@@ -190,26 +512,35 @@ class SQLiteLoader:
         return self.load(data, 'user_features')
     
     def load_burnout_predictions(self, data: List[Dict[str, Any]]) -> int:
-        """Load burnout predictions."""
-        return self.load(data, 'burnout_predictions')
+        """Load burnout predictions and refresh the days they touch in the rollup."""
+        loaded = self.load(data, 'burnout_predictions')
+        if loaded:
+            self._refresh_loaded_days('daily_risk_rollup', data, 'prediction_date')
+        return loaded
     
     def load_alert_history(self, data: List[Dict[str, Any]]) -> int:
-        """Load alert history."""
-        return self.load(data, 'alert_history')
+        """Load alert history and refresh the days it touches in the rollup."""
+        loaded = self.load(data, 'alert_history')
+        if loaded:
+            self._refresh_loaded_days('daily_alert_rollup', data, 'alert_timestamp')
+        return loaded
     
     def get_unprocessed_records(self, limit: int = 1000) -> pd.DataFrame:
         """Get raw records that haven't been processed yet."""
-        sql = f"""
+        sql = """
         SELECT r.*
         FROM raw_sentiment_data r
         LEFT JOIN processed_sentiment_data p ON r.record_id = p.record_id
         WHERE p.record_id IS NULL
         ORDER BY r.timestamp DESC
-        LIMIT {limit}
+        LIMIT ?
         """
-        return self.query(sql)
+        return self.query(sql, (int(limit),))
     
     def close(self):
-        """Close database connection."""
+        """Close database connections."""
         self.conn.close()
+        if self._read_pool is not None:
+            while not self._read_pool.empty():
+                self._read_pool.get_nowait().close()
         log.info("SQLite connection closed")
@@ -1,10 +1,35 @@
 """Process sentiment analysis on raw data."""
 
-from typing import List, Dict, Any
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import List, Dict, Any, Optional
 from src.etl.loaders.database_loader import get_loader
 from src.models.sentiment.sentiment_analyzer import SentimentAnalyzer
 from src.utils.logger import log
 
+# Per-process analyzer for ProcessPoolExecutor workers, loaded on first use
+_worker_analyzer: Optional[SentimentAnalyzer] = None
+
+
+def _analyze_in_worker(records: List[Dict[str, Any]], threads: int = 1) -> List[Dict[str, Any]]:
+    """Run sentiment analysis on a batch inside a worker process.
+    
+    Args:
+        records: Raw records with 'text_content' field
+        threads: Torch intra-op threads for this worker
+        
+    Returns:
+        Processed sentiment records
+    """
+    global _worker_analyzer
+    if _worker_analyzer is None:
+        import torch
+        
+        # Split the cores between workers instead of oversubscribing them
+        torch.set_num_threads(threads)
+        _worker_analyzer = SentimentAnalyzer()
+    return _worker_analyzer.process_records(records)
+
 
 class SentimentProcessor:
     """Process sentiment analysis on raw data."""
@@ -12,7 +37,14 @@ class SentimentProcessor:
     def __init__(self):
         """Initialize sentiment processor."""
         self.loader = get_loader()
-        self.analyzer = SentimentAnalyzer()
+        self._analyzer: Optional[SentimentAnalyzer] = None
+    
+    @property
+    def analyzer(self) -> SentimentAnalyzer:
+        """Sentiment model, loaded on first use in this process."""
+        if self._analyzer is None:
+            self._analyzer = SentimentAnalyzer()
+        return self._analyzer
     
     def process_unprocessed_records(self, batch_size: int = 1000) -> int:
         """Process all unprocessed records.
@@ -38,7 +70,7 @@ class SentimentProcessor:
         records = unprocessed.to_dict('records')
         
         # Process sentiment
-        processed = self.analyzer.process_records(records)
+        processed = self.process_batch(records)
         
         # Load to BigQuery
         loaded = self.loader.load_processed_sentiment_data(processed)
@@ -46,26 +78,77 @@ class SentimentProcessor:
         log.info(f"Processed and loaded {loaded} records")
         return loaded
     
-    def process_all(self, max_batches: int = 10) -> int:
+    def process_batch(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Run sentiment analysis on one batch of raw records.
+        
+        Args:
+            records: Raw records with 'text_content' field
+            
+        Returns:
+            Processed sentiment records, ready to load
+        """
+        return self.analyzer.process_records(records)
+    
+    def process_all(
+        self,
+        max_batches: int = 10,
+        batch_size: int = 1000,
+        workers: int = 1
+    ) -> int:
         """Process all unprocessed records in batches.
         
+        Records are fetched once up front; loading a batch into the warehouse
+        overlaps with model inference on the next one.
+        
         Args:
             max_batches: Maximum number of batches to process
+            batch_size: Number of records per batch
+            workers: Worker processes for inference; use more than one only
+                on CPU, where a single process is bound by the GIL
             
         Returns:
             Total number of records processed
         """
+        log.info("Fetching unprocessed records...")
+        unprocessed = self.loader.get_unprocessed_records(limit=batch_size * max_batches)
+        
+        if unprocessed.empty:
+            log.info("No unprocessed records found")
+            return 0
+        
+        records = unprocessed.to_dict('records')
+        batches = [records[i:i + batch_size] for i in range(0, len(records), batch_size)]
+        
         total_processed = 0
+        workers = max(1, min(workers, len(batches)))
         
-        for batch_num in range(max_batches):
-            processed = self.process_unprocessed_records()
-            
-            if processed == 0:
-                break
-            
-            total_processed += processed
-            log.info(f"Batch {batch_num + 1}: Processed {processed} records (Total: {total_processed})")
+        infer_pool = None
+        if workers > 1:
+            log.info(f"Running sentiment inference in {workers} worker processes")
+            threads = max(1, (os.cpu_count() or 1) // workers)
+            infer_pool = ProcessPoolExecutor(max_workers=workers)
+            results = infer_pool.map(_analyze_in_worker, batches, [threads] * len(batches))
+        else:
+            results = map(self.process_batch, batches)
+        
+        # Single loader thread: at most one batch waits to be written (backpressure)
+        try:
+            with ThreadPoolExecutor(max_workers=1) as load_pool:
+                pending_load = None
+                
+                for batch_num, processed in enumerate(results):
+                    log.info(f"Processed batch {batch_num + 1}/{len(batches)} ({len(processed)} records)")
+                    
+                    if pending_load is not None:
+                        total_processed += pending_load.result()
+                    pending_load = load_pool.submit(self.loader.load_processed_sentiment_data, processed)
+                
+                total_processed += pending_load.result()
+        finally:
+            if infer_pool is not None:
+                infer_pool.shutdown()
         
+        log.info(f"Processed and loaded {total_processed} records in {len(batches)} batches")
         return total_processed
 
 
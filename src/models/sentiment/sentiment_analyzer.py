@@ -39,6 +39,7 @@ class SentimentAnalyzer:
                 "sentiment-analysis",
                 model=self.model_name,
                 device=device,
+                batch_size=self.batch_size,
                 truncation=True,
                 max_length=self.max_length
             )
@@ -106,9 +107,10 @@ class SentimentAnalyzer:
             batch = texts[i:i + self.batch_size]
             
             try:
-                # Get sentiment predictions
+                # Get sentiment predictions (one padded forward pass per batch)
                 predictions = self.sentiment_pipeline(
-                    [text[:self.max_length] for text in batch]
+                    [text[:self.max_length] for text in batch],
+                    batch_size=len(batch)
                 )
                 
                 # Process each result
@@ -255,6 +257,7 @@ class SentimentAnalyzer:
                 'record_id': record.get('record_id'),
                 'user_id_hash': record.get('user_id_hash'),
                 'timestamp': record.get('timestamp'),
+                'source': record.get('source'),
                 **sentiment
             }
             processed.append(processed_record)
@@ -0,0 +1,27 @@
+"""Date range helpers shared by the loaders and the dashboard."""
+
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import Tuple
+
+
+@lru_cache(maxsize=256)
+def day_bounds(start_date: str, end_date: str) -> Tuple[str, str]:
+    """Half-open bounds covering whole days from start_date to end_date.
+    
+    Use as ``col >= ? AND col < ?`` on the raw column. The upper bound is the
+    day after end_date, so stored dates and timestamps in any ISO form
+    (space or ``T`` separator, fractional seconds) on end_date are included,
+    and an index on the column can serve the range. Accepts plain dates or
+    ISO datetimes (e.g. from a date picker); only the date part is used.
+    
+    Args:
+        start_date: Start date (YYYY-MM-DD)
+        end_date: End date (YYYY-MM-DD), inclusive
+        
+    Returns:
+        Tuple of (start date, day after end date) query parameters
+    """
+    start = date.fromisoformat(str(start_date)[:10])
+    end = date.fromisoformat(str(end_date)[:10]) + timedelta(days=1)
+    return start.isoformat(), end.isoformat()
@@ -0,0 +1,104 @@
+"""Unit tests for alert rule parsing and evaluation."""
+
+import operator
+
+import pytest
+from src.alerts.alert_manager import AlertManager
+from src.etl.loaders.sqlite_loader import SQLiteLoader
+from src.utils.config_loader import get_config
+
+
+@pytest.fixture
+def loader(tmp_path, monkeypatch):
+    """Create a loader on a fresh database file."""
+    sqlite_config = dict(get_config().config.get('sqlite', {}))
+    sqlite_config['database_path'] = str(tmp_path / 'test.db')
+    monkeypatch.setitem(get_config().config, 'sqlite', sqlite_config)
+    
+    loader = SQLiteLoader()
+    loader.create_tables()
+    yield loader
+    loader.close()
+
+
+def make_manager(loader, monkeypatch, rules):
+    """Create an alert manager with the given rules and only console alerts."""
+    monkeypatch.setitem(get_config().config, 'alerts', {
+        'enabled': True,
+        'channels': {'console': {'enabled': True}},
+        'rules': rules
+    })
+    return AlertManager(loader=loader)
+
+
+def prediction_record(index, score):
+    """Build a burnout prediction row for today's run."""
+    return {
+        'prediction_id': f'pred-{index}',
+        'user_id_hash': f'user-{index}',
+        'prediction_date': '2024-01-01',
+        'prediction_timestamp': '2024-01-01T08:00:00',
+        'burnout_risk_score': score,
+        'risk_level': 'high' if score >= 0.8 else 'low',
+        'prediction_horizon_days': 7,
+        'model_version': 'test',
+        'model_type': 'test'
+    }
+
+
+@pytest.mark.parametrize('condition, op, threshold', [
+    ('burnout_risk >= 0.9', operator.ge, 0.9),
+    ('burnout_risk>0.75', operator.gt, 0.75),
+    ('  burnout_risk <= 0.2  ', operator.le, 0.2),
+    ('burnout_risk < 1', operator.lt, 1.0),
+    ('burnout_risk == -0.5', operator.eq, -0.5),
+])
+def test_compile_rules_parses_condition(loader, monkeypatch, condition, op, threshold):
+    """Test each supported operator compiles to its column, function and threshold."""
+    manager = make_manager(loader, monkeypatch, [{'name': 'rule', 'condition': condition}])
+    
+    assert manager._compiled_rules == {'rule': ('burnout_risk_score', op, threshold)}
+
+
+@pytest.mark.parametrize('condition', [
+    '',
+    'burnout_risk',
+    'burnout_risk => 0.9',
+    'burnout_risk >= high',
+    'burnout_risk >= 0.9 and avg_sentiment < 0.3',
+])
+def test_compile_rules_skips_unsupported_condition(loader, monkeypatch, condition):
+    """Test a condition outside the grammar leaves the rule out."""
+    manager = make_manager(loader, monkeypatch, [{'name': 'bad', 'condition': condition}])
+    
+    assert manager._compiled_rules == {}
+
+
+def test_compile_rules_skips_unknown_field(loader, monkeypatch):
+    """Test a field that is not a prediction column leaves the rule out."""
+    manager = make_manager(loader, monkeypatch, [
+        {'name': 'sentiment', 'condition': 'avg_sentiment < 0.3'},
+        {'name': 'risk', 'condition': 'burnout_risk > 0.5'}
+    ])
+    
+    assert list(manager._compiled_rules) == ['risk']
+
+
+def test_check_and_send_alerts_fires_matching_predictions(loader, monkeypatch):
+    """Test compiled rules fire once per matching user and skip bad rules."""
+    loader.load_burnout_predictions([
+        prediction_record(0, 0.95),
+        prediction_record(1, 0.85),
+        prediction_record(2, 0.4)
+    ])
+    manager = make_manager(loader, monkeypatch, [
+        {'name': 'Critical', 'condition': 'burnout_risk >= 0.9', 'severity': 'critical'},
+        {'name': 'Broken', 'condition': 'burnout_risk is high'}
+    ])
+    
+    assert manager.check_and_send_alerts() == 1
+    
+    alerts = loader.query("SELECT user_id_hash, alert_type, severity FROM alert_history")
+    assert alerts.to_dict('records') == [
+        {'user_id_hash': 'user-0', 'alert_type': 'Critical', 'severity': 'critical'}
+    ]
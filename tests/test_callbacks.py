@@ -0,0 +1,129 @@
+"""Unit tests for dashboard callback helpers."""
+
+import pandas as pd
+import pytest
+from dash import Patch, no_update
+from src.dashboard.callbacks import _append_only_update, _trend_for_sources
+
+
+def make_figure(ys):
+    """Build a one-trace time-series figure with one point per day."""
+    xs = [f"2024-01-{day:02d}" for day in range(1, len(ys) + 1)]
+    return {'data': [{'name': 'Average Sentiment', 'x': xs, 'y': list(ys)}], 'layout': {}}
+
+
+def operations(patch):
+    """List a Patch's operations as (operation, location) pairs."""
+    return [
+        (op['operation'], op['location'])
+        for op in patch.to_plotly_json()['operations']
+    ]
+
+
+def test_first_render_sends_full_figure():
+    """Test the first render returns the figure itself."""
+    figure = make_figure([0.5, 0.6, 0.7])
+    update, state = _append_only_update(figure, ['2024-01-01'], None)
+    
+    assert update is figure
+    assert state['traces'][0][1] == 3
+
+
+def test_unchanged_input_returns_no_update():
+    """Test a refresh with identical data sends nothing."""
+    _, state = _append_only_update(make_figure([0.5, 0.6, 0.7]), ['2024-01-01'], None)
+    update, _ = _append_only_update(make_figure([0.5, 0.6, 0.7]), ['2024-01-01'], state)
+    
+    assert update is no_update
+
+
+def test_appended_points_extend_patch():
+    """Test new days are sent as extends of x and y."""
+    _, state = _append_only_update(make_figure([0.5, 0.6, 0.7]), ['2024-01-01'], None)
+    update, new_state = _append_only_update(make_figure([0.5, 0.6, 0.7, 0.8]), ['2024-01-01'], state)
+    
+    assert isinstance(update, Patch)
+    assert operations(update) == [
+        ('Extend', ['data', 0, 'x']),
+        ('Extend', ['data', 0, 'y'])
+    ]
+    assert new_state['traces'][0][1] == 4
+
+
+def test_moved_open_point_is_reassigned():
+    """Test a change to the still-open last day patches only that value."""
+    _, state = _append_only_update(make_figure([0.5, 0.6, 0.7]), ['2024-01-01'], None)
+    update, _ = _append_only_update(make_figure([0.5, 0.6, 0.75]), ['2024-01-01'], state)
+    
+    assert isinstance(update, Patch)
+    assert operations(update) == [('Assign', ['data', 0, 'y', 2])]
+
+
+def test_changed_prefix_redraws_full_figure():
+    """Test a change to an earlier point sends the whole figure."""
+    _, state = _append_only_update(make_figure([0.5, 0.6, 0.7, 0.8]), ['2024-01-01'], None)
+    figure = make_figure([0.4, 0.6, 0.7, 0.8, 0.9])
+    update, _ = _append_only_update(figure, ['2024-01-01'], state)
+    
+    assert update is figure
+
+
+def test_changed_filters_redraw_full_figure():
+    """Test a different start date or source selection sends the whole figure."""
+    _, state = _append_only_update(make_figure([0.5, 0.6]), ['2024-01-01'], None)
+    figure = make_figure([0.5, 0.6])
+    update, _ = _append_only_update(figure, ['2023-12-01'], state)
+    
+    assert update is figure
+
+
+@pytest.fixture
+def source_trend():
+    """Per-source daily sentiment over three days; twitter has no third day."""
+    return pd.DataFrame({
+        'date': ['2024-01-02', '2024-01-01', '2024-01-01', '2024-01-02', '2024-01-03'],
+        'source': ['reddit', 'reddit', 'twitter', 'twitter', 'reddit'],
+        'avg_sentiment': [0.6, 0.8, 0.2, 0.4, 0.5],
+        'post_count': [2, 3, 1, 2, 4]
+    })
+
+
+def test_trend_for_sources_weights_all_sources(source_trend):
+    """Test an empty selection combines every source, weighted by post count."""
+    trend = _trend_for_sources(source_trend, [])
+    
+    assert list(trend['date']) == ['2024-01-01', '2024-01-02', '2024-01-03']
+    assert list(trend['post_count']) == [4, 4, 4]
+    assert trend['avg_sentiment'].tolist() == pytest.approx([0.65, 0.5, 0.5])
+
+
+def test_trend_for_sources_filters_sources(source_trend):
+    """Test deselected sources are dropped and days left without posts removed."""
+    trend = _trend_for_sources(source_trend, ['twitter'])
+    
+    assert list(trend['date']) == ['2024-01-01', '2024-01-02']
+    assert list(trend['post_count']) == [1, 2]
+    assert trend['avg_sentiment'].tolist() == pytest.approx([0.2, 0.4])
+
+
+def test_trend_for_sources_matches_groupby(source_trend):
+    """Test the bincount result equals a filtered pandas groupby."""
+    selected = source_trend[source_trend['source'].isin(['reddit'])]
+    grouped = selected.assign(
+        weighted=selected['avg_sentiment'] * selected['post_count']
+    ).groupby('date')[['weighted', 'post_count']].sum()
+    
+    trend = _trend_for_sources(source_trend, ['reddit'])
+    
+    assert list(trend['date']) == list(grouped.index)
+    assert list(trend['post_count']) == list(grouped['post_count'])
+    assert trend['avg_sentiment'].tolist() == pytest.approx(
+        (grouped['weighted'] / grouped['post_count']).tolist()
+    )
+
+
+def test_trend_for_sources_passes_through_unsplit_frames():
+    """Test frames without a source column are returned unchanged."""
+    df = pd.DataFrame({'date': ['2024-01-01'], 'avg_sentiment': [0.5], 'post_count': [1]})
+    
+    assert _trend_for_sources(df, ['reddit']) is df
@@ -0,0 +1,61 @@
+"""Unit tests for date range helpers."""
+
+import sqlite3
+
+import pytest
+from src.utils.date_utils import day_bounds
+
+
+def test_upper_bound_is_day_after_end():
+    """Test the bounds run from the start day to the day after the end day."""
+    assert day_bounds('2024-01-01', '2024-01-31') == ('2024-01-01', '2024-02-01')
+
+
+@pytest.mark.parametrize('end_date, expected', [
+    ('2024-02-28', '2024-02-29'),
+    ('2024-02-29', '2024-03-01'),
+    ('2023-12-31', '2024-01-01'),
+])
+def test_upper_bound_rolls_over_month_and_year(end_date, expected):
+    """Test the day after the end date crosses month, leap day and year ends."""
+    assert day_bounds('2023-12-01', end_date)[1] == expected
+
+
+def test_datetimes_use_date_part():
+    """Test ISO datetimes from a date picker are cut to their date."""
+    assert day_bounds('2024-01-01T00:00:00', '2024-01-31 15:30:00.123') == ('2024-01-01', '2024-02-01')
+
+
+def test_single_day_range():
+    """Test a range of one day covers exactly that day."""
+    assert day_bounds('2024-03-10', '2024-03-10') == ('2024-03-10', '2024-03-11')
+
+
+def test_bounds_are_half_open_over_stored_timestamps():
+    """Test every stored form on the end day is in range and the next midnight is not."""
+    conn = sqlite3.connect(':memory:')
+    conn.execute("CREATE TABLE t (ts TEXT)")
+    conn.executemany("INSERT INTO t VALUES (?)", [
+        ('2023-12-31T23:59:59',),
+        ('2024-01-01',),
+        ('2024-01-01T00:00:00',),
+        ('2024-01-31',),
+        ('2024-01-31 23:59:59',),
+        ('2024-01-31T23:59:59.999999',),
+        ('2024-02-01',),
+        ('2024-02-01T00:00:00',),
+    ])
+    
+    rows = conn.execute(
+        "SELECT ts FROM t WHERE ts >= ? AND ts < ? ORDER BY ts",
+        day_bounds('2024-01-01', '2024-01-31')
+    ).fetchall()
+    conn.close()
+    
+    assert [ts for ts, in rows] == [
+        '2024-01-01',
+        '2024-01-01T00:00:00',
+        '2024-01-31',
+        '2024-01-31 23:59:59',
+        '2024-01-31T23:59:59.999999'
+    ]
@@ -0,0 +1,43 @@
+"""Unit tests for extractor user ID anonymization."""
+
+import pandas as pd
+import pytest
+from src.etl.extractors.survey_extractor import SurveyExtractor
+
+
+@pytest.fixture
+def extractor():
+    """Create survey extractor instance."""
+    return SurveyExtractor()
+
+
+@pytest.mark.parametrize('salt', ['', 'pepper', 'sél'])
+def test_batch_hashes_match_single_hashes(extractor, salt):
+    """Test batch anonymization equals hashing each ID on its own."""
+    user_ids = ['emp-001', 'emp-002', '', 'ünïcode', 42, 'emp-001']
+    
+    batch = extractor.anonymize_user_ids(user_ids, salt=salt)
+    
+    assert batch == [extractor.anonymize_user_id(user_id, salt=salt) for user_id in user_ids]
+    assert batch[0] == batch[-1]
+
+
+def test_batch_of_no_ids_is_empty(extractor):
+    """Test an empty batch hashes to an empty list."""
+    assert extractor.anonymize_user_ids([]) == []
+
+
+def test_csv_records_use_per_record_hashes(extractor, tmp_path):
+    """Test CSV extraction stores the same hash a single record would get."""
+    csv_path = tmp_path / 'survey.csv'
+    pd.DataFrame({
+        'user_id': ['emp-001', 'emp-002', 'emp-001'],
+        'response_text': ['Feeling fine', 'Too many deadlines', 'Better this week'],
+        'timestamp': ['2024-01-01T09:00:00', '2024-01-01T10:00:00', '2024-01-02T09:00:00']
+    }).to_csv(csv_path, index=False)
+    
+    records = extractor._extract_from_csv(file_path=str(csv_path))
+    
+    assert [r['user_id_hash'] for r in records] == [
+        extractor.anonymize_user_id(user_id) for user_id in ['emp-001', 'emp-002', 'emp-001']
+    ]
@@ -0,0 +1,124 @@
+"""Unit tests for the SQLite loader's daily rollups."""
+
+import pytest
+from src.etl.loaders.sqlite_loader import SQLiteLoader
+from src.utils.config_loader import get_config
+
+
+@pytest.fixture
+def loader(tmp_path, monkeypatch):
+    """Create a loader on a fresh database file."""
+    sqlite_config = dict(get_config().config.get('sqlite', {}))
+    sqlite_config['database_path'] = str(tmp_path / 'test.db')
+    monkeypatch.setitem(get_config().config, 'sqlite', sqlite_config)
+    
+    loader = SQLiteLoader()
+    loader.create_tables()
+    yield loader
+    loader.close()
+
+
+def sentiment_record(index, timestamp, source='reddit', label='positive', score=0.8):
+    """Build a processed sentiment row."""
+    return {
+        'record_id': f'rec-{index}',
+        'user_id_hash': f'user-{index % 3}',
+        'timestamp': timestamp,
+        'sentiment_score': score,
+        'sentiment_label': label,
+        'confidence': 0.9,
+        'processing_timestamp': timestamp,
+        'model_version': 'test',
+        'source': source
+    }
+
+
+def prediction_record(index, prediction_date, risk_level):
+    """Build a burnout prediction row."""
+    return {
+        'prediction_id': f'pred-{index}',
+        'user_id_hash': f'user-{index}',
+        'prediction_date': prediction_date,
+        'prediction_timestamp': f'{prediction_date}T08:00:00',
+        'burnout_risk_score': 0.5,
+        'risk_level': risk_level,
+        'prediction_horizon_days': 7,
+        'model_version': 'test',
+        'model_type': 'test'
+    }
+
+
+def rows(loader, sql):
+    """Fetch a query's rows as a sorted list of tuples."""
+    return sorted(tuple(row) for row in loader.conn.execute(sql).fetchall())
+
+
+def test_create_rollups_lists_rollups_with_source_tables(loader):
+    """Test every rollup whose source table exists is available."""
+    assert loader.rollups == {'daily_sentiment_rollup', 'daily_risk_rollup', 'daily_alert_rollup'}
+
+
+def test_sentiment_rollup_matches_group_by(loader):
+    """Test the sentiment rollup equals grouping the processed rows by day."""
+    loader.load_processed_sentiment_data([
+        sentiment_record(0, '2024-01-01T09:00:00', score=0.9),
+        sentiment_record(1, '2024-01-01T23:59:59', score=0.7),
+        sentiment_record(2, '2024-01-01T12:00:00', source='twitter', label='negative', score=0.2),
+        sentiment_record(3, '2024-01-02T00:00:00', score=0.6),
+        sentiment_record(4, '2024-01-03T10:00:00', source=None)
+    ])
+    
+    expected = rows(loader, """
+        SELECT substr(timestamp, 1, 10), source, sentiment_label,
+               ROUND(AVG(sentiment_score), 6), COUNT(*)
+        FROM processed_sentiment_data
+        WHERE source IS NOT NULL
+        GROUP BY 1, 2, 3
+    """)
+    actual = rows(loader, """
+        SELECT date, source, sentiment_label, ROUND(avg_sentiment, 6), post_count
+        FROM daily_sentiment_rollup
+    """)
+    
+    assert actual == expected
+    assert len(actual) == 3
+
+
+def test_risk_rollup_matches_group_by(loader):
+    """Test the risk rollup equals grouping predictions by day and level."""
+    loader.load_burnout_predictions([
+        prediction_record(0, '2024-01-01', 'high'),
+        prediction_record(1, '2024-01-01', 'high'),
+        prediction_record(2, '2024-01-01', 'low'),
+        prediction_record(3, '2024-01-02', 'critical')
+    ])
+    
+    expected = rows(loader, """
+        SELECT prediction_date, risk_level, COUNT(*)
+        FROM burnout_predictions
+        GROUP BY 1, 2
+    """)
+    actual = rows(loader, "SELECT date, risk_level, prediction_count FROM daily_risk_rollup")
+    
+    assert actual == expected
+    assert rows(loader, "SELECT risk_level, risk_level_ord FROM daily_risk_rollup WHERE date = '2024-01-02'") == [
+        ('critical', 1)
+    ]
+
+
+def test_refresh_drops_groups_with_no_source_rows(loader):
+    """Test refreshing a day removes rollup groups whose rows were deleted."""
+    loader.load_processed_sentiment_data([
+        sentiment_record(0, '2024-01-01T09:00:00'),
+        sentiment_record(1, '2024-01-01T10:00:00', source='twitter'),
+        sentiment_record(2, '2024-01-02T10:00:00', source='twitter')
+    ])
+    loader.conn.execute("DELETE FROM processed_sentiment_data WHERE source = 'twitter'")
+    loader.conn.commit()
+    
+    loader.refresh_rollup('daily_sentiment_rollup', '2024-01-01', '2024-01-01')
+    
+    assert rows(loader, "SELECT date, source FROM daily_sentiment_rollup") == [
+        ('2024-01-01', 'reddit'),
+        ('2024-01-02', 'twitter')
+    ]